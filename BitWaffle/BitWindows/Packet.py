@@ -1,19 +1,117 @@
+import mmap
+from typing import Optional
+
+from BitWaffle.CRC import Algorithm, compute, patch
+
+
 class Packet:
-    """Bytes that windows provide a view of"""
+    """Bytes that windows provide a view of
+
+    The bytes are held in a bytearray, or in an mmap of a file for packets
+    too large to load, and every write goes into them in place. Writes that
+    change the size of the packet fail while views of it are alive, and are
+    not possible at all for packets backed by a file.
+    """
+
+    def __init__(
+        self,
+        data: bytes | bytearray | mmap.mmap = bytes(),
+        algorithm: Optional[Algorithm] = None,
+    ):
+        """
+        Creates a Packet.
+        :param data: The packet bytes. A bytearray or mmap is used as is, so
+                     writes to the packet show up in it, anything else is copied.
+        :param algorithm: The CRC algorithm to keep a live checksum with, if any.
+        """
+        if not isinstance(data, (bytearray, mmap.mmap)):
+            data = bytearray(data)
+
+        self.__data: bytearray | mmap.mmap = data
+        self.__algorithm: Optional[Algorithm] = algorithm
+        self.__crc: Optional[int] = compute(data, algorithm) if algorithm else None
+
+    @classmethod
+    def open(
+        cls, path, algorithm: Optional[Algorithm] = None, writable: bool = True
+    ) -> "Packet":
+        """
+        Maps a file into a Packet, writes to the packet go straight to the file.
+        :param path: The path of the file, which cannot be empty.
+        :param algorithm: The CRC algorithm to keep a live checksum with, if any.
+        :param writable: False to map the file read only.
+        :return: The packet, to be closed once done with.
+        """
+        with open(path, "r+b" if writable else "rb") as file:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            return cls(mmap.mmap(file.fileno(), 0, access=access), algorithm)
+
+    @property
+    def crc(self) -> Optional[int]:
+        """Retrieves the live checksum of the packet, None without an algorithm."""
+        return self.__crc
+
+    def view(self, key: slice = slice(None)) -> memoryview:
+        """
+        Retrieves a view of the packet bytes, which follows writes to them.
+        :param key: The slice of the packet to view. Default is all of it.
+        :return: The view, to be released before writes that change the packet size.
+        """
+        return memoryview(self.__data)[key]
 
-    def __init__(self, data: bytes = bytes()):
-        self.__data: bytes = data
+    def flush(self) -> None:
+        """Writes changes to a packet backed by a file out to the file."""
+        if isinstance(self.__data, mmap.mmap):
+            self.__data.flush()
+
+    def close(self) -> None:
+        """Unmaps a packet backed by a file, after flushing it."""
+        if isinstance(self.__data, mmap.mmap) and not self.__data.closed:
+            self.__data.flush()
+            self.__data.close()
+
+    def __enter__(self) -> "Packet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self):
+        return len(self.__data)
 
     def __getitem__(self, item):
         return self.__data.__getitem__(item)
 
     def __setitem__(self, key, value):
         if not isinstance(key, slice):
+            key = range(len(self.__data))[key]  # Negative or out of range indexes.
             key = slice(key, key + 1)
 
-        self.__data: bytes = (
-            self.__data[: key.start] + value + self.__data[key.stop + 1 :]
-        )
+        if isinstance(value, int):
+            value = bytes((value,))
+
+        start, stop, step = key.indices(len(self.__data))
+        assert step == 1, "Extended slices are not supported"
+        stop = max(start, stop)
+
+        if len(value) != stop - start and isinstance(self.__data, mmap.mmap):
+            raise ValueError("Packets backed by a file cannot change size")
+
+        # The old bytes are only needed to patch the checksum.
+        old = self.__data[start:stop] if self.__algorithm else None
+        self.__data[start:stop] = value
+
+        if self.__algorithm is None:
+            return
+
+        # Same sized writes only touch the changed bytes, anything
+        # that moves the rest of the packet needs a full recompute.
+        if len(old) == len(value):
+            self.__crc = patch(
+                self.__crc, start, old, value, len(self.__data), self.__algorithm
+            )
+        else:
+            self.__crc = compute(self.__data, self.__algorithm)
 
     def __repr__(self):
         return self.__data.__repr__()
@@ -1,3 +1,6 @@
+from BitWaffle.BitWindows.Packet import Packet
+
+
 class Window:
     """Generic Window object"""
 
@@ -9,10 +12,18 @@ class Window:
     def __repr__(self):
         return f"Window[{self.__index.start}:{self.__index.end}"
 
-    def view(self, packet: bytes):
-        return packet[self.__index]
+    def view(self, packet: Packet | bytes | bytearray) -> memoryview:
+        """
+        Retrieves the bytes of the window without copying them.
+        :param packet: The packet to view.
+        :return: A view that follows writes to the packet.
+        """
+        if isinstance(packet, Packet):
+            return packet.view(self.__index)
+
+        return memoryview(packet)[self.__index]
 
-    def update(self, packet: bytes, value: bytes):
+    def update(self, packet: Packet | bytearray, value: bytes):
         packet[self.__index] = value
 
         if self.__index.stop - self.__index.start != len(value):
@@ -27,7 +38,7 @@ class BitWindow(Window):
 
         Window.__init__(self, byte_start, byte_start + (bit_end // 8) + 1)
 
-    def view(self, packet: bytes):
+    def view(self, packet: Packet | bytes | bytearray):
         bits: list[bool] = []
         for byte in Window.view(self, packet):
             bits += [bool(byte & (1 << i)) for i in range(8)[::-1]]
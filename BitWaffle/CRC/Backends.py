@@ -0,0 +1,202 @@
+import binascii
+
+from BitWaffle.CRC import Algorithm
+from BitWaffle.CRC.Table import (
+    REFLECTED_BYTES,
+    default_slices,
+    reflect_bits,
+    tables,
+    update,
+)
+
+
+# Number of bytes reflected at a time for algorithms that do not reflect input.
+REFLECT_CHUNK_SIZE = 0x10000
+
+
+class Backend:
+    """Engine that a CRC object delegates the register arithmetic to."""
+
+    name: str = None
+
+    @classmethod
+    def supports(cls, algorithm: Algorithm) -> bool:
+        """
+        Checks if the backend can compute a CRC algorithm.
+        :param algorithm: The CRC algorithm.
+        :return: True if the backend supports the algorithm.
+        """
+        raise NotImplementedError
+
+    def __init__(self, algorithm: Algorithm) -> None:
+        """
+        Creates a backend in the initial state of a CRC algorithm.
+        :param algorithm: The CRC algorithm.
+        """
+        self.algorithm: Algorithm = Algorithm(*algorithm)
+
+    def update(self, datum: int) -> None:
+        """
+        Updates the CRC with a single byte of data.
+        :param datum: The byte to incorporate into the CRC.
+        """
+        self.update_bytes(bytes((datum,)))
+
+    def update_bytes(self, buffer) -> None:
+        """
+        Updates the CRC with a whole buffer of data.
+        :param buffer: Any object supporting the buffer protocol.
+        """
+        raise NotImplementedError
+
+    def __int__(self) -> int:
+        """
+        Converts the CRC to an integer.
+        :return: The integer CRC value.
+        """
+        raise NotImplementedError
+
+
+class TableBackend(Backend):
+    """Pure Python slicing-by-N table engine that supports every algorithm."""
+
+    name = "table"
+
+    @classmethod
+    def supports(cls, algorithm: Algorithm) -> bool:
+        return algorithm.width >= 8
+
+    def __init__(self, algorithm: Algorithm, slices: int = None) -> None:
+        """
+        Creates a table backend.
+        :param algorithm: The CRC algorithm.
+        :param slices: The number of bytes to consume per table lookup round.
+        """
+        super().__init__(algorithm)
+
+        polynomial, width, initial, final, reflect_input, reflect_output = algorithm
+
+        self.__tables: tuple = tables(polynomial, width)
+        self.__slices: int = slices if slices else default_slices(width)
+        self.__width: int = width
+        self.__crc: int = reflect_bits(initial, width)
+        self.__final: int = final
+        self.__reflect_input: bool = reflect_input
+        self.__reflect_output: bool = reflect_output
+
+    def update(self, datum: int) -> None:
+        # This is backwards because we reflect the data to improve
+        # the performance of the CRC algorithm. If we expect the
+        # input to be reflected then we need to not not reflect it.
+        if not self.__reflect_input:
+            datum = REFLECTED_BYTES[datum]
+
+        self.__crc = self.__tables[0][(self.__crc ^ datum) & 0xFF] ^ (self.__crc >> 8)
+
+    def update_bytes(self, buffer) -> None:
+        if self.__reflect_input:
+            self.__crc = update(self.__crc, buffer, self.__tables, self.__slices)
+            return
+
+        # Same as above, reflect the data a chunk at a time to bound the copy.
+        view = memoryview(buffer).cast("B")
+        for start in range(0, len(view), REFLECT_CHUNK_SIZE):
+            chunk = view[start : start + REFLECT_CHUNK_SIZE].tobytes()
+            self.__crc = update(
+                self.__crc,
+                chunk.translate(REFLECTED_BYTES),
+                self.__tables,
+                self.__slices,
+            )
+
+    def __int__(self) -> int:
+        # Same as above, CRC is already reflected so if we do not want
+        # reflected output then reflect the bits again.
+        if not self.__reflect_output:
+            return reflect_bits(self.__crc, self.__width) ^ self.__final
+
+        return self.__crc ^ self.__final
+
+
+class CRC32Backend(Backend):
+    """Native binascii.crc32 for reflected CRCs with the 0x04C11DB7 polynomial."""
+
+    name = "binascii.crc32"
+
+    @classmethod
+    def supports(cls, algorithm: Algorithm) -> bool:
+        return (
+            algorithm.polynominal == 0x04C11DB7
+            and algorithm.width == 32
+            and algorithm.reflect_input
+        )
+
+    def __init__(self, algorithm: Algorithm) -> None:
+        super().__init__(algorithm)
+
+        # binascii inverts the register before and after each call.
+        self.__crc: int = reflect_bits(algorithm.initial, 32) ^ 0xFFFFFFFF
+
+    def update_bytes(self, buffer) -> None:
+        self.__crc = binascii.crc32(buffer, self.__crc)
+
+    def __int__(self) -> int:
+        crc = self.__crc ^ 0xFFFFFFFF
+        if not self.algorithm.reflect_output:
+            crc = reflect_bits(crc, 32)
+
+        return crc ^ self.algorithm.final
+
+
+class CRCHQXBackend(Backend):
+    """Native binascii.crc_hqx for non-reflected CRCs with the 0x1021 polynomial."""
+
+    name = "binascii.crc_hqx"
+
+    @classmethod
+    def supports(cls, algorithm: Algorithm) -> bool:
+        return (
+            algorithm.polynominal == 0x1021
+            and algorithm.width == 16
+            and not algorithm.reflect_input
+        )
+
+    def __init__(self, algorithm: Algorithm) -> None:
+        super().__init__(algorithm)
+
+        self.__crc: int = algorithm.initial
+
+    def update_bytes(self, buffer) -> None:
+        self.__crc = binascii.crc_hqx(buffer, self.__crc)
+
+    def __int__(self) -> int:
+        crc = self.__crc
+        if self.algorithm.reflect_output:
+            crc = reflect_bits(crc, 16)
+
+        return crc ^ self.algorithm.final
+
+
+# Backends in order of preference, the first that supports an algorithm is used.
+BACKENDS: list[type[Backend]] = [CRC32Backend, CRCHQXBackend, TableBackend]
+
+
+def register(backend: type[Backend]) -> None:
+    """
+    Registers a backend in front of the existing ones.
+    :param backend: The backend class to register.
+    """
+    BACKENDS.insert(0, backend)
+
+
+def select(algorithm: Algorithm) -> type[Backend]:
+    """
+    Finds the preferred backend for a CRC algorithm.
+    :param algorithm: The CRC algorithm.
+    :return: The backend class.
+    """
+    for backend in BACKENDS:
+        if backend.supports(algorithm):
+            return backend
+
+    raise ValueError(f"No backend supports {algorithm}")
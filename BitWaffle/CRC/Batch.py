@@ -0,0 +1,102 @@
+from collections import defaultdict
+from collections.abc import Sequence
+
+from BitWaffle.CRC import Algorithm, Algorithms
+from BitWaffle.CRC.CRC import compute
+from BitWaffle.CRC.Table import REFLECTED_BYTES, reflect_bits, tables
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency.
+    np = None
+
+
+# Unsigned numpy types able to hold a CRC register, by number of bits.
+_DTYPES = (
+    ((8, np.uint8), (16, np.uint16), (32, np.uint32), (64, np.uint64)) if np else ()
+)
+
+
+def _dtype(width: int):
+    """
+    Picks the smallest unsigned numpy type that can hold a CRC register.
+    :param width: The total number of bits in the polynomial.
+    :return: The numpy dtype, or None if the CRC is wider than 64 bits.
+    """
+    return next((dtype for bits, dtype in _DTYPES if width <= bits), None)
+
+
+def _reflect(values, width: int):
+    """
+    Reflects the low width bits of every element of an unsigned array.
+    :param values: The array to reflect.
+    :param width: The number of bits to reflect.
+    :return: The reflected array.
+    """
+    lut = np.frombuffer(REFLECTED_BYTES, dtype=np.uint8)
+    size = values.dtype.itemsize
+
+    # Reversing the byte order and the bits of each byte reverses the whole word.
+    octets = lut[values.view(np.uint8).reshape(-1, size)[:, ::-1]]
+    reflected = np.ascontiguousarray(octets).view(values.dtype).reshape(values.shape)
+
+    return reflected >> values.dtype.type(size * 8 - width)
+
+
+def _compute_block(block, algorithm: Algorithm):
+    """
+    Computes the CRC of every row of a 2-D uint8 array in lockstep.
+    :param block: The messages, one per row.
+    :param algorithm: The CRC algorithm to use.
+    :return: An array with the CRC of each row.
+    """
+    polynomial, width, initial, final, reflect_input, reflect_output = algorithm
+    dtype = _dtype(width)
+
+    table = np.array(tables(polynomial, width)[0], dtype=dtype)
+    if not reflect_input:
+        block = np.frombuffer(REFLECTED_BYTES, dtype=np.uint8)[block]
+
+    eight, mask = dtype(8), dtype(0xFF)
+    crc = np.full(block.shape[0], reflect_bits(initial, width), dtype=dtype)
+    for column in block.T:
+        crc = table[(crc ^ column) & mask] ^ (crc >> eight)
+
+    if not reflect_output:
+        crc = _reflect(crc, width)
+
+    return crc ^ dtype(final)
+
+
+def compute_many(
+    messages: Sequence[bytes], algorithm: Algorithm = Algorithms.CRC32
+) -> "np.ndarray":
+    """
+    Computes the CRC of many messages at once, processing them in lockstep.
+    :param messages: A 2-D uint8 numpy array with one message per row, or a
+                     sequence of byte strings. Messages of equal length are
+                     processed together.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :return: An array with the CRC of each message.
+    """
+    if np is None:
+        raise ImportError("compute_many requires numpy")
+
+    dtype = _dtype(algorithm.width)
+    if dtype is None:  # No numpy type is wide enough, compute one at a time.
+        return np.array([compute(m, algorithm) for m in messages], dtype=object)
+
+    if isinstance(messages, np.ndarray):
+        assert messages.ndim == 2, "Messages must be a 2-D array"
+        return _compute_block(messages.astype(np.uint8, copy=False), algorithm)
+
+    by_length = defaultdict(list)
+    for index, message in enumerate(messages):
+        by_length[len(message)].append(index)
+
+    result = np.empty(len(messages), dtype=dtype)
+    for length, indices in by_length.items():
+        block = np.frombuffer(b"".join(messages[i] for i in indices), dtype=np.uint8)
+        result[indices] = _compute_block(block.reshape(len(indices), length), algorithm)
+
+    return result
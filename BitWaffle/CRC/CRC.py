@@ -1,24 +1,13 @@
-from functools import lru_cache
-
 from BitWaffle.CRC import Algorithm, Algorithms
+from BitWaffle.CRC.Backends import Backend, TableBackend, select
 
 
-class CRC:
-    """Object to generate CRC values based on certain parameters."""
+# Number of bytes read at a time when streaming from a file.
+READ_CHUNK_SIZE = 0x100000
 
-    @staticmethod
-    def __reflect_bits(bits: int, width: int) -> int:
-        """
-        Reflects the bits in an integer.
-        :param bits: The integer to reflect.
-        :param width: The width of the integer.
-        :return: The integer with bits reflected.
-        """
-        reflected = 0
-        for i in range(width):
-            reflected |= ((bits >> i) & 1) << (width - i - 1)
 
-        return reflected
+class CRC:
+    """Object to generate CRC values based on certain parameters."""
 
     def __init__(
         self,
@@ -28,6 +17,8 @@ class CRC:
         final: int,
         reflect_input: bool,
         reflect_output: bool,
+        slices: int = None,
+        backend: type[Backend] = None,
     ) -> None:
         """
         Creates a CRC object.
@@ -37,54 +28,82 @@ class CRC:
         :param final: The final value to xor the CRC with.
         :param reflect_input: True if input bits should be reflected.
         :param reflect_output: True if output bits should be reflected.
+        :param slices: The number of bytes to consume per table lookup round.
+                       Forces the table backend.
+        :param backend: The backend to use. Default picks the preferred backend
+                        that supports the algorithm.
+        :raises ValueError: If the backend does not support the algorithm.
         """
         assert width >= 8, "Polynomial must have at least 8 bits"
 
-        self.__divisor: int = self.__reflect_bits(polynomial, width)
-        self.__width: int = width
-        self.__crc: int = self.__reflect_bits(initial, width)
-        self.__final: int = self.__reflect_bits(final, width)
-        self.__reflect_input: bool = reflect_input
-        self.__reflect_output: bool = reflect_output
+        algorithm = Algorithm(
+            polynomial, width, initial, final, reflect_input, reflect_output
+        )
 
-    @lru_cache(maxsize=0xFF)
-    def __crc_byte(self, byte: int) -> int:
-        """
-        Calculates the byte to xor with the CRC.
-        :param byte: The byte to add.
-        :return: The byte to xor with the CRC.
-        """
-        assert 0x00 <= byte <= 0xFF, "Byte must be between 0x00 and 0xFF"
+        if slices:
+            self.__backend: Backend = TableBackend(algorithm, slices)
+            return
+
+        if backend is None:
+            backend = select(algorithm)
+        elif not backend.supports(algorithm):
+            raise ValueError(f"{backend.name} does not support {algorithm}")
 
-        for _ in range(8):  # For each bit in the byte.
-            byte = (byte >> 1) ^ self.__divisor if byte & 1 else byte >> 1
+        self.__backend: Backend = backend(algorithm)
 
-        return byte
+    @property
+    def backend(self) -> str:
+        """Retrieves the name of the backend computing the CRC."""
+        return self.__backend.name
 
     def update(self, datum: int) -> None:
         """
         Updates the CRC with a single byte of data.
         :param datum: The byte to incorporate into the CRC.
         """
-        # This is backwards because we reflect the data to improve
-        # the performance of the CRC algorithm. If we expect the
-        # input to be reflected then we need to not not reflect it.
-        if not self.__reflect_input:
-            datum = self.__reflect_bits(datum, 8)
+        assert 0x00 <= datum <= 0xFF, "Byte must be between 0x00 and 0xFF"
+
+        self.__backend.update(datum)
+
+    def update_bytes(self, buffer) -> None:
+        """
+        Updates the CRC with a whole buffer of data.
+        :param buffer: Any object supporting the buffer protocol.
+        """
+        self.__backend.update_bytes(buffer)
 
-        self.__crc = self.__crc_byte((self.__crc ^ datum) & 0xFF) ^ (self.__crc >> 8)
+    def update_from(
+        self, readable, size: int = None, chunk_size: int = READ_CHUNK_SIZE
+    ) -> int:
+        """
+        Updates the CRC with data streamed from a binary file like object.
+        A single buffer is reused for every read so memory use is constant.
+        :param readable: An object with a readinto method, such as an open binary file.
+        :param size: The max number of bytes to read. Default reads until EOF.
+        :param chunk_size: The number of bytes to read at a time.
+        :return: The number of bytes read.
+        """
+        buffer = bytearray(chunk_size if size is None else min(chunk_size, size))
+        view, total = memoryview(buffer), 0
+
+        while size is None or total < size:
+            count = readable.readinto(
+                view if size is None else view[: min(chunk_size, size - total)]
+            )
+            if not count:
+                break
+
+            self.update_bytes(view[:count])
+            total += count
+
+        return total
 
     def __int__(self) -> int:
         """
         Converts the CRC to an integer.
         :return: The integer CRC value.
         """
-        # Same as above, CRC is already reflected so if we do not want
-        # reflected output then reflect the bits again.
-        if not self.__reflect_output:
-            return self.__reflect_bits(self.__crc, self.__width) ^ self.__final
-
-        return self.__crc ^ self.__final
+        return int(self.__backend)
 
     def __repr__(self) -> str:
         """
@@ -97,13 +116,39 @@ class CRC:
 def compute(data: bytes, algorithm: Algorithm = Algorithms.CRC32) -> int:
     """
     Helper function to update a CRC with byte data and return the result.
-    :param data: The data to generate the CRC for.
+    :param data: The data to generate the CRC for. Either a buffer such as bytes,
+                 memoryview or mmap, a binary file or an iterable of ints.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :return: The CRC value.
+    """
+    crc = CRC(*algorithm)
+
+    if hasattr(data, "readinto"):
+        crc.update_from(data)
+        return int(crc)
+
+    try:
+        crc.update_bytes(data)
+    except TypeError:  # Not a buffer, fall back to iterating over it.
+        for datum in data:
+            crc.update(datum)
+
+    return int(crc)
+
+
+def compute_file(
+    path, algorithm: Algorithm = Algorithms.CRC32, chunk_size: int = READ_CHUNK_SIZE
+) -> int:
+    """
+    Helper function to stream a file through a CRC in constant memory.
+    :param path: The path of the file to generate the CRC for.
     :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :param chunk_size: The number of bytes to read at a time.
     :return: The CRC value.
     """
     crc = CRC(*algorithm)
 
-    for datum in data:
-        crc.update(datum)
+    with open(path, "rb", buffering=0) as binary_io:
+        crc.update_from(binary_io, chunk_size=chunk_size)
 
     return int(crc)
@@ -0,0 +1,243 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+from BitWaffle.CRC import Algorithm, Algorithms
+from BitWaffle.CRC.CRC import CRC, compute, compute_file
+from BitWaffle.CRC.Table import REFLECTED_BYTES, reflect_bits, tables, update
+
+
+# Inputs are never split into chunks smaller than this many bytes.
+MIN_CHUNK_SIZE = 0x100000
+
+
+def _times(matrix: tuple[int, ...], vector: int) -> int:
+    """
+    Multiplies a GF(2) matrix by a vector.
+    :param matrix: The matrix columns, column i is the image of bit i.
+    :param vector: The vector to multiply.
+    :return: The product.
+    """
+    product, i = 0, 0
+    while vector:
+        if vector & 1:
+            product ^= matrix[i]
+
+        vector, i = vector >> 1, i + 1
+
+    return product
+
+
+def _square(matrix: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Squares a GF(2) matrix.
+    :param matrix: The matrix to square.
+    :return: The matrix multiplied by itself.
+    """
+    return tuple(_times(matrix, column) for column in matrix)
+
+
+@cache
+def _zeros_operator(polynomial: int, width: int, power: int) -> tuple[int, ...]:
+    """
+    Builds the matrix that feeds 2 ** power zero bytes through a reflected CRC register.
+    :param polynomial: The bit representation of the CRC polynomial.
+    :param width: The total number of bits in the polynomial.
+    :param power: The log2 of the number of zero bytes.
+    :return: The operator matrix.
+    """
+    if power:
+        return _square(_zeros_operator(polynomial, width, power - 1))
+
+    # A single zero bit shifts the register right and conditionally
+    # xors in the divisor, square it three times to get a whole byte.
+    matrix = (reflect_bits(polynomial, width),) + tuple(
+        1 << i for i in range(width - 1)
+    )
+    for _ in range(3):
+        matrix = _square(matrix)
+
+    return matrix
+
+
+def shift(register: int, length: int, polynomial: int, width: int) -> int:
+    """
+    Feeds zero bytes through a reflected CRC register in O(log(length)) time.
+    :param register: The reflected CRC register.
+    :param length: The number of zero bytes.
+    :param polynomial: The bit representation of the CRC polynomial.
+    :param width: The total number of bits in the polynomial.
+    :return: The updated register.
+    """
+    power = 0
+    while length and register:
+        if length & 1:
+            register = _times(_zeros_operator(polynomial, width, power), register)
+
+        length, power = length >> 1, power + 1
+
+    return register
+
+
+def to_register(crc: int, algorithm: Algorithm) -> int:
+    """
+    Converts a CRC value back to the reflected register that produced it.
+    :param crc: The CRC value.
+    :param algorithm: The CRC algorithm that produced it.
+    :return: The reflected CRC register.
+    """
+    crc ^= algorithm.final
+    return crc if algorithm.reflect_output else reflect_bits(crc, algorithm.width)
+
+
+def from_register(register: int, algorithm: Algorithm) -> int:
+    """
+    Converts a reflected CRC register to a CRC value.
+    :param register: The reflected CRC register.
+    :param algorithm: The CRC algorithm.
+    :return: The CRC value.
+    """
+    if not algorithm.reflect_output:
+        register = reflect_bits(register, algorithm.width)
+
+    return register ^ algorithm.final
+
+
+def combine(
+    crc_a: int, crc_b: int, len_b: int, algorithm: Algorithm = Algorithms.CRC32
+) -> int:
+    """
+    Computes the CRC of two concatenated blocks from the CRC of each block.
+    :param crc_a: The CRC of the first block.
+    :param crc_b: The CRC of the second block.
+    :param len_b: The number of bytes in the second block.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :return: The CRC of the first block followed by the second block.
+    """
+    polynomial, width = algorithm.polynominal, algorithm.width
+
+    # crc(A + B) differs from crc(B) by the effect A had on the register
+    # over the initial value, carried through len(B) bytes of data.
+    register = to_register(crc_a, algorithm) ^ reflect_bits(algorithm.initial, width)
+    register = shift(register, len_b, polynomial, width)
+
+    return from_register(register ^ to_register(crc_b, algorithm), algorithm)
+
+
+def patch(
+    crc: int,
+    offset: int,
+    old: bytes,
+    new: bytes,
+    length: int,
+    algorithm: Algorithm = Algorithms.CRC32,
+) -> int:
+    """
+    Updates the CRC of a message after some of its bytes are overwritten.
+    Takes O(len(new) + log(length)) time instead of recomputing the whole message.
+    :param crc: The CRC of the message before the change.
+    :param offset: The offset of the first changed byte.
+    :param old: The bytes that were overwritten.
+    :param new: The bytes that replaced them, the same length as old.
+    :param length: The total length of the message.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :return: The CRC of the message after the change.
+    """
+    assert len(old) == len(new), "Old and new bytes must be the same length"
+    assert 0 <= offset and offset + len(new) <= length, "Change must be in the message"
+
+    polynomial, width = algorithm.polynominal, algorithm.width
+
+    # The CRC is linear, so the change in the register is the zero initial
+    # register of the changed bits carried through the bytes after them.
+    delta = (int.from_bytes(old, "big") ^ int.from_bytes(new, "big")).to_bytes(
+        len(new), "big"
+    )
+    if not algorithm.reflect_input:
+        delta = delta.translate(REFLECTED_BYTES)
+
+    register = update(0, delta, tables(polynomial, width))
+    register = shift(register, length - offset - len(new), polynomial, width)
+
+    return from_register(to_register(crc, algorithm) ^ register, algorithm)
+
+
+def _compute_range(path: str, start: int, length: int, algorithm: Algorithm) -> int:
+    """
+    Computes the CRC of a range of bytes in a file.
+    :param path: The file to read.
+    :param start: The offset of the first byte.
+    :param length: The number of bytes.
+    :param algorithm: The CRC algorithm to use.
+    :return: The CRC value.
+    """
+    crc = CRC(*algorithm)
+
+    with open(path, "rb", buffering=0) as binary_io:
+        binary_io.seek(start)
+        crc.update_from(binary_io, length)
+
+    return int(crc)
+
+
+def compute_parallel(
+    path_or_buffer,
+    algorithm: Algorithm = Algorithms.CRC32,
+    workers: int = None,
+    chunk_size: int = None,
+) -> int:
+    """
+    Computes a CRC by splitting the input into chunks processed in a process pool.
+    :param path_or_buffer: A file path or an object supporting the buffer protocol.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :param workers: The number of processes to use. Default is the CPU count.
+    :param chunk_size: The number of bytes in each chunk. Default splits evenly across workers.
+    :return: The CRC value.
+    """
+    workers = workers if workers else os.cpu_count()
+
+    is_path = isinstance(path_or_buffer, (str, os.PathLike))
+    if is_path:
+        size = os.path.getsize(path_or_buffer)
+    else:
+        path_or_buffer = memoryview(path_or_buffer).cast("B")
+        size = len(path_or_buffer)
+
+    if not chunk_size:
+        chunk_size = max(-(-size // workers), MIN_CHUNK_SIZE)
+
+    starts = range(0, size, chunk_size)
+    lengths = [min(chunk_size, size - start) for start in starts]
+
+    if workers == 1 or len(lengths) <= 1:
+        if is_path:
+            return compute_file(path_or_buffer, algorithm)
+
+        return compute(path_or_buffer, algorithm)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if is_path:
+            crcs = executor.map(
+                _compute_range,
+                [path_or_buffer] * len(lengths),
+                starts,
+                lengths,
+                [algorithm] * len(lengths),
+            )
+        else:
+            crcs = executor.map(
+                compute,
+                [
+                    path_or_buffer[start : start + chunk_size].tobytes()
+                    for start in starts
+                ],
+                [algorithm] * len(lengths),
+            )
+
+        crcs = list(crcs)
+
+    result = crcs[0]
+    for crc, length in zip(crcs[1:], lengths[1:]):
+        result = combine(result, crc, length, algorithm)
+
+    return result
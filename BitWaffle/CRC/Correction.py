@@ -0,0 +1,255 @@
+import threading
+from collections import OrderedDict, namedtuple
+from itertools import combinations
+from sys import getsizeof
+from time import perf_counter
+
+from BitWaffle.CRC import Algorithm, Algorithms
+from BitWaffle.CRC.CRC import compute
+from BitWaffle.CRC.Combine import to_register
+from BitWaffle.CRC.Table import reflect_bits, tables
+
+
+# Double bit errors are only tabulated when the index stays below this many entries.
+# Each entry costs about 100 bytes, so a full index takes about 100MB, which is
+# what CRC32 with double bit errors reaches at frames of about 176 bytes.
+MAX_ENTRIES = 1 << 20
+
+# Total entries of the indexes kept by syndrome_index(), the least recently
+# used indexes are dropped beyond it. About 200MB by the estimate above.
+CACHE_ENTRIES = 2 * MAX_ENTRIES
+
+Corrected = namedtuple("Corrected", "frame crc errors")
+
+
+class SyndromeIndex:
+    """Maps CRC syndromes of a fixed frame length to the bit errors causing them."""
+
+    def __init__(
+        self,
+        algorithm: Algorithm,
+        length: int,
+        max_errors: int = 2,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        """
+        Builds a syndrome index.
+
+        Error positions are numbered 8 * byte + bit for bits of the frame, where
+        bit 0 is the least significant bit of the byte, followed by width
+        positions for bits of the CRC itself. Double bit errors are tabulated
+        when they fit in max_entries, otherwise they are located by pairing
+        single bit syndromes at correction time.
+        :param algorithm: The CRC algorithm.
+        :param length: The frame length in bytes, excluding the CRC.
+        :param max_errors: The max number of bit errors to correct, 1 or 2.
+        :param max_entries: The max number of entries in the index.
+        """
+        assert max_errors in (1, 2), "Only 1 or 2 bit errors can be corrected"
+
+        start = perf_counter()
+
+        self.__algorithm: Algorithm = Algorithm(*algorithm)
+        self.__length: int = length
+        self.__max_errors: int = max_errors
+
+        self.__syndromes: list[int] = self.__single_syndromes()
+        positions = len(self.__syndromes)
+        if positions > max_entries:
+            raise ValueError(f"{positions} single bit syndromes exceed {max_entries}")
+
+        # Errors are packed into ints to keep the index small, see __pack().
+        self.__index: dict[int, int] = {}
+        for position, syndrome in enumerate(self.__syndromes):
+            self.__insert(syndrome, position + 1)
+
+        self.__paired: bool = (
+            max_errors == 2
+            and positions + positions * (positions - 1) // 2 <= max_entries
+        )
+        if self.__paired:
+            for (i, a), (j, b) in combinations(enumerate(self.__syndromes), 2):
+                self.__insert(a ^ b, (i + 1) << 32 | (j + 1))
+
+        self.build_time: float = perf_counter() - start
+
+    def __single_syndromes(self) -> list[int]:
+        """
+        Computes the syndrome of every single bit error.
+        :return: The syndrome of each error position.
+        """
+        polynomial, width, _, _, reflect_input, reflect_output = self.__algorithm
+        t0 = tables(polynomial, width)[0]
+
+        # Start with each bit of the last byte, then carry them through one
+        # more zero byte for every byte further from the end of the frame.
+        registers = [t0[1 << bit if reflect_input else 0x80 >> bit] for bit in range(8)]
+        frame = [0] * (8 * self.__length)
+        for byte in range(self.__length - 1, -1, -1):
+            frame[8 * byte : 8 * byte + 8] = registers
+            registers = [t0[r & 0xFF] ^ (r >> 8) for r in registers]
+
+        crc = [
+            1 << bit if reflect_output else reflect_bits(1 << bit, width)
+            for bit in range(width)
+        ]
+
+        return frame + crc
+
+    def __insert(self, syndrome: int, errors: int) -> None:
+        """
+        Adds errors to the index, preferring fewer errors and marking ties ambiguous.
+
+        Errors are packed as (first + 1) << 32 | (second + 1) for double bit
+        errors, position + 1 for single bit errors and 0 when ambiguous.
+        :param syndrome: The syndrome of the errors.
+        :param errors: The packed error positions.
+        """
+        existing = self.__index.get(syndrome)
+        if existing is None:
+            self.__index[syndrome] = errors
+        elif existing and (existing >> 32 == 0) == (errors >> 32 == 0):
+            self.__index[syndrome] = 0
+
+    @staticmethod
+    def __unpack(errors: int) -> tuple[int, ...] | None:
+        """
+        Unpacks errors stored by __insert().
+        :param errors: The packed error positions.
+        :return: The error positions, or None if ambiguous.
+        """
+        if not errors:
+            return None
+
+        first, second = errors >> 32, errors & 0xFFFFFFFF
+        return (first - 1, second - 1) if first else (second - 1,)
+
+    @property
+    def algorithm(self) -> Algorithm:
+        """Retrieves the CRC algorithm of the index."""
+        return self.__algorithm
+
+    @property
+    def length(self) -> int:
+        """Retrieves the frame length in bytes."""
+        return self.__length
+
+    @property
+    def entries(self) -> int:
+        """Retrieves the number of syndromes in the index."""
+        return len(self.__index)
+
+    @property
+    def paired(self) -> bool:
+        """Retrieves True if double bit errors are tabulated."""
+        return self.__paired
+
+    @property
+    def size(self) -> int:
+        """Retrieves the approximate memory used by the index in bytes."""
+        return (
+            getsizeof(self.__index)
+            + getsizeof(self.__syndromes)
+            + sum(getsizeof(k) + getsizeof(v) for k, v in self.__index.items())
+        )
+
+    def locate(self, syndrome: int) -> tuple[int, ...] | None:
+        """
+        Finds the error positions that produce a syndrome.
+        :param syndrome: The xor of the received and computed CRC registers.
+        :return: The error positions, () for no errors or None if uncorrectable.
+        """
+        if not syndrome:
+            return ()
+
+        if syndrome in self.__index:
+            return self.__unpack(self.__index[syndrome])
+
+        if self.__paired or self.__max_errors < 2:
+            return None
+
+        # Pair each single bit syndrome with the one needed to complete it.
+        found = None
+        for i, a in enumerate(self.__syndromes):
+            other = self.__index.get(syndrome ^ a, 0)
+            if other and other >> 32 == 0 and i < other - 1:
+                if found:
+                    return None
+                found = (i, other - 1)
+
+        return found
+
+
+_cache: OrderedDict[tuple, SyndromeIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def syndrome_index(
+    algorithm: Algorithm,
+    length: int,
+    max_errors: int = 2,
+    max_entries: int = MAX_ENTRIES,
+) -> SyndromeIndex:
+    """
+    Retrieves a cached syndrome index for an algorithm and frame length.
+    The cache holds up to CACHE_ENTRIES entries over all its indexes.
+    :param algorithm: The CRC algorithm.
+    :param length: The frame length in bytes, excluding the CRC.
+    :param max_errors: The max number of bit errors to correct, 1 or 2.
+    :param max_entries: The max number of entries in the index.
+    :return: The syndrome index.
+    """
+    key = (Algorithm(*algorithm), length, max_errors, max_entries)
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None:
+            _cache.move_to_end(key)
+            return index
+
+    index = SyndromeIndex(*key)
+
+    with _cache_lock:
+        _cache[key] = index
+        total = sum(cached.entries for cached in _cache.values())
+        while total > CACHE_ENTRIES and len(_cache) > 1:
+            total -= _cache.popitem(last=False)[1].entries
+
+    return index
+
+
+def correct(
+    frame: bytes,
+    crc: int,
+    algorithm: Algorithm = Algorithms.CRC32,
+    max_errors: int = 2,
+    max_entries: int = MAX_ENTRIES,
+) -> Corrected:
+    """
+    Repairs up to two flipped bits in a frame or its CRC.
+    :param frame: The received frame, excluding the CRC.
+    :param crc: The received CRC.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :param max_errors: The max number of bit errors to correct, 1 or 2.
+    :param max_entries: The max number of entries in the syndrome index, double
+                        bit errors are located more slowly when they do not fit.
+    :return: The corrected frame, CRC and the error positions that were flipped.
+    """
+    algorithm = Algorithm(*algorithm)
+    index = syndrome_index(algorithm, len(frame), max_errors, max_entries)
+
+    syndrome = to_register(crc, algorithm) ^ to_register(
+        compute(frame, algorithm), algorithm
+    )
+
+    errors = index.locate(syndrome)
+    if errors is None:
+        raise ValueError("Frame has more errors than can be corrected")
+
+    frame, bits = bytearray(frame), 8 * len(frame)
+    for error in errors:
+        if error < bits:
+            frame[error // 8] ^= 1 << (error % 8)
+        else:
+            crc ^= 1 << (error - bits)
+
+    return Corrected(bytes(frame), crc, errors)
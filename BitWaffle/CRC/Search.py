@@ -0,0 +1,352 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from BitWaffle.CRC import Algorithm, Algorithms
+from BitWaffle.CRC.CRC import compute
+from BitWaffle.CRC.Table import reflect_bits
+from BitWaffle.Util.BinaryPolynomial import BinaryPolynomial
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency.
+    np = None
+
+
+# Number of candidate polynomials evaluated per numpy batch.
+CHUNK_SIZE = 1 << 18
+
+# Reflection settings tried by the polynomial search, as (input, output).
+REFLECTIONS = ((False, False), (True, True))
+
+# Largest degree of cofactor tried when splitting the common divisor of the
+# differences, beyond it every polynomial is searched instead.
+MAX_COFACTOR_DEGREE = 16
+
+
+def _matches(algorithm: Algorithm, samples: list[tuple[bytes, int]]) -> bool:
+    """
+    Checks if an algorithm produces the expected CRC for every sample.
+    :param algorithm: The CRC algorithm.
+    :param samples: The (message, crc) samples.
+    :return: True if every sample matches.
+    """
+    return all(compute(message, algorithm) == crc for message, crc in samples)
+
+
+def _bits(data: bytes, reflect: bool) -> list[int]:
+    """
+    Splits data into the bits fed to a CRC register, dropping leading zero bits.
+    Leading zeros leave a zero initialised register untouched so can be skipped.
+    :param data: The data.
+    :param reflect: True if each byte is fed least significant bit first.
+    :return: The bits in the order they are fed.
+    """
+    order = range(8) if reflect else range(7, -1, -1)
+    bits = [byte >> i & 1 for byte in data for i in order]
+
+    return bits[bits.index(1) :] if 1 in bits else []
+
+
+def _differences(
+    samples: list[tuple[bytes, int]],
+    width: int,
+    reflect_input: bool,
+    reflect_output: bool,
+) -> list[tuple[list[int], int]]:
+    """
+    Builds the differences between samples of equal length.
+
+    The CRC is affine in the message, so the xor of two equal length messages
+    has a zero initial, zero final CRC equal to the xor of their two CRCs. That
+    eliminates the initial and final values from the polynomial search.
+    :param samples: The (message, crc) samples.
+    :param width: The CRC width.
+    :param reflect_input: True if input bits are reflected.
+    :param reflect_output: True if output bits are reflected.
+    :return: (bits, target register) pairs, shortest first.
+    """
+    differences = []
+    for (m1, c1), (m2, c2) in combinations(samples, 2):
+        if len(m1) != len(m2):
+            continue
+
+        target = reflect_bits(c1 ^ c2, width) if reflect_output else c1 ^ c2
+        bits = _bits(bytes(a ^ b for a, b in zip(m1, m2)), reflect_input)
+        if bits or target:
+            differences.append((bits, target))
+
+    return sorted(differences, key=lambda difference: len(difference[0]))
+
+
+def _divisors(width: int, differences: list[tuple[list[int], int]]) -> list[int] | None:
+    """
+    Finds the odd polynomials that satisfy every difference by factoring.
+
+    A zero register fed the bits of M(x) ends up holding M(x) x^w mod P(x), so
+    a difference with target T(x) holds exactly when P(x) divides
+    M(x) x^w + T(x). The candidates are the degree w divisors of the gcd of
+    those, found by dividing it by every cofactor of the remaining degree.
+    :param width: The CRC width.
+    :param differences: (bits, target register) pairs from _differences().
+    :return: The polynomials without their x^w term, or None if the gcd has
+             too many cofactors to try.
+    """
+    common = BinaryPolynomial(0)
+    for bits, target in differences:
+        message = int("".join(map(str, bits)), 2) if bits else 0
+        common = common.gcd(BinaryPolynomial(message << width ^ target))
+
+    extra = common.degree - width
+    if extra < 0:
+        return []
+    if extra > MAX_COFACTOR_DEGREE:
+        return None
+
+    polynomials = []
+    for cofactor in range(1 << extra, 1 << (extra + 1)):
+        quotient, remainder = divmod(common, BinaryPolynomial(cofactor))
+        if not remainder and quotient & 1:
+            polynomials.append(quotient ^ (1 << width))
+
+    return sorted(polynomials)
+
+
+def _search_range(
+    width: int, differences: list[tuple[list[int], int]], start: int, stop: int
+) -> list[int]:
+    """
+    Finds the odd polynomials in a range that satisfy every difference.
+    Every candidate polynomial is run through a bitwise CRC register in lockstep.
+    :param width: The CRC width.
+    :param differences: (bits, target register) pairs from _differences().
+    :param start: The first candidate index, polynomial = 2 * index + 1.
+    :param stop: The last candidate index, exclusive.
+    :return: The polynomials that satisfy every difference.
+    """
+    dtype = next(
+        t
+        for t in (np.uint8, np.uint16, np.uint32, np.uint64)
+        if width <= np.dtype(t).itemsize * 8
+    )
+    one, top = dtype(1), dtype(width - 1)
+    mask = dtype((1 << width) - 1)
+
+    polynomials = np.arange(start, stop, dtype=dtype)
+    polynomials <<= one
+    polynomials |= one
+
+    for bits, target in differences:
+        register = np.zeros_like(polynomials)
+        feedback = np.empty_like(polynomials)
+        for bit in bits:
+            np.right_shift(register, top, out=feedback)
+            feedback &= one
+            if bit:
+                feedback ^= one
+
+            feedback *= polynomials
+            register <<= one
+            register &= mask
+            register ^= feedback
+
+        polynomials = polynomials[register == dtype(target)]
+        if not len(polynomials):
+            break
+
+    return polynomials.tolist()
+
+
+def _search_all(
+    width: int, differences: list[tuple[list[int], int]], workers: int
+) -> list[int]:
+    """
+    Tries every odd polynomial of a width against the differences.
+    :param width: The CRC width.
+    :param differences: (bits, target register) pairs from _differences().
+    :param workers: The number of processes to search with.
+    :return: The polynomials that satisfy every difference.
+    """
+    if np is None:
+        raise ImportError("The exhaustive polynomial search requires numpy")
+
+    ranges = [
+        (start, min(start + CHUNK_SIZE, 1 << (width - 1)))
+        for start in range(0, 1 << (width - 1), CHUNK_SIZE)
+    ]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            candidates = executor.map(
+                _search_range,
+                *zip(*[(width, differences, start, stop) for start, stop in ranges]),
+            )
+            return [p for chunk in candidates for p in chunk]
+
+    return [
+        p
+        for start, stop in ranges
+        for p in _search_range(width, differences, start, stop)
+    ]
+
+
+def _solve(equations: list[tuple[int, int]]) -> int | None:
+    """
+    Solves a system of linear equations over GF(2), free variables are zero.
+    :param equations: (coefficient bits, right hand side bit) rows.
+    :return: The solution, or None if the system is inconsistent.
+    """
+    pivots = {}
+    for coefficients, rhs in equations:
+        for bit, (row, value) in pivots.items():
+            if coefficients >> bit & 1:
+                coefficients, rhs = coefficients ^ row, rhs ^ value
+
+        if not coefficients:
+            if rhs:
+                return None
+            continue
+
+        bit = coefficients.bit_length() - 1
+        for other, (row, value) in pivots.items():
+            if row >> bit & 1:
+                pivots[other] = (row ^ coefficients, value ^ rhs)
+        pivots[bit] = (coefficients, rhs)
+
+    solution = 0
+    for bit, (_, value) in pivots.items():
+        solution |= value << bit
+
+    return solution
+
+
+def _parameters(
+    polynomial: int,
+    width: int,
+    reflect_input: bool,
+    reflect_output: bool,
+    samples: list[tuple[bytes, int]],
+) -> Algorithm | None:
+    """
+    Solves for the initial and final values of a candidate polynomial.
+    :param polynomial: The candidate polynomial.
+    :param width: The CRC width.
+    :param reflect_input: True if input bits are reflected.
+    :param reflect_output: True if output bits are reflected.
+    :param samples: The (message, crc) samples.
+    :return: The algorithm, or None if no initial value fits every sample.
+    """
+
+    def crc(message: bytes, initial: int) -> int:
+        return compute(
+            message,
+            Algorithm(polynomial, width, initial, 0, reflect_input, reflect_output),
+        )
+
+    # The CRC is affine in the initial value, so it is determined by the
+    # CRC with a zero initial value and the effect of each initial bit.
+    affine = []
+    for message, _ in samples:
+        zero = crc(message, 0)
+        affine.append((zero, [crc(message, 1 << i) ^ zero for i in range(width)]))
+
+    # Equal lengths share the same initial value contribution, only
+    # messages of different lengths constrain the initial value.
+    (zero0, columns0), c0 = affine[0], samples[0][1]
+    equations = []
+    for (zero, columns), (message, c) in zip(affine[1:], samples[1:]):
+        if len(message) == len(samples[0][0]):
+            continue
+
+        rhs = c0 ^ c ^ zero0 ^ zero
+        for row in range(width):
+            coefficients = sum(
+                ((a ^ b) >> row & 1) << i
+                for i, (a, b) in enumerate(zip(columns0, columns))
+            )
+            equations.append((coefficients, rhs >> row & 1))
+
+    # The solution is not unique when the samples cannot tell initial values
+    # apart, so prefer the conventional ones as long as they fit.
+    mask = (1 << width) - 1
+    initials = [0, mask] + ([_solve(equations)] if equations else [])
+
+    found = None
+    for initial in initials:
+        if initial is None:
+            continue
+
+        effect = 0
+        for i, column in enumerate(columns0):
+            if initial >> i & 1:
+                effect ^= column
+
+        final = c0 ^ zero0 ^ effect
+        algorithm = Algorithm(
+            polynomial, width, initial, final, reflect_input, reflect_output
+        )
+        if _matches(algorithm, samples):
+            if final in (0, mask):
+                return algorithm
+            found = found if found else algorithm
+
+    return found
+
+
+def search(
+    samples: Iterable[tuple[bytes, int]],
+    width: int = None,
+    reflections: Iterable[tuple[bool, bool]] = REFLECTIONS,
+    workers: int = 1,
+    exhaustive: bool = False,
+) -> Iterator[Algorithm]:
+    """
+    Finds the CRC parameters that produced a set of samples.
+
+    The known algorithms are tried first. If none match (or exhaustive is set)
+    the polynomials of the given width are searched, by factoring when the
+    differences between samples pin them down, otherwise by trying every
+    polynomial, which needs numpy. The search needs at least
+    two samples of the same length, more samples eliminate more false matches.
+    When every sample has the same length the initial and final values cannot be
+    told apart, and conventional initial values are preferred.
+    :param samples: (message, crc) pairs.
+    :param width: The CRC width. Required for the polynomial search.
+    :param reflections: The (reflect input, reflect output) settings to search.
+    :param workers: The number of processes to search with.
+    :param exhaustive: True to run the polynomial search even after a known match.
+    :return: The matching algorithms.
+    """
+    samples = [(bytes(message), crc) for message, crc in samples]
+    assert samples, "At least one sample is required"
+
+    found = set()
+    for algorithm in Algorithms:
+        if (width is None or algorithm.width == width) and _matches(algorithm, samples):
+            found.add(Algorithm(*algorithm))
+            yield algorithm
+
+    if found and not exhaustive:
+        return
+
+    if width is None:
+        raise ValueError("The polynomial search requires a width")
+
+    for reflect_input, reflect_output in reflections:
+        differences = _differences(samples, width, reflect_input, reflect_output)
+        if not differences:
+            raise ValueError(
+                "The polynomial search requires two samples of equal length"
+            )
+
+        candidates = _divisors(width, differences)
+        if candidates is None:
+            candidates = _search_all(width, differences, workers)
+
+        for polynomial in candidates:
+            algorithm = _parameters(
+                polynomial, width, reflect_input, reflect_output, samples
+            )
+            if algorithm and algorithm not in found:
+                found.add(algorithm)
+                yield algorithm
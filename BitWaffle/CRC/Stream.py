@@ -0,0 +1,184 @@
+from asyncio import IncompleteReadError, Queue, StreamReader
+from typing import Optional
+
+from BitWaffle.CRC import Algorithm, Algorithms
+from BitWaffle.CRC.CRC import CRC, compute
+
+
+# Number of payload bytes read from the stream at a time.
+CHUNK_SIZE = 0x1000
+
+
+def encode_frame(
+    payload: bytes,
+    algorithm: Algorithm = Algorithms.CRC32,
+    length_size: int = 2,
+    byteorder: str = "big",
+) -> bytes:
+    """
+    Builds a length prefixed, CRC trailed frame.
+    The CRC covers the length prefix and the payload.
+    :param payload: The frame payload.
+    :param algorithm: The CRC algorithm to use. Default is CRC32.
+    :param length_size: The number of bytes in the length prefix.
+    :param byteorder: The byte order of the length prefix and the CRC.
+    :return: The encoded frame.
+    """
+    header = len(payload).to_bytes(length_size, byteorder)
+    crc = compute(header + payload, algorithm)
+
+    return header + payload + crc.to_bytes(-(-algorithm.width // 8), byteorder)
+
+
+class FrameReader:
+    """Yields validated frames from an asyncio.StreamReader.
+
+    The CRC is updated as each chunk of a frame arrives. A frame that fails its
+    CRC, or that the stream ends inside of, is discarded and the stream is
+    rescanned from the byte after its start to resynchronise. Frames are only
+    read as fast as they are consumed, so a slow consumer fills the
+    StreamReader buffer, which pauses the transport and pushes back on the
+    sender.
+
+    frames counts the valid frames and corrupt the stretches of the stream that
+    were discarded. Offsets rescanned inside a discarded stretch extend it
+    rather than count again, so a corrupt frame and any garbage straight after
+    it count once.
+    """
+
+    def __init__(
+        self,
+        reader: StreamReader,
+        algorithm: Algorithm = Algorithms.CRC32,
+        length_size: int = 2,
+        byteorder: str = "big",
+        max_length: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """
+        Creates a FrameReader.
+        :param reader: The stream to read frames from.
+        :param algorithm: The CRC algorithm to use. Default is CRC32.
+        :param length_size: The number of bytes in the length prefix.
+        :param byteorder: The byte order of the length prefix and the CRC.
+        :param max_length: The max payload length, longer frames are treated as corrupt.
+        :param chunk_size: The number of payload bytes read from the stream at a time.
+        """
+        self.__reader: StreamReader = reader
+        self.__algorithm: Algorithm = algorithm
+        self.__length_size: int = length_size
+        self.__crc_size: int = -(-algorithm.width // 8)
+        self.__byteorder: str = byteorder
+        self.__max_length: int = (
+            max_length if max_length is not None else (1 << 8 * length_size) - 1
+        )
+        self.__chunk_size: int = chunk_size
+
+        # Bytes pushed back onto the stream while resynchronising, and how
+        # many bytes of the current discarded stretch are still ahead.
+        self.__pending: bytearray = bytearray()
+        self.__discarding: int = 0
+
+        self.frames: int = 0
+        self.corrupt: int = 0
+
+    async def __read(self, size: int) -> bytes:
+        """
+        Reads up to size bytes, preferring pushed back bytes.
+        :param size: The max number of bytes to read.
+        :return: The bytes read, empty at EOF.
+        """
+        if self.__pending:
+            data = bytes(self.__pending[:size])
+            del self.__pending[:size]
+            return data
+
+        return await self.__reader.read(size)
+
+    async def __read_exactly(self, size: int) -> bytes:
+        """
+        Reads exactly size bytes.
+        :param size: The number of bytes to read.
+        :return: The bytes read.
+        """
+        data = bytearray()
+        while len(data) < size:
+            chunk = await self.__read(min(size - len(data), self.__chunk_size))
+            if not chunk:
+                raise IncompleteReadError(bytes(data), size)
+
+            data += chunk
+
+        return bytes(data)
+
+    def __resync(self, frame: bytes) -> None:
+        """
+        Pushes a rejected frame back onto the stream, minus its first byte.
+        A rejection starting past the current discarded stretch begins a new one.
+        :param frame: The rejected bytes.
+        """
+        if not self.__discarding:
+            self.corrupt += 1
+
+        self.__discarding = max(self.__discarding, len(frame)) - 1
+        self.__pending[:0] = frame[1:]
+
+    def __aiter__(self) -> "FrameReader":
+        return self
+
+    async def __anext__(self) -> bytes:
+        """
+        Reads the next frame that passes its CRC check.
+        :return: The frame payload.
+        """
+        while True:
+            # Only fewer bytes than a header left can end the stream.
+            try:
+                header = await self.__read_exactly(self.__length_size)
+            except IncompleteReadError:
+                raise StopAsyncIteration
+
+            length = int.from_bytes(header, self.__byteorder)
+            if length > self.__max_length:
+                self.__resync(header)
+                continue
+
+            crc = CRC(*self.__algorithm)
+            crc.update_bytes(header)
+
+            payload = bytearray()
+            try:
+                while len(payload) < length:
+                    chunk = await self.__read(
+                        min(length - len(payload), self.__chunk_size)
+                    )
+                    if not chunk:
+                        raise IncompleteReadError(bytes(payload), length)
+
+                    crc.update_bytes(chunk)
+                    payload += chunk
+
+                trailer = await self.__read_exactly(self.__crc_size)
+            except IncompleteReadError as error:
+                # The stream ended inside the frame, perhaps because its length is
+                # what is corrupt, so the bytes read after its start are rescanned.
+                tail = error.partial if len(payload) == length else b""
+                self.__resync(header + payload + tail)
+                continue
+
+            if int.from_bytes(trailer, self.__byteorder) != int(crc):
+                self.__resync(header + payload + trailer)
+                continue
+
+            self.frames += 1
+            self.__discarding = 0
+            return bytes(payload)
+
+    async def pipe(self, queue: Queue) -> None:
+        """
+        Forwards validated frames into a queue until the stream ends.
+        A bounded queue stops reading from the stream while it is full.
+        :param queue: The queue to put frames on.
+        """
+        async for frame in self:
+            await queue.put(frame)
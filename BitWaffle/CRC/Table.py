@@ -0,0 +1,157 @@
+from functools import cache
+from struct import Struct
+
+
+# Number of bytes the table engine can consume per lookup round.
+SLICES = (1, 4, 8, 16)
+
+_UINT32 = Struct("<I")
+_UINT64 = Struct("<Q")
+_UINT128 = Struct("<QQ")
+
+
+def reflect_bits(bits: int, width: int) -> int:
+    """
+    Reflects the bits in an integer.
+    :param bits: The integer to reflect.
+    :param width: The width of the integer.
+    :return: The integer with bits reflected.
+    """
+    return int(f"{bits:0{width}b}"[::-1], 2) if width else 0
+
+
+# Every byte with its bits reflected, usable with bytes.translate.
+REFLECTED_BYTES = bytes(reflect_bits(byte, 8) for byte in range(0x100))
+
+
+@cache
+def tables(polynomial: int, width: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Builds the reflected slicing-by-N lookup tables for a polynomial.
+
+    Table k maps a byte to the CRC register contribution of that byte followed
+    by k zero bytes. The tables only depend on the polynomial and width so they
+    are built once and shared by every CRC object using them.
+    :param polynomial: The bit representation of the CRC polynomial.
+    :param width: The total number of bits in the polynomial.
+    :return: max(SLICES) tables of 256 entries each.
+    """
+    divisor = reflect_bits(polynomial, width)
+
+    first = []
+    for byte in range(0x100):
+        for _ in range(8):  # For each bit in the byte.
+            byte = (byte >> 1) ^ divisor if byte & 1 else byte >> 1
+        first.append(byte)
+
+    result = [tuple(first)]
+    for _ in range(1, max(SLICES)):
+        result.append(tuple((crc >> 8) ^ first[crc & 0xFF] for crc in result[-1]))
+
+    return tuple(result)
+
+
+def default_slices(width: int) -> int:
+    """
+    Picks the number of bytes to consume per lookup round for a CRC width.
+    :param width: The total number of bits in the polynomial.
+    :return: The smallest slice size that holds the whole CRC register.
+    """
+    return next((n for n in SLICES if width <= n * 8), SLICES[-1])
+
+
+def _update_by_1(crc: int, data, table: tuple) -> int:
+    t0 = table[0]
+    for byte in data:
+        crc = t0[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+
+    return crc
+
+
+def _update_by_4(crc: int, data, table: tuple) -> int:
+    t0, t1, t2, t3 = table[:4]
+    for (v,) in _UINT32.iter_unpack(data):
+        v ^= crc
+        crc = (
+            (v >> 32)
+            ^ t3[v & 0xFF]
+            ^ t2[v >> 8 & 0xFF]
+            ^ t1[v >> 16 & 0xFF]
+            ^ t0[v >> 24 & 0xFF]
+        )
+
+    return crc
+
+
+def _update_by_8(crc: int, data, table: tuple) -> int:
+    t0, t1, t2, t3, t4, t5, t6, t7 = table[:8]
+    for (v,) in _UINT64.iter_unpack(data):
+        v ^= crc
+        crc = (
+            (v >> 64)
+            ^ t7[v & 0xFF]
+            ^ t6[v >> 8 & 0xFF]
+            ^ t5[v >> 16 & 0xFF]
+            ^ t4[v >> 24 & 0xFF]
+            ^ t3[v >> 32 & 0xFF]
+            ^ t2[v >> 40 & 0xFF]
+            ^ t1[v >> 48 & 0xFF]
+            ^ t0[v >> 56 & 0xFF]
+        )
+
+    return crc
+
+
+def _update_by_16(crc: int, data, table: tuple) -> int:
+    t0, t1, t2, t3, t4, t5, t6, t7 = table[:8]
+    t8, t9, t10, t11, t12, t13, t14, t15 = table[8:16]
+    for lo, hi in _UINT128.iter_unpack(data):
+        lo ^= crc & 0xFFFFFFFFFFFFFFFF
+        hi ^= crc >> 64 & 0xFFFFFFFFFFFFFFFF
+        crc = (
+            (crc >> 128)
+            ^ t15[lo & 0xFF]
+            ^ t14[lo >> 8 & 0xFF]
+            ^ t13[lo >> 16 & 0xFF]
+            ^ t12[lo >> 24 & 0xFF]
+            ^ t11[lo >> 32 & 0xFF]
+            ^ t10[lo >> 40 & 0xFF]
+            ^ t9[lo >> 48 & 0xFF]
+            ^ t8[lo >> 56]
+            ^ t7[hi & 0xFF]
+            ^ t6[hi >> 8 & 0xFF]
+            ^ t5[hi >> 16 & 0xFF]
+            ^ t4[hi >> 24 & 0xFF]
+            ^ t3[hi >> 32 & 0xFF]
+            ^ t2[hi >> 40 & 0xFF]
+            ^ t1[hi >> 48 & 0xFF]
+            ^ t0[hi >> 56]
+        )
+
+    return crc
+
+
+_ENGINES = {
+    1: _update_by_1,
+    4: _update_by_4,
+    8: _update_by_8,
+    16: _update_by_16,
+}
+
+
+def update(crc: int, data, table: tuple, slices: int = 4) -> int:
+    """
+    Feeds a buffer through the reflected CRC register.
+    :param crc: The current (reflected) CRC register.
+    :param data: Any object supporting the buffer protocol.
+    :param table: The tables returned by tables().
+    :param slices: The number of bytes to consume per lookup round.
+    :return: The updated (reflected) CRC register.
+    """
+    assert slices in _ENGINES, f"Slices must be one of {SLICES}"
+
+    view = memoryview(data).cast("B")
+    head = len(view) - len(view) % slices
+
+    crc = _ENGINES[slices](crc, view[:head], table)
+    return _update_by_1(crc, view[head:], table)
@@ -1,2 +1,8 @@
 from BitWaffle.CRC.Algorithms import Algorithm, Algorithms  # noqa F401
-from BitWaffle.CRC.CRC import CRC, compute  # noqa F401
+from BitWaffle.CRC.Backends import Backend, register, select  # noqa F401
+from BitWaffle.CRC.CRC import CRC, compute, compute_file  # noqa F401
+from BitWaffle.CRC.Combine import combine, compute_parallel, patch  # noqa F401
+from BitWaffle.CRC.Batch import compute_many  # noqa F401
+from BitWaffle.CRC.Search import search  # noqa F401
+from BitWaffle.CRC.Correction import SyndromeIndex, correct  # noqa F401
+from BitWaffle.CRC.Stream import FrameReader, encode_frame  # noqa F401
@@ -1,32 +1,346 @@
-from typing import Any
+import threading
+from collections import namedtuple
+from functools import partial
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from math import gcd, lcm
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
 
-from ticker import Ticker
+from BitWaffle.Util.Ticker import CATCH_UP, SLEEP_PRECISION, ThreadTicker
+
+# The items of a minor frame with their declared budget, the longest the
+# frame took to run and how many times it ran into the next one.
+SlotUsage = namedtuple("SlotUsage", "items budget worst overruns")
+
+# How many times an item ran, finished past its deadline or was dropped
+# before running, with its mean and worst latency from the start of its
+# minor frame to its end.
+Latency = namedtuple("Latency", "runs late cancelled mean worst")
+
+_Entry = namedtuple("_Entry", "item frequency budget")
+
+
+def _compile(
+    entries: list[_Entry], frame_ns: int, workers: int
+) -> tuple[int, list[list[int]]]:
+    """
+    Spreads items over the minor frames of one hyperperiod.
+
+    There are lcm(frequencies) minor frames per frame and the table repeats
+    gcd(frequencies) times in it. An item of frequency f runs every
+    lcm / f minor frames. Items are placed most frequent first, which also
+    orders each minor frame rate monotonically, each at the phase whose
+    busiest minor frame has the least budget, then the fewest items.
+    :param entries: The registered items.
+    :param frame_ns: The length of a frame in nanoseconds.
+    :param workers: The number of items that can run at once.
+    :return: The number of minor frames per frame and the indexes of the
+             entries run in each minor frame of the table.
+    :raises ValueError: If the items do not fit.
+    """
+    frequencies = [entry.frequency for entry in entries] or [1]
+    minor_frames = lcm(*frequencies)
+    minor_ns = frame_ns // minor_frames
+
+    needed = sum(entry.budget * entry.frequency for entry in entries)
+    if needed > frame_ns * workers:
+        raise ValueError(
+            f"Items need {needed / 1e9}s of {workers} workers each {frame_ns / 1e9}s frame"
+        )
+
+    table = [[] for _ in range(minor_frames // gcd(*frequencies))]
+    load = [(0, 0)] * len(table)
+
+    order = sorted(range(len(entries)), key=lambda i: -entries[i].frequency)
+    for i in order:
+        entry = entries[i]
+        if entry.budget > minor_ns:
+            raise ValueError(
+                f"{entry.item!r} is longer than a {minor_ns / 1e9}s minor frame"
+            )
+
+        stride = minor_frames // entry.frequency
+        phase = min(range(stride), key=lambda p: max(load[p::stride]))
+        for slot in range(phase, len(table), stride):
+            table[slot].append(i)
+            load[slot] = (load[slot][0] + entry.budget, load[slot][1] + 1)
+
+    busiest = max(load)[0]
+    if busiest > minor_ns * workers:
+        raise ValueError(
+            f"A minor frame needs {busiest / 1e9}s of {workers} workers for {minor_ns / 1e9}s"
+        )
+
+    return minor_frames, table
 
 
 class Frame:
-    def __init__(self, frame_time: float = 1.0):
-        self.__frame_time: float = frame_time
-        self.__minor_frames: list = [None]
-        self.__ticker: Ticker = Ticker(interval=frame_time / 1.0)
-        self.__ticker.start()
+    """A cyclic executive running items at whole multiples of a frame rate.
+
+    Adding an item compiles every item into a table of minor frames, rejecting
+    items that would not fit. Running dispatches one minor frame of the table
+    on each tick, so the work per tick is the items due and nothing else.
+
+    Items run one after the other in the ticking thread, or with workers all
+    at once on a thread or process pool. Each item has a deadline, its budget
+    or else the end of its minor frame. Pooled items still queued at their
+    deadline are cancelled, and items still running are left to finish but
+    flagged late, and are not started again until they do.
+    """
+
+    def __init__(
+        self,
+        frame_time: float = 1.0,
+        precision: float = SLEEP_PRECISION,
+        mode: Optional[str] = None,
+        workers: int = 0,
+        processes: bool = False,
+    ):
+        """
+        Creates a Frame.
+        :param frame_time: The number of seconds in a frame.
+        :param precision: The min number of seconds between checking for ticks.
+        :param mode: How the ticker waits for ticks, see Ticker.
+        :param workers: The size of the pool items run on, 0 to run them in turn
+                        in the ticking thread.
+        :param processes: True for a process pool, which needs items and the
+                          function given to run to be picklable.
+        """
+        assert workers >= 0, "Workers cannot be negative"
+
+        self.__frame_ns: int = int(frame_time * 1e9)
+        self.__precision: float = precision
+        self.__mode: Optional[str] = mode
+        self.__workers: int = workers
+        self.__processes: bool = processes
+
+        # Latency measurements come from pool threads as well as the ticking one.
+        self.__lock = threading.Lock()
+
+        self.__entries: list[_Entry] = []
+        self.__compile(self.__entries)
+
+    @property
+    def frame_time(self) -> float:
+        """Retrieves the number of seconds in a frame."""
+        return self.__frame_ns / 1e9
+
+    @property
+    def minor_frame(self) -> float:
+        """Retrieves the number of seconds in a minor frame."""
+        return self.__minor_ns / 1e9
+
+    @property
+    def table(self) -> tuple[tuple[Any, ...], ...]:
+        """Retrieves the items run in each minor frame of the repeating table."""
+        return self.__table
+
+    @property
+    def overruns(self) -> int:
+        """Retrieves the number of minor frames that ran into the next one."""
+        return sum(self.__overruns)
+
+    @property
+    def usage(self) -> list[SlotUsage]:
+        """Retrieves the declared budget and measured use of each minor frame."""
+        return [
+            SlotUsage(
+                items,
+                sum(self.__entries[i].budget for i in slot) / 1e9,
+                worst / 1e9,
+                overruns,
+            )
+            for items, slot, worst, overruns in zip(
+                self.__table, self.__slots, self.__worst, self.__overruns
+            )
+        ]
+
+    @property
+    def latency(self) -> list[Latency]:
+        """Retrieves the latency of each item, in the order they were added."""
+        with self.__lock:
+            return [
+                Latency(
+                    runs,
+                    late,
+                    cancelled,
+                    total / runs / 1e9 if runs else 0.0,
+                    worst / 1e9,
+                )
+                for runs, late, cancelled, total, worst in self.__latency
+            ]
+
+    def add_item(self, item: Any, frequency: int, budget: float = 0.0) -> None:
+        """
+        Adds an item to the schedule.
+        :param item: The item, passed to the function given to run.
+        :param frequency: The number of times the item runs each frame.
+        :param budget: The most seconds the item is expected to take, which is
+                       also its deadline from the start of its minor frame.
+        :raises ValueError: If the schedule would no longer fit in its frames.
+        """
+        assert (
+            isinstance(frequency, int) and frequency > 0
+        ), "Frequency must be a positive int"
+        assert budget >= 0, "Budget cannot be negative"
+
+        self.__compile(self.__entries + [_Entry(item, frequency, int(budget * 1e9))])
+
+    def __compile(self, entries: list[_Entry]) -> None:
+        """
+        Replaces the schedule, leaving the current one untouched if the new one does not fit.
+        :param entries: Every item of the new schedule.
+        """
+        minor_frames, slots = _compile(entries, self.__frame_ns, max(self.__workers, 1))
+
+        self.__entries = entries
+        self.__slots: list[list[int]] = slots
+        self.__table = tuple(tuple(entries[i].item for i in slot) for slot in slots)
+        self.__minor_frames: int = minor_frames
+        self.__minor_ns: int = self.__frame_ns // minor_frames
+
+        self.__worst: list[int] = [0] * len(slots)
+        self.__overruns: list[int] = [0] * len(slots)
+
+        # Runs, late runs, cancelled runs, total and worst latency of each entry.
+        self.__latency: list[list[int]] = [[0] * 5 for _ in entries]
+
+    def __deadline(self, i: int) -> int:
+        """Retrieves the nanoseconds entry i has from the start of its minor frame."""
+        return self.__entries[i].budget or self.__minor_ns
+
+    def __finished(self, i: int, start: int) -> None:
+        """
+        Records a run of entry i ending now.
+        :param i: The entry.
+        :param start: The start of the minor frame the run belongs to.
+        """
+        latency = perf_counter_ns() - start
+        with self.__lock:
+            metrics = self.__latency[i]
+            metrics[0] += 1
+            metrics[1] += latency > self.__deadline(i)
+            metrics[3] += latency
+            metrics[4] = max(metrics[4], latency)
+
+    def __done(self, i: int, start: int, future: Future) -> None:
+        """Records a pooled run of entry i that finished or was cancelled."""
+        if not future.cancelled():
+            self.__finished(i, start)
+
+    def __cancelled(self, i: int) -> None:
+        """Records a run of entry i dropped before it started."""
+        with self.__lock:
+            self.__latency[i][2] += 1
+
+    def __run_serial(
+        self, slot: int, start: int, f: Callable, args: tuple, kwargs: dict
+    ) -> None:
+        """
+        Runs the items of a minor frame one after the other.
+        :param slot: The minor frame of the table.
+        :param start: The time the minor frame started.
+        """
+        for i in self.__slots[slot]:
+            f(self.__entries[i].item, *args, **kwargs)
+            self.__finished(i, start)
+
+    def __run_pool(
+        self,
+        slot: int,
+        start: int,
+        f: Callable,
+        args: tuple,
+        kwargs: dict,
+        pool: Executor,
+        running: dict[int, Future],
+    ) -> None:
+        """
+        Runs the items of a minor frame at once on a pool, waiting for each
+        until its deadline at most.
+        :param slot: The minor frame of the table.
+        :param start: The time the minor frame started.
+        :param pool: The pool to run the items on.
+        :param running: The late items still running, by entry.
+        """
+        futures = []
+        for i in self.__slots[slot]:
+            if i in running:
+                if not running[i].done():
+                    self.__cancelled(i)
+                    continue
+                del running[i]
+
+            future = pool.submit(f, self.__entries[i].item, *args, **kwargs)
+            future.add_done_callback(partial(self.__done, i, start))
+            futures.append((start + self.__deadline(i), i, future))
+
+        for deadline, i, future in sorted(futures, key=lambda x: x[0]):
+            wait([future], timeout=max(deadline - perf_counter_ns(), 0) / 1e9)
+            if future.done():
+                future.result()
+            elif future.cancel():
+                self.__cancelled(i)
+            else:
+                running[i] = future
 
-    def __del__(self):
-        self.__ticker.stop()
+    def run(self, count: int, f: Callable[..., Any], *args, **kwargs) -> None:
+        """
+        Runs frames, calling f with each item in the minor frames it is due.
+        A minor frame that runs into the next one counts as an overrun, and the
+        next one then starts straight away to catch up with the table.
+        :param count: The number of frames to run.
+        :param f: Called as f(item, *args, **kwargs).
+        """
+        pool, running = None, {}
+        if self.__workers:
+            executor = ProcessPoolExecutor if self.__processes else ThreadPoolExecutor
+            pool = executor(max_workers=self.__workers)
 
-    def add_item(self, item: Any, frequency: float):
-        count = frequency // frequency
+        table = self.__table
+        ticker = ThreadTicker(
+            self.__minor_ns / 1e9,
+            precision=self.__precision,
+            mode=self.__mode,
+            overrun=CATCH_UP,
+        )
+        tick, stats = ticker.tick, ticker.stats
 
-    def run(self, count: int, f: callable, *args, **kwargs):
-        while count > 0:
-            for minor_frame in self.__minor_frames:
-                self.__ticker.wait()
+        ticker.start()
+        try:
+            for minor in range(count * self.__minor_frames):
+                with tick:
+                    tick.wait_for(lambda: stats.ticks > minor)
 
-                if minor_frame is not None:
-                    f(minor_frame, *args, **kwargs)
+                start = perf_counter_ns()
+                slot = minor % len(table)
+                if pool:
+                    self.__run_pool(slot, start, f, args, kwargs, pool, running)
+                else:
+                    self.__run_serial(slot, start, f, args, kwargs)
 
-            count = count - 1
+                self.__worst[slot] = max(self.__worst[slot], perf_counter_ns() - start)
+                if stats.ticks > minor + 1:
+                    self.__overruns[slot] += 1
+        finally:
+            ticker.stop()
+            ticker.join()
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
 
 
-f = Frame()
+if __name__ == "__main__":
+    frame = Frame(0.1)
+    frame.add_item("fast", 4)
+    frame.add_item("medium", 2)
+    frame.add_item("slow", 1)
 
-f.run(1, print)
+    print(frame.table)
+    frame.run(2, print)
+    print(frame.usage)
@@ -1,31 +1,127 @@
+from BitWaffle.Util.Division import poly_mod
+
+
+# Operands with fewer bits than this multiply with the windowed method, larger ones with Karatsuba.
+KARATSUBA_THRESHOLD = 1 << 12
+
+# Bits of the multiplier consumed per step of the windowed method, wider for long multipliers.
+WINDOW = 4
+WIDE_WINDOW = 8
+WIDE_WINDOW_THRESHOLD = 1 << 11
+
+# Every byte with a zero bit inserted above each of its bits, the square of the byte.
+_SQUARES = tuple(
+    sum(((byte >> i) & 1) << 2 * i for i in range(8)).to_bytes(2, "big")
+    for byte in range(0x100)
+)
+
+
+def _windowed(a: int, b: int, window: int) -> int:
+    """
+    Carry-less multiplication consuming window bits of b at a time.
+    :param a: The multiplicand.
+    :param b: The multiplier.
+    :param window: The number of bits per step, the table of multiples of a has 2 ** window entries.
+    :return: The product.
+    """
+    table = [0] * (1 << window)
+    for i in range(window):
+        step = 1 << i
+        shifted = a << i
+        for j in range(step):
+            table[step + j] = table[j] ^ shifted
+
+    mask = (1 << window) - 1
+    top = b.bit_length() - 1
+
+    r = 0
+    for shift in range(top - top % window, -1, -window):
+        r = (r << window) ^ table[(b >> shift) & mask]
+
+    return r
+
+
+def _multiply(a: int, b: int) -> int:
+    """
+    Carry-less multiplication, splitting large operands with Karatsuba.
+    :param a: The first polynomial.
+    :param b: The second polynomial.
+    :return: The product.
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+
+    if not b:
+        return 0
+
+    if b.bit_length() < KARATSUBA_THRESHOLD:
+        wide = b.bit_length() >= WIDE_WINDOW_THRESHOLD
+        return _windowed(a, b, WIDE_WINDOW if wide else WINDOW)
+
+    # a * b = (a1 * b1) x ** 2h + (a1 * b0 + a0 * b1) x ** h + a0 * b0
+    half = a.bit_length() // 2
+    mask = (1 << half) - 1
+    a1, a0, b1, b0 = a >> half, a & mask, b >> half, b & mask
+
+    high, low = _multiply(a1, b1), _multiply(a0, b0)
+    middle = _multiply(a1 ^ a0, b1 ^ b0) ^ high ^ low
+
+    return (high << 2 * half) ^ (middle << half) ^ low
+
+
+def _square(a: int) -> int:
+    """
+    Squares a polynomial, which only spreads its bits apart in GF(2).
+    :param a: The polynomial.
+    :return: The square.
+    """
+    data = a.to_bytes(-(-a.bit_length() // 8), "big")
+    return int.from_bytes(b"".join(_SQUARES[byte] for byte in data), "big")
+
+
+def _divmod(a: int, b: int) -> tuple[int, int]:
+    """
+    Long division by shifting the divisor under the leading term of the dividend.
+    :param a: The dividend.
+    :param b: The divisor.
+    :return: The quotient and the remainder.
+    """
+    if not b:
+        raise ZeroDivisionError("Division by the zero polynomial")
+
+    degree, quotient = b.bit_length(), 0
+    while a.bit_length() >= degree:
+        shift = a.bit_length() - degree
+        a ^= b << shift
+        quotient |= 1 << shift
+
+    return quotient, a
+
+
 class BinaryPolynomial(int):
-    def __len__(self):
-        try:
-            return self.size
+    """A polynomial over GF(2), bit i holding the coefficient of X^i."""
 
-        except AttributeError:
-            mask, self.size = 1, 0
-            while mask <= self:
-                mask = mask << 1
-                self.size = self.size + 1
+    __slots__ = ()
 
-            return self.size
+    @property
+    def degree(self) -> int:
+        """Retrieves the degree of the polynomial, -1 for the zero polynomial."""
+        return self.bit_length() - 1
+
+    def __len__(self):
+        return self.bit_length()
 
     def __getitem__(self, item):
         return bool(self & (1 << (len(self) - 1 - item)))
 
     def __str__(self) -> str:
-        ret = [
-            f"X^{len(self)-coef-1}" for coef in range(len(self) - 2)[::-1] if self[coef]
+        terms = [
+            "1" if i == 0 else "X" if i == 1 else f"X^{i}"
+            for i in range(self.degree, -1, -1)
+            if self >> i & 1
         ]
 
-        if self[len(self) - 2]:
-            ret += "X"
-
-        if self[len(self) - 1]:
-            ret += "1"
-
-        return f"BinaryPolynomial({' + '.join(ret)})"
+        return f"BinaryPolynomial({' + '.join(terms) if terms else '0'})"
 
     def __repr__(self):
         return f"{self:0{len(self)}b}"
@@ -33,16 +129,59 @@ class BinaryPolynomial(int):
     def __add__(self, other):
         return BinaryPolynomial(self ^ other)
 
-    __sub__ = __add__
+    __radd__ = __sub__ = __rsub__ = __add__
 
     def __mul__(self, other):
-        product = BinaryPolynomial(0)
-        while self and other:
-            if other & 0b1:
-                product += self
+        return BinaryPolynomial(_multiply(int(self), int(other)))
+
+    __rmul__ = __mul__
+
+    def __divmod__(self, other):
+        quotient, remainder = _divmod(int(self), int(other))
+        return BinaryPolynomial(quotient), BinaryPolynomial(remainder)
+
+    def __rdivmod__(self, other):
+        return BinaryPolynomial(other).__divmod__(self)
 
-            other = other >> 1
-            carry = None
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __rfloordiv__(self, other):
+        return divmod(BinaryPolynomial(other), self)[0]
+
+    def __mod__(self, other):
+        return BinaryPolynomial(_divmod(int(self), int(other))[1])
+
+    def __rmod__(self, other):
+        return BinaryPolynomial(other) % self
+
+    def __pow__(self, exponent, modulus=None):
+        """Raises the polynomial to a power, reducing modulo a polynomial if given."""
+        assert exponent >= 0, "Polynomials have no negative powers"
+
+        # Reductions go through the division tables cached for the modulus.
+        def reduce(a: int) -> int:
+            return poly_mod(a, modulus) if modulus is not None else a
+
+        base, result = reduce(int(self)), reduce(1)
+        for bit in range(exponent.bit_length() - 1, -1, -1):
+            result = reduce(_square(result))
+            if exponent >> bit & 1:
+                result = reduce(_multiply(result, base))
+
+        return BinaryPolynomial(result)
+
+    def gcd(self, other) -> "BinaryPolynomial":
+        """
+        Finds the greatest common divisor with Euclid's algorithm.
+        :param other: The other polynomial.
+        :return: The greatest common divisor.
+        """
+        a, b = int(self), int(other)
+        while b:
+            a, b = b, _divmod(a, b)[1]
+
+        return BinaryPolynomial(a)
 
 
 if __name__ == "__main__":
@@ -53,6 +192,4 @@ if __name__ == "__main__":
 
     print(repr(p))
     print(str(p))
-    # print(p[0])
-
-    # for i in p: print(i)
+    print(p * p, p**3, divmod(p**3, BinaryPolynomial(0b11)))
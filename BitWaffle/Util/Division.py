@@ -0,0 +1,176 @@
+from functools import cache
+
+
+@cache
+def tables(divisor: int) -> tuple[tuple[int, ...], bytes]:
+    """
+    Builds the byte-at-a-time long division tables for a GF(2) divisor of any degree.
+
+    Entry h of both tables describes h * x ** d divided by the divisor, where d is
+    the degree of the divisor: the remainder, and the quotient which always fits in
+    a byte. The tables only depend on the divisor so they are built once and shared.
+    :param divisor: The divisor, including its leading term.
+    :return: The remainder and quotient tables of 256 entries each.
+    """
+    if not divisor:
+        raise ZeroDivisionError("Division by the zero polynomial")
+
+    degree = divisor.bit_length() - 1
+
+    remainders, quotients = [], bytearray()
+    for h in range(0x100):
+        r, q = h << degree, 0
+        for bit in range(7, -1, -1):
+            if r >> (degree + bit) & 1:
+                r ^= divisor << bit
+                q |= 1 << bit
+
+        remainders.append(r)
+        quotients.append(q)
+
+    return tuple(remainders), bytes(quotients)
+
+
+class Divider:
+    """Divides a GF(2) polynomial streamed in as bytes or bits, most significant bit first."""
+
+    def __init__(self, divisor: int, quotient: bool = False) -> None:
+        """
+        Creates a Divider.
+        :param divisor: The divisor, including its leading term.
+        :param quotient: True to keep the quotient, which grows with the dividend.
+        """
+        self.__remainders, self.__quotients = tables(divisor)
+        self.__divisor: int = divisor
+        self.__degree: int = divisor.bit_length() - 1
+        self.__mask: int = (1 << self.__degree) - 1
+
+        self.__remainder: int = 0
+
+        # Whole quotient bytes, followed by fewer than 8 bits waiting to fill the next.
+        self.__quotient: bytearray | None = bytearray() if quotient else None
+        self.__pending: int = 0
+        self.__pending_bits: int = 0
+
+    @property
+    def divisor(self) -> int:
+        """Retrieves the divisor."""
+        return self.__divisor
+
+    @property
+    def remainder(self) -> int:
+        """Retrieves the remainder of everything divided so far."""
+        return self.__remainder
+
+    @property
+    def quotient(self) -> int:
+        """Retrieves the quotient of everything divided so far."""
+        if self.__quotient is None:
+            raise ValueError("Divider was created without keeping the quotient")
+
+        high = int.from_bytes(self.__quotient, "big")
+        return high << self.__pending_bits | self.__pending
+
+    def update(self, data: bytes) -> None:
+        """
+        Appends bytes to the dividend.
+        :param data: The bytes, most significant first.
+        """
+        remainders, quotients = self.__remainders, self.__quotients
+        degree, mask = self.__degree, self.__mask
+
+        r = self.__remainder
+        if self.__quotient is None:
+            for byte in data:
+                value = r << 8 | byte
+                r = remainders[value >> degree] ^ (value & mask)
+        else:
+            high = bytearray()
+            for byte in data:
+                value = r << 8 | byte
+                h = value >> degree
+                r = remainders[h] ^ (value & mask)
+                high.append(quotients[h])
+            self.__push_bytes(high)
+
+        self.__remainder = r
+
+    def update_bits(self, value: int, count: int) -> None:
+        """
+        Appends bits to the dividend.
+        :param value: The bits, most significant first.
+        :param count: The number of bits.
+        """
+        assert 0 <= value < 1 << count, "Value does not fit in count bits"
+
+        # Whole bytes go through the tables, the leading odd bits bit by bit.
+        extra = count % 8
+        r, divisor, degree = self.__remainder, self.__divisor, self.__degree
+        for bit in range(count - 1, count - extra - 1, -1):
+            r = r << 1 | (value >> bit & 1)
+            q = r >> degree
+            if q:
+                r ^= divisor
+            self.__push_bit(q)
+        self.__remainder = r
+
+        whole = count - extra
+        if whole:
+            self.update((value & ((1 << whole) - 1)).to_bytes(whole // 8, "big"))
+
+    def __push_bytes(self, data: bytearray) -> None:
+        """Appends whole bytes of quotient behind any pending bits."""
+        bits = self.__pending_bits
+        if not bits:
+            self.__quotient += data
+            return
+
+        value = self.__pending << 8 * len(data) | int.from_bytes(data, "big")
+        self.__quotient += (value >> bits).to_bytes(len(data), "big")
+        self.__pending = value & ((1 << bits) - 1)
+
+    def __push_bit(self, bit: int) -> None:
+        """Appends a single quotient bit, completing a byte every 8 bits."""
+        if self.__quotient is None:
+            return
+
+        self.__pending = self.__pending << 1 | bit
+        self.__pending_bits += 1
+        if self.__pending_bits == 8:
+            self.__quotient.append(self.__pending)
+            self.__pending = self.__pending_bits = 0
+
+
+def _dividend(dividend: bytes | int) -> bytes:
+    """Converts an int dividend to bytes, most significant first."""
+    if isinstance(dividend, int):
+        assert dividend >= 0, "Polynomials cannot be negative"
+        return dividend.to_bytes(-(-dividend.bit_length() // 8), "big")
+
+    return dividend
+
+
+def poly_mod(dividend: bytes | int, divisor: int) -> int:
+    """
+    Computes the remainder of GF(2) polynomial division.
+    :param dividend: The dividend, as an int or as bytes most significant bit first.
+    :param divisor: The divisor, including its leading term.
+    :return: The remainder.
+    """
+    divider = Divider(divisor)
+    divider.update(_dividend(dividend))
+
+    return divider.remainder
+
+
+def poly_divmod(dividend: bytes | int, divisor: int) -> tuple[int, int]:
+    """
+    Computes the quotient and remainder of GF(2) polynomial division.
+    :param dividend: The dividend, as an int or as bytes most significant bit first.
+    :param divisor: The divisor, including its leading term.
+    :return: The quotient and the remainder.
+    """
+    divider = Divider(divisor, quotient=True)
+    divider.update(_dividend(dividend))
+
+    return divider.quotient, divider.remainder
@@ -1,7 +1,222 @@
-from collections.abc import Iterable
+from collections.abc import Iterator
 from functools import cache
 
-from BitWaffle.Util.Primes import simple_sieve
+from BitWaffle.Util.Division import poly_mod
+from BitWaffle.Util.Primes import prime_factors
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency.
+    np = None
+
+
+# Fields with more elements than 2 ** MAX_TABLE_BITS multiply without tables.
+MAX_TABLE_BITS = 20
+
+
+def _mod(a: int, b: int) -> int:
+    """
+    Reduces a GF(2) polynomial modulo another.
+    :param a: The dividend.
+    :param b: The divisor.
+    :return: The remainder.
+    """
+    degree = b.bit_length()
+    while a.bit_length() >= degree:
+        a ^= b << (a.bit_length() - degree)
+
+    return a
+
+
+def _gcd(a: int, b: int) -> int:
+    """
+    Finds the greatest common divisor of two GF(2) polynomials.
+    :param a: The first polynomial.
+    :param b: The second polynomial.
+    :return: The greatest common divisor.
+    """
+    while b:
+        a, b = b, _mod(a, b)
+
+    return a
+
+
+def _mulmod(a: int, b: int, f: int) -> int:
+    """
+    Multiplies two GF(2) polynomials modulo f, both already reduced modulo f.
+    :param a: The first polynomial.
+    :param b: The second polynomial.
+    :param f: The modulus.
+    :return: The product modulo f.
+    """
+    top = 1 << (f.bit_length() - 1)
+
+    r = 0
+    while b:
+        if b & 1:
+            r ^= a
+
+        a, b = a << 1, b >> 1
+        if a & top:
+            a ^= f
+
+    return r
+
+
+def _powmod(a: int, n: int, f: int) -> int:
+    """
+    Raises a GF(2) polynomial to an integer power modulo f.
+    :param a: The polynomial, already reduced modulo f.
+    :param n: The power.
+    :param f: The modulus.
+    :return: The power modulo f.
+    """
+    r = 1
+    while n:
+        if n & 1:
+            r = _mulmod(r, a, f)
+
+        a, n = _mulmod(a, a, f), n >> 1
+
+    return r
+
+
+def _frobenius(k: int, f: int) -> int:
+    """
+    Computes x ** (2 ** k) modulo f by squaring x k times.
+    :param k: The number of squarings.
+    :param f: The modulus.
+    :return: The power modulo f.
+    """
+    x = _mod(0b10, f)
+    for _ in range(k):
+        x = _mulmod(x, x, f)
+
+    return x
+
+
+@cache
+def _distinct_prime_factors(n: int) -> tuple[int, ...]:
+    """Memoized distinct prime factors of n."""
+    return tuple(sorted(set(prime_factors(n))))
+
+
+def is_irreducible(f: int) -> bool:
+    """
+    Rabin's irreducibility test for a GF(2) polynomial of degree m.
+    f is irreducible iff x ** (2 ** m) = x modulo f and x ** (2 ** (m / p)) - x
+    shares no factor with f for every prime p dividing m.
+    :param f: The polynomial, including the x ** m term.
+    :return: True if f is irreducible.
+    """
+    m = f.bit_length() - 1
+    if m < 1:
+        return False
+    if m == 1:
+        return True
+    if not f & 1:  # Divisible by x.
+        return False
+
+    x = _mod(0b10, f)
+    if _frobenius(m, f) != x:
+        return False
+
+    return all(
+        _gcd(f, _frobenius(m // p, f) ^ x) == 1 for p in _distinct_prime_factors(m)
+    )
+
+
+def is_primitive(f: int) -> bool:
+    """
+    Checks if x generates the multiplicative group of GF(2)[x] / f.
+    f must be irreducible and x ** ((2 ** m - 1) / q) != 1 modulo f for every
+    prime q dividing 2 ** m - 1.
+    :param f: The polynomial, including the x ** m term.
+    :return: True if f is primitive.
+    """
+    if not is_irreducible(f):
+        return False
+
+    n = (1 << (f.bit_length() - 1)) - 1
+    x = _mod(0b10, f)
+
+    return all(_powmod(x, n // q, f) != 1 for q in _distinct_prime_factors(n))
+
+
+def _search(m: int, test) -> Iterator[int]:
+    """Yields every polynomial of degree m that passes a test, in increasing order."""
+    # Polynomials with an even number of terms are divisible by x + 1.
+    for f in range((1 << m) | 1, 1 << (m + 1), 2):
+        if m < 2 or f.bit_count() & 1:
+            if test(f):
+                yield f
+
+
+@cache
+def _memo(m: int, test) -> tuple[list[int], Iterator[int]]:
+    """Found polynomials and the search that finds more, shared per (m, test)."""
+    return [], _search(m, test)
+
+
+def _memoized(m: int, test) -> Iterator[int]:
+    """Lazily yields polynomials, extending the memo only when it runs out."""
+    found, search = _memo(m, test)
+
+    i = 0
+    while True:
+        if i == len(found):
+            f = next(search, None)
+            if f is None:
+                return
+            found.append(f)
+
+        yield found[i]
+        i += 1
+
+
+def irreducible_polynomials(m: int) -> Iterator[int]:
+    """
+    Lazily generates the irreducible polynomials of degree m in increasing order.
+    :param m: The degree.
+    :return: The polynomials, including the x ** m term.
+    """
+    return _memoized(m, is_irreducible)
+
+
+def primitive_polynomials(m: int) -> Iterator[int]:
+    """
+    Lazily generates the primitive polynomials of degree m in increasing order.
+    :param m: The degree.
+    :return: The polynomials, including the x ** m term.
+    """
+    return _memoized(m, is_primitive)
+
+
+@cache
+def _tables(m: int, primitive: int) -> tuple[list[int], list[int]]:
+    """
+    Builds the exp/log tables of GF(2 ** m) generated by a primitive polynomial.
+    The exp table is doubled in length so products never need a modulo.
+    :param m: The field degree.
+    :param primitive: The primitive polynomial, including the x ** m term.
+    :return: The exp and log tables.
+    """
+    n, q = (1 << m) - 1, 1 << m
+
+    exp, log = [0] * (2 * n), [0] * q
+    x = 1
+    for i in range(n):
+        if i and x == 1:
+            raise ValueError(f"{primitive:#x} is not a primitive polynomial")
+
+        exp[i] = exp[i + n] = x
+        log[x] = i
+
+        x <<= 1
+        if x & q:
+            x ^= primitive
+
+    return exp, log
 
 
 class GaloisField2:
@@ -28,66 +243,116 @@ class GaloisField2:
         return r
 
     @staticmethod
-    def __width(bits: int):
-        mask, size = 1, 0
-        while mask <= bits:
-            mask, size = mask << 1, size + 1
+    def remainder(num: bytes | int, div: int) -> int:
+        """Reduces a polynomial, given as an int or bytes most significant bit first, modulo div."""
+        return poly_mod(num, div)
 
-        return size
+    def __init__(self, m: int = 8, primitive: int = None):
+        """Constructor for a GF(2**k).
+        :param m: The field degree.
+        :param primitive: The primitive polynomial generating the field. Default is the smallest one.
+        """
+        self.m = m
+        self.N = self.a**m - 1
+        self.prime_polynomials = primitive_polynomials(m)
+        self.primitive = primitive if primitive else next(self.prime_polynomials)
 
-    @staticmethod
-    def __reflect_bits(bits: int, width: int) -> int:
-        reflected = 0
-        for i in range(width):
-            reflected |= ((bits >> i) & 1) << (width - i - 1)
+        self.__exp, self.__log = (
+            _tables(m, self.primitive) if m <= MAX_TABLE_BITS else (None, None)
+        )
+        self.__exp_array = self.__log_array = None
 
-        return reflected
+    def mul(self, x: int, y: int) -> int:
+        """Multiplies two field elements."""
+        if not x or not y:
+            return 0
 
-    @staticmethod
-    def div(num: bytes, div: int):
-        @cache
-        def div_byte(b: int):
-            for _ in range(8):
-                b = (b >> 1) ^ div if b & 1 else b >> 1
-            return b
+        if self.__exp is None:
+            return GaloisField2.mult(x, y, self.primitive, self.N + 1)
 
-        width = GaloisField2.__width(div)
-        div = GaloisField2.__reflect_bits(div, width)
+        return self.__exp[self.__log[x] + self.__log[y]]
 
-        rem = 0
-        for byte in num:
-            rem = div_byte((rem ^ byte) & 0xFF) ^ (rem >> 8)
+    def div(self, x: int, y: int) -> int:
+        """Divides two field elements."""
+        if not y:
+            raise ZeroDivisionError("Division by the zero element")
 
-        return rem
+        if not x:
+            return 0
 
-    def __init__(self, m: int = 8):
-        """Constructor for a GF(2**k)."""
-        self.N = self.a**m - 1
-        self.prime_polynomials = self.__generate_prime_polynomials(m)
+        if self.__exp is None:
+            return self.mul(x, self.inv(y))
+
+        return self.__exp[self.__log[x] - self.__log[y] + self.N]
+
+    def inv(self, x: int) -> int:
+        """Finds the multiplicative inverse of a field element."""
+        if not x:
+            raise ZeroDivisionError("The zero element has no inverse")
+
+        if self.__exp is None:
+            return self.pow(x, self.N - 1)
 
-    def __generate_prime_polynomials(self, k: int) -> Iterable[int]:
-        """Generates valid prime polynomials for the field."""
-        # Check each prime between 2 ** k and 2 ** (k+1) - 1.
-        for prime in simple_sieve((self.a ** (k + 1)) - 1):
-            if prime < self.N:
-                continue
+        return self.__exp[self.N - self.__log[x]]
 
-            generated = [False] * self.N
-            conflict = False
+    def pow(self, x: int, n: int) -> int:
+        """Raises a field element to an integer power."""
+        if not x:
+            if n < 0:
+                raise ZeroDivisionError("The zero element has no inverse")
+            return 0 if n else 1
+
+        n %= self.N
+        if self.__exp is not None:
+            return self.__exp[self.__log[x] * n % self.N]
+
+        r = 1
+        while n:
+            if n & 1:
+                r = self.mul(r, x)
+            x, n = self.mul(x, x), n >> 1
+
+        return r
 
-            x = 1
-            for _ in range(self.N - 1):
-                # If (x * 2) % prime generates duplicate values for any x then it is not a prime polynomial.
-                x = GaloisField2.gf_mult(x, self.a, prime, self.N)
+    def __arrays(self):
+        """Retrieves the exp/log tables as numpy arrays."""
+        if np is None:
+            raise ImportError("Vectorized field operations require numpy")
 
-                if x >= self.N or generated[x]:
-                    conflict = True
-                    break
-                else:
-                    generated[x] = True
+        if self.__exp is None:
+            raise ValueError(f"GF(2^{self.m}) is too large for vectorized operations")
 
-            if not conflict:
-                yield prime
+        if self.__exp_array is None:
+            dtype = (
+                np.uint8 if self.m <= 8 else np.uint16 if self.m <= 16 else np.uint32
+            )
+            self.__exp_array = np.array(self.__exp, dtype=dtype)
+            self.__log_array = np.array(self.__log, dtype=np.int64)
+
+        return self.__exp_array, self.__log_array
+
+    def mul_vec(self, x, y):
+        """Multiplies arrays of field elements element-wise."""
+        exp, log = self.__arrays()
+        x, y = np.asarray(x), np.asarray(y)
+
+        product = exp[log[x] + log[y]]
+        return np.where((x == 0) | (y == 0), exp.dtype.type(0), product)
+
+    def dot(self, x, y, axis: int = -1):
+        """Sums the element-wise products of arrays of field elements."""
+        return np.bitwise_xor.reduce(self.mul_vec(x, y), axis=axis)
+
+    def poly_eval(self, coefficients, x):
+        """Evaluates a polynomial, highest degree coefficient first, at an array of field elements."""
+        exp, _ = self.__arrays()
+        x = np.asarray(x)
+
+        result = np.zeros(x.shape, dtype=exp.dtype)
+        for coefficient in coefficients:
+            result = self.mul_vec(result, x) ^ exp.dtype.type(coefficient)
+
+        return result
 
 
 if __name__ == "__main__":
@@ -96,4 +361,7 @@ if __name__ == "__main__":
 
     print(a, b)
 
-    print(f"{GaloisField2.div(a, b):0b}")
+    print(f"{GaloisField2.remainder(a, b):0b}")
+
+    gf = GaloisField2(8)
+    print(f"{gf.primitive:b}", gf.mul(0x53, 0xCA), gf.inv(0x53))
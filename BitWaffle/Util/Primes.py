@@ -1,4 +1,34 @@
+from array import array
+from bisect import bisect_right
 from collections.abc import Iterable
+from functools import cache, lru_cache
+from itertools import compress, count
+from math import gcd, isqrt, log, prod
+from threading import Lock
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency.
+    np = None
+
+
+# Number of odd numbers sieved at a time by primes_in_range(), one byte each.
+SEGMENT_SIZE = 1 << 18
+
+# Primes below this bound are trial divided before Miller-Rabin.
+SMALL_PRIME_BOUND = 1000
+
+# Miller-Rabin bases that are deterministic for every n < 2 ** 64 (Jim Sinclair).
+MILLER_RABIN_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# Number of Pollard rho steps multiplied together between gcds.
+RHO_BATCH = 128
+
+# Number of factorizations kept by prime_factors().
+FACTOR_CACHE_SIZE = 1024
+
+# prime_pi() and nth_prime() answer from the prime cache below this bound, and count beyond it.
+PRIME_CACHE_LIMIT = 1 << 24
 
 
 def probably_prime() -> Iterable[int]:
@@ -12,82 +42,468 @@ def probably_prime() -> Iterable[int]:
         i += 6
 
 
-def is_prime(n: int) -> bool:
+def _odd_primes(n: int) -> list[int]:
+    """
+    Sieves the odd primes below n in one go, used for the base primes of a segmented sieve.
+    :param n: The exclusive upper bound.
+    :return: The odd primes below n.
+    """
     if n <= 3:
-        return n in [2, 3]
+        return []
 
-    for d in probably_prime():
-        if d**2 > n:
-            return True
-        if n % d == 0:
+    # Index i stands for 2 * i + 1.
+    sieve = bytearray([1]) * (n // 2)
+    sieve[0] = 0
+    for i in range(1, (isqrt(n - 1) - 1) // 2 + 1):
+        if sieve[i]:
+            start = (2 * i + 1) ** 2 // 2
+            sieve[start :: 2 * i + 1] = bytes(len(range(start, len(sieve), 2 * i + 1)))
+
+    return list(compress(range(1, n, 2), sieve))
+
+
+@cache
+def _small_primes() -> tuple[tuple[int, ...], int]:
+    """The primes below SMALL_PRIME_BOUND and their product, shared by every primality test."""
+    primes = (2, *_odd_primes(SMALL_PRIME_BOUND))
+    return primes, prod(primes)
+
+
+def _miller_rabin(n: int, bases: Iterable[int]) -> bool:
+    """
+    Strong probable prime test of an odd n > 2 to each base.
+    :param n: The number to test.
+    :param bases: The bases to test, bases that are multiples of n are skipped.
+    :return: False if any base proves n composite.
+    """
+    d, s = n - 1, 0
+    while not d & 1:
+        d, s = d >> 1, s + 1
+
+    for a in bases:
+        a %= n
+        if not a:
+            continue
+
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
 
+    return True
 
-def prime_factors(n: int) -> Iterable[int]:
-    for d in probably_prime():
-        while n % d == 0:
-            yield d
-            n /= d
 
-        if n == 1:
+def _jacobi(a: int, n: int) -> int:
+    """
+    Computes the Jacobi symbol (a / n) for an odd n > 0.
+    :param a: The numerator.
+    :param n: The denominator.
+    :return: -1, 0 or 1.
+    """
+    a, result = a % n, 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+
+    return result if n == 1 else 0
+
+
+def _strong_lucas(n: int) -> bool:
+    """
+    Strong Lucas probable prime test with Selfridge's parameters, for an odd n not a perfect square.
+    :param n: The number to test.
+    :return: False if n is proven composite.
+    """
+    # The first D in 5, -7, 9, -11, ... with (D / n) = -1.
+    D = 5
+    while True:
+        jacobi = _jacobi(D, n)
+        if jacobi == -1:
             break
+        if jacobi == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+
+    P, Q = 1, (1 - D) // 4
+
+    d, s = n + 1, 0
+    while not d & 1:
+        d, s = d >> 1, s + 1
+
+    def half(x: int) -> int:
+        return (x + n if x & 1 else x) // 2 % n
+
+    # Walk the bits of d, doubling k = 1 and adding one for every set bit.
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V, Qk = half(P * U + V), half(D * U + P * V), Qk * Q % n
+
+    if not U or not V:
+        return True
+
+    for _ in range(s - 1):
+        V, Qk = (V * V - 2 * Qk) % n, Qk * Qk % n
+        if not V:
+            return True
+
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """
+    Tests primality with trial division by small primes, then Miller-Rabin.
+    The Miller-Rabin bases are deterministic below 2 ** 64, beyond that Baillie-PSW
+    is used, which has no known counterexample.
+    :param n: The number to test.
+    :return: True if n is prime.
+    """
+    if n < 2:
+        return False
+
+    primes, primorial = _small_primes()
+    if gcd(n, primorial) != 1:
+        return n <= primes[-1] and n in primes
+    if n < SMALL_PRIME_BOUND**2:
+        return True
+
+    if n < 1 << 64:
+        return _miller_rabin(n, MILLER_RABIN_BASES)
+
+    return _miller_rabin(n, (2,)) and isqrt(n) ** 2 != n and _strong_lucas(n)
+
+
+def are_prime(values) -> list[bool]:
+    """
+    Tests the primality of many numbers.
+    NumPy arrays are trial divided by the small primes all at once, and only the
+    values that survive go through Miller-Rabin.
+    :param values: An iterable of ints or an integer NumPy array.
+    :return: The result for each value, a bool array for NumPy input.
+    """
+    if np is None or not isinstance(values, np.ndarray):
+        return [is_prime(n) for n in values]
+
+    values = np.asarray(values)
+    assert values.dtype.kind in "iu", "Values must be integers"
+
+    primes, _ = _small_primes()
+    result = values >= 2
+    for p in primes:
+        result &= (values % p != 0) | (values == p)
+
+    # Values below the square of the bound that survive are prime.
+    unknown = np.flatnonzero(result & (values >= SMALL_PRIME_BOUND**2))
+    for i in unknown:
+        result[i] = _miller_rabin(int(values[i]), MILLER_RABIN_BASES)
+
+    return result
+
+
+def _brent(n: int) -> int:
+    """
+    Finds a non-trivial factor of an odd composite with Pollard's rho and Brent's cycle detection.
+    :param n: The composite, not a prime power of a small prime.
+    :return: A factor 1 < d < n.
+    """
+    root = isqrt(n)
+    if root * root == n:
+        return root
+
+    for c in count(1):
+        y, r, q, g = c + 1, 1, 1, 1
+        x = ys = y
+
+        # Products of RHO_BATCH differences share one gcd.
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += RHO_BATCH
+            r <<= 1
+
+        # The batch overshot, so step back through it one difference at a time.
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+
+        if g != n:
+            return g
+
+
+@lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def _factorize(n: int) -> tuple[int, ...]:
+    """
+    Memoized prime factorization with trial division by the small primes, then Pollard-Brent.
+    :param n: The number to factorize.
+    :return: The prime factors with multiplicity, in increasing order.
+    """
+    factors = []
+    primes, _ = _small_primes()
+    for p in primes:
+        if p * p > n:
+            break
+
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+
+    composites = [n] if n > 1 else []
+    while composites:
+        m = composites.pop()
+        if m < SMALL_PRIME_BOUND**2 or is_prime(m):
+            factors.append(m)
+        else:
+            d = _brent(m)
+            composites += [d, m // d]
+
+    return tuple(sorted(factors))
+
+
+def prime_factors(n: int) -> Iterable[int]:
+    """
+    Generates the prime factors of n.
+    :param n: The number to factorize.
+    :return: The prime factors with multiplicity, in increasing order.
+    """
+    yield from _factorize(n)
 
 
 def largest_prime_factor(n: int) -> int:
-    return max(prime_factors(n))
+    return _factorize(n)[-1]
+
+
+def primes_in_range(
+    lo: int, hi: int, segment_size: int = SEGMENT_SIZE
+) -> Iterable[int]:
+    """
+    Segmented sieve of Eratosthenes over odd numbers.
+    Memory is the base primes up to sqrt(hi) plus one segment of segment_size bytes.
+    :param lo: The inclusive lower bound.
+    :param hi: The exclusive upper bound.
+    :param segment_size: The number of odd numbers sieved at a time.
+    :return: The primes in [lo, hi), in increasing order.
+    """
+    lo, hi = int(lo), int(hi)
+    if lo <= 2 < hi:
+        yield 2
+
+    lo = max(lo, 3) | 1
+    if lo >= hi:
+        return
+
+    base = _odd_primes(isqrt(hi - 1) + 1)
+
+    for start in range(lo, hi, 2 * segment_size):
+        stop = min(start + 2 * segment_size, hi)
+        size = (stop - start + 1) // 2  # Index i stands for start + 2 * i.
+
+        segment = bytearray([1]) * size
+        for p in base:
+            if p * p >= stop:
+                break
+
+            # The first odd multiple of p in the segment, at least p * p.
+            multiple = max(p * p, -(-start // p) * p)
+            if not multiple & 1:
+                multiple += p
+
+            index = (multiple - start) // 2
+            segment[index::p] = bytes(len(range(index, size, p)))
+
+        yield from compress(range(start, stop, 2), segment)
 
 
 def simple_sieve(n: int) -> Iterable[int]:
-    a = [False, False] + [True for _ in range(n - 1)]
-
-    for i in range(n):
-        if i * i < n:
-            if a[i]:
-                yield i
-                for j in range(i**2, len(a), i):
-                    a[j] = False
-        else:
-            if a[i]:
-                yield i
+    """
+    Generates the primes below n.
+    :param n: The exclusive upper bound.
+    :return: The primes below n, in increasing order.
+    """
+    return primes_in_range(2, n)
+
+
+class _PrimeCache:
+    """Every prime below a limit, shared by the whole process and extended on demand."""
+
+    def __init__(self) -> None:
+        self.primes: array = array("Q")
+        self.limit: int = 2  # Every prime below the limit is cached.
+        self.__lock: Lock = Lock()
+
+    def extend(self, limit: int) -> None:
+        """
+        Sieves the primes below limit that are not cached yet.
+        The cache at least doubles each time so repeated small extensions stay cheap.
+        :param limit: The exclusive upper bound.
+        """
+        with self.__lock:
+            if limit <= self.limit:
+                return
+
+            limit = max(limit, 2 * self.limit)
+            self.primes.extend(primes_in_range(self.limit, limit))
+            self.limit = limit
+
+
+_cache = _PrimeCache()
 
 
 def incremental_sieve() -> Iterable[int]:
-    primes = [[3, 3]]
+    """
+    Generates every prime, extending the shared prime cache one chunk at a time.
+    :return: The primes in increasing order.
+    """
+    i = 0
+    while True:
+        if i == len(_cache.primes):
+            _cache.extend(_cache.limit + 2 * SEGMENT_SIZE)
 
-    for i in probably_prime():
-        _is_prime = True
+        yield _cache.primes[i]
+        i += 1
 
-        for pm in primes:
-            if pm[0] ** 2 > i:
-                break
 
-            while pm[1] < i:
-                pm[1] += pm[0]
+def _lucy(x: int) -> int:
+    """
+    Lucy_Hedgehog's prime counting in pure Python.
+    S(v) starts as the count of 2..v and every prime p removes the numbers whose
+    smallest prime factor is p, for each v in {x // i}.
+    :param x: The inclusive upper bound.
+    :return: The number of primes up to x.
+    """
+    r = isqrt(x)
+    values = [x // i for i in range(1, r + 1)]
+    values += list(range(values[-1] - 1, 0, -1))
+    S = {v: v - 1 for v in values}
 
-            if pm[1] == i:
-                _is_prime = False
-                break
+    for p in range(2, r + 1):
+        if S[p] > S[p - 1]:
+            sp, p2 = S[p - 1], p * p
+            for v in values:
+                if v < p2:
+                    break
+                S[v] -= S[v // p] - sp
+
+    return S[x]
+
+
+def _lucy_numpy(x: int) -> int:
+    """
+    Lucy_Hedgehog's prime counting with one vectorized update per prime.
+    small[v] holds S(v) and large[i] holds S(x // i). Every update only reads
+    values that the sequential algorithm would not have updated yet.
+    :param x: The inclusive upper bound.
+    :return: The number of primes up to x.
+    """
+    r = isqrt(x)
+    small = np.arange(-1, r, dtype=np.int64)
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = x // np.arange(1, r + 1, dtype=np.int64) - 1
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue
+
+        sp, p2 = small[p - 1], p * p
+        end = min(r, x // p2)
+
+        # large[i] needs S(x // (i * p)), in large while i * p <= r, else in small.
+        inner = min(end, r // p)
+        large[1 : inner + 1] -= large[p : inner * p + 1 : p] - sp
+        if end > inner:
+            i = np.arange(inner + 1, end + 1, dtype=np.int64)
+            large[inner + 1 : end + 1] -= small[x // (i * p)] - sp
 
-        if _is_prime:
-            yield i
-            primes += [[i, i]]
+        if p2 <= r:
+            small[p2:] -= small[np.arange(p2, r + 1) // p] - sp
+
+    return int(large[1])
+
+
+def prime_pi(x: int) -> int:
+    """
+    Counts the primes up to x in O(x ** (3 / 4)) with Lucy_Hedgehog's method.
+    Small x are answered from the prime cache.
+    :param x: The inclusive upper bound.
+    :return: The number of primes up to x.
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+
+    if x < _cache.limit or x < PRIME_CACHE_LIMIT:
+        _cache.extend(x + 1)
+        return bisect_right(_cache.primes, x)
+
+    return _lucy_numpy(x) if np is not None else _lucy(x)
 
 
 def nth_prime(n: int) -> int:
-    return next(
-        prime for count, prime in enumerate(incremental_sieve(), 1) if count >= n
-    )
+    """
+    Finds the nth prime, 2 being the first.
+    Small n are read from the prime cache. Larger n start from Dusart's lower
+    bound for p_n, count the primes below it and sieve the short gap to p_n.
+    :param n: The index of the prime.
+    :return: The nth prime.
+    """
+    assert n >= 1, "Primes are counted from 1"
+
+    if n <= len(_cache.primes):
+        return _cache.primes[n - 1]
+
+    # p_n < n (ln n + ln ln n) for n >= 6.
+    ln = log(max(n, 6))
+    upper = int(n * (ln + log(ln))) + 1
+    if upper <= PRIME_CACHE_LIMIT:
+        _cache.extend(upper)
+        return _cache.primes[n - 1]
+
+    # p_n >= n (ln n + ln ln n - 1 + (ln ln n - 2.1) / ln n) for n >= 3 (Dusart 2010).
+    lower = int(n * (ln + log(ln) - 1 + (log(ln) - 2.1) / ln))
+    count = prime_pi(lower - 1)
+    for p in primes_in_range(lower, upper + 1):
+        count += 1
+        if count == n:
+            return p
+
+    raise ArithmeticError(f"Prime {n} not found below {upper}")
 
 
 if __name__ == "__main__":
     import time
 
     start = time.perf_counter()
-    simple_sieve(1e8)
-    print(time.perf_counter() - start)
+    print(sum(1 for _ in simple_sieve(10**8)), time.perf_counter() - start)
 
     start = time.perf_counter()
     for p in incremental_sieve():
-        if p > 1e8:
+        if p > 10**8:
             break
     print(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    print(prime_pi(10**12), nth_prime(10**9), time.perf_counter() - start)
@@ -0,0 +1,253 @@
+from BitWaffle.Util.Galois import GaloisField2
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency.
+    np = None
+
+
+# Codes with at most this many n * 2 ** m * (n - k) entries tabulate syndromes per column.
+MAX_SYNDROME_TABLE = 1 << 22
+
+
+class ReedSolomon:
+    """Systematic Reed-Solomon codec over GF(2 ** m) that works on many codewords at once.
+
+    Codewords are rows of symbols, highest degree coefficient first, with the k
+    message symbols followed by n - k parity symbols. Up to (n - k) // 2 symbol
+    errors per codeword are corrected.
+    """
+
+    def __init__(
+        self,
+        n: int = 255,
+        k: int = 223,
+        m: int = 8,
+        primitive: int = None,
+        fcr: int = 0,
+    ):
+        """Create a codec.
+        :param n: The number of symbols in a codeword, at most 2 ** m - 1.
+        :param k: The number of message symbols in a codeword.
+        :param m: The number of bits in a symbol.
+        :param primitive: The primitive polynomial of the field. Default is the smallest one.
+        :param fcr: The first consecutive root of the generator polynomial, as a power of alpha.
+        """
+        if np is None:
+            raise ImportError("ReedSolomon requires numpy")
+
+        assert 0 < k < n < 2**m, "Code must satisfy 0 < k < n < 2 ** m"
+
+        self.__gf = GaloisField2(m, primitive)
+        self.__n, self.__k, self.__fcr = n, k, fcr
+        self.__nsym = n - k
+
+        # g(x) = (x - a ^ fcr)(x - a ^ (fcr + 1))...(x - a ^ (fcr + n - k - 1))
+        generator = [1]
+        for i in range(self.__nsym):
+            root = self.__gf.pow(2, fcr + i)
+            generator = [
+                c ^ self.__gf.mul(p, root)
+                for c, p in zip(generator + [0], [0] + generator)
+            ]
+        self.__generator = generator
+
+        dtype = np.uint8 if m <= 8 else np.uint16 if m <= 16 else np.uint32
+        self.__dtype = dtype
+
+        # Row f holds f * g(x) without the leading term, the parity feedback for f.
+        symbols = np.arange(2**m, dtype=dtype)
+        self.__feedback = np.stack(
+            [
+                self.__gf.mul_vec(symbols, np.full_like(symbols, c))
+                for c in generator[1:]
+            ],
+            axis=1,
+        )
+
+        # Column j's contribution to syndrome i is c * a ^ ((fcr + i) * (n - 1 - j)),
+        # tabulated for every symbol c when the tables are small enough. Larger
+        # codes run Horner's method with one table per syndrome instead.
+        roots = [self.__gf.pow(2, fcr + i) for i in range(self.__nsym)]
+        if n * len(symbols) * self.__nsym <= MAX_SYNDROME_TABLE:
+            powers = np.array(
+                [[self.__gf.pow(r, n - 1 - j) for r in roots] for j in range(n)],
+                dtype=dtype,
+            )
+            self.__columns = self.__gf.mul_vec(symbols[None, :, None], powers[:, None])
+            self.__horner = None
+        else:
+            self.__columns = None
+            self.__horner = self.__gf.mul_vec(
+                symbols[None, :], np.array(roots)[:, None]
+            )
+            self.__steps = np.arange(self.__nsym)
+
+        # a ^ -e for every degree e of a codeword, the points of the Chien search.
+        self.__chien = np.array([self.__gf.pow(2, -e) for e in range(n)], dtype=dtype)
+
+        self.corrected: int = 0
+        self.failures: int = 0
+
+    @property
+    def n(self) -> int:
+        """Retrieves the number of symbols in a codeword."""
+        return self.__n
+
+    @property
+    def k(self) -> int:
+        """Retrieves the number of message symbols in a codeword."""
+        return self.__k
+
+    @property
+    def generator(self) -> list[int]:
+        """Retrieves the generator polynomial, highest degree coefficient first."""
+        return list(self.__generator)
+
+    def __rows(self, data, length: int):
+        """Converts bytes or arrays to a 2-D array of symbols."""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = np.frombuffer(data, dtype=np.uint8)
+
+        rows = np.atleast_2d(np.asarray(data)).astype(self.__dtype, copy=False)
+        assert rows.shape[1] == length, f"Rows must have {length} symbols"
+
+        return rows
+
+    def encode(self, messages):
+        """Encodes messages by appending parity symbols.
+        :param messages: A (rows, k) array of symbols, or the bytes of one message.
+        :return: A (rows, n) array of codewords.
+        """
+        messages = self.__rows(messages, self.__k)
+
+        # Divide every message by g(x) in lockstep, one symbol column at a time.
+        parity = np.zeros((messages.shape[0], self.__nsym), dtype=self.__dtype)
+        for column in messages.T:
+            feedback = self.__feedback[column ^ parity[:, 0]]
+            parity[:, :-1] = parity[:, 1:]
+            parity[:, -1] = 0
+            parity ^= feedback
+
+        return np.hstack((messages, parity))
+
+    def syndromes(self, codewords):
+        """Evaluates codewords at each root of the generator polynomial.
+        :param codewords: A (rows, n) array of codewords.
+        :return: A (rows, n - k) array of syndromes, all zero for valid codewords.
+        """
+        codewords = self.__rows(codewords, self.__n)
+
+        syndromes = np.zeros((codewords.shape[0], self.__nsym), dtype=self.__dtype)
+        if self.__columns is not None:
+            for table, column in zip(self.__columns, codewords.T):
+                syndromes ^= table[column]
+        else:
+            for column in codewords.T:
+                syndromes = self.__horner[self.__steps, syndromes] ^ column[:, None]
+
+        return syndromes
+
+    def decode(self, codewords):
+        """Corrects and strips the parity from codewords.
+        :param codewords: A (rows, n) array of codewords, or the bytes of one codeword.
+        :return: A (rows, k) array of messages and the number of symbols corrected in
+                 each row, -1 for rows with too many errors to correct (left as received).
+        """
+        codewords = self.__rows(codewords, self.__n).copy()
+        syndromes = self.syndromes(codewords)
+
+        counts = np.zeros(codewords.shape[0], dtype=np.int64)
+        for row in np.flatnonzero(syndromes.any(axis=1)):
+            errors = self.__correct([int(s) for s in syndromes[row]])
+            if errors is None:
+                counts[row] = -1
+                continue
+
+            for position, magnitude in errors:
+                codewords[row, position] ^= magnitude
+            counts[row] = len(errors)
+
+        self.corrected += int(counts[counts > 0].sum())
+        self.failures += int((counts < 0).sum())
+
+        return codewords[:, : self.__k], counts
+
+    def __correct(self, syndromes: list[int]) -> list[tuple[int, int]] | None:
+        """Locates errors with Berlekamp-Massey, Chien search and Forney's algorithm.
+        :param syndromes: The syndromes of one codeword.
+        :return: (position, magnitude) for each error, None if uncorrectable.
+        """
+        gf, n = self.__gf, self.__n
+
+        # Berlekamp-Massey, polynomials are lowest degree coefficient first.
+        locator, previous, length, shift, scale = [1], [1], 0, 1, 1
+        for i, syndrome in enumerate(syndromes):
+            discrepancy = syndrome
+            for j in range(1, length + 1):
+                discrepancy ^= gf.mul(locator[j], syndromes[i - j])
+
+            if not discrepancy:
+                shift += 1
+                continue
+
+            factor = gf.div(discrepancy, scale)
+            update = [0] * shift + [gf.mul(factor, c) for c in previous]
+            updated = [
+                a ^ b
+                for a, b in zip(
+                    locator + [0] * (len(update) - len(locator)),
+                    update + [0] * (len(locator) - len(update)),
+                )
+            ]
+
+            if 2 * length <= i:
+                previous, length, scale, shift = locator, i + 1 - length, discrepancy, 1
+            else:
+                shift += 1
+
+            locator = updated
+
+        locator = locator[: length + 1]
+        if 2 * length > len(syndromes):
+            return None
+
+        # Chien search, an error at degree e is a root of the locator at a ^ -e.
+        roots = gf.poly_eval(locator[::-1], self.__chien) == 0
+        degrees = np.flatnonzero(roots).tolist()
+        if len(degrees) != length:
+            return None
+
+        # Omega(x) = S(x) * Lambda(x) mod x ^ (n - k)
+        evaluator = [0] * len(syndromes)
+        for i, s in enumerate(syndromes):
+            for j, c in enumerate(locator[: len(syndromes) - i]):
+                evaluator[i + j] ^= gf.mul(s, c)
+
+        # Formal derivative, only odd powers survive in characteristic 2.
+        derivative = [c if i & 1 else 0 for i, c in enumerate(locator)][1:]
+
+        errors = []
+        for e in degrees:
+            x = gf.pow(2, e)
+            x_inv = gf.inv(x)
+
+            denominator = self.__evaluate(derivative, x_inv)
+            if not denominator:
+                return None
+
+            magnitude = gf.div(
+                gf.mul(gf.pow(x, 1 - self.__fcr), self.__evaluate(evaluator, x_inv)),
+                denominator,
+            )
+            errors.append((n - 1 - e, magnitude))
+
+        return errors
+
+    def __evaluate(self, polynomial: list[int], x: int) -> int:
+        """Evaluates a polynomial, lowest degree coefficient first."""
+        result = 0
+        for c in reversed(polynomial):
+            result = self.__gf.mul(result, x) ^ c
+
+        return result
@@ -1,14 +1,350 @@
+import asyncio
+import os
+import threading
+from collections import namedtuple
 from multiprocessing import Process, Event, Condition
+from multiprocessing.sharedctypes import RawArray
 from time import perf_counter_ns, sleep
-from typing import Optional
+from typing import Callable, Optional
 
 
 # Sleep is not very accurate for very short periods.
 # This seemed to be the limit on my machine.
 SLEEP_PRECISION = 0.02
 
+# Ways of waiting for the next tick.
+SLEEP = "sleep"  # Sleep in steps of at most precision seconds.
+SPIN = "spin"  # Busy wait, pins a core.
+HYBRID = "hybrid"  # Sleep until a margin before the tick, then busy wait.
+MODES = (SLEEP, SPIN, HYBRID)
 
-class Ticker(Process):
+# What to do with ticks that were missed because the ticker fell behind.
+SKIP = "skip"  # Fire only the latest of them and carry on from there.
+CATCH_UP = "catch_up"  # Fire them back to back.
+OVERRUNS = (SKIP, CATCH_UP)
+
+# Bounds of the time the hybrid mode busy waits before each tick, in nanoseconds.
+MIN_SPIN_NS = 50_000
+MAX_SPIN_NS = 2_000_000
+
+# Number of sleeps timed to calibrate the hybrid spin margin.
+CALIBRATION_SLEEPS = 20
+
+# Number of recent ticks whose lateness is kept for jitter statistics.
+STATS_CAPACITY = 4096
+
+Jitter = namedtuple("Jitter", "p50 p99 max")
+
+
+def _sleeper() -> tuple[Callable[[int], None], Callable[[], None]]:
+    """
+    Picks the most precise relative sleep available.
+    A timerfd is used where os supports it (Linux, Python 3.13+). Otherwise
+    time.sleep, which uses clock_nanosleep on Linux since Python 3.11.
+    :return: A function sleeping for a number of nanoseconds and one releasing its resources.
+    """
+    if not hasattr(os, "timerfd_create"):
+        return lambda ns: sleep(max(ns, 0) / 1e9), lambda: None
+
+    fd = os.timerfd_create(os.CLOCK_MONOTONIC, flags=os.TFD_CLOEXEC)
+
+    def sleep_ns(ns: int) -> None:
+        if ns > 0:  # A zero timer is disarmed and would never expire.
+            os.timerfd_settime_ns(fd, initial=ns)
+            os.read(fd, 8)
+
+    return sleep_ns, lambda: os.close(fd)
+
+
+class TickStats:
+    """Records how late each tick fires, in memory shared with child processes.
+
+    The ticker writes, any process holding the object reads. A ring buffer
+    keeps the lateness of the last capacity ticks behind two counters, the
+    number of ticks fired and the number of overruns. An overrun is a tick
+    dropped by SKIP or fired at least a whole interval late by CATCH_UP.
+    Reads take no lock, so a read racing a tick may see the tick half recorded.
+    """
+
+    __TICKS, __OVERRUNS, __HEADER = 0, 1, 2
+
+    def __init__(self, capacity: int = STATS_CAPACITY) -> None:
+        """
+        Creates a TickStats.
+        :param capacity: The number of recent ticks kept for jitter statistics.
+        """
+        self.__capacity: int = capacity
+        self.__data = RawArray("q", self.__HEADER + capacity)
+
+    @property
+    def ticks(self) -> int:
+        """Retrieves the number of ticks fired."""
+        return self.__data[self.__TICKS]
+
+    @property
+    def overruns(self) -> int:
+        """Retrieves the number of ticks dropped or fired an interval late."""
+        return self.__data[self.__OVERRUNS]
+
+    def record(self, lateness_ns: int) -> None:
+        """
+        Records a tick.
+        :param lateness_ns: The time the tick fired minus the time it was scheduled for.
+        """
+        ticks = self.__data[self.__TICKS]
+        self.__data[self.__HEADER + ticks % self.__capacity] = lateness_ns
+        self.__data[self.__TICKS] = ticks + 1
+
+    def overrun(self, count: int = 1) -> None:
+        """
+        Records overruns.
+        :param count: The number of ticks dropped or fired late.
+        """
+        self.__data[self.__OVERRUNS] += count
+
+    def reset(self) -> None:
+        """Forgets every tick recorded so far."""
+        self.__data[self.__TICKS] = self.__data[self.__OVERRUNS] = 0
+
+    def lateness(self) -> list[int]:
+        """
+        Retrieves the lateness of the recent ticks.
+        :return: Lateness in nanoseconds, oldest first.
+        """
+        ticks = self.ticks
+        ring = self.__data[self.__HEADER :]
+        if ticks <= self.__capacity:
+            return ring[:ticks]
+
+        start = ticks % self.__capacity
+        return ring[start:] + ring[:start]
+
+    def jitter(self) -> Jitter:
+        """
+        Summarizes the lateness of the recent ticks.
+        :return: The median, 99th percentile and max lateness in seconds.
+        """
+        lateness = sorted(self.lateness())
+        if not lateness:
+            return Jitter(0.0, 0.0, 0.0)
+
+        def percentile(q: float) -> float:
+            return lateness[min(int(q * len(lateness)), len(lateness) - 1)] / 1e9
+
+        return Jitter(percentile(0.5), percentile(0.99), lateness[-1] / 1e9)
+
+    def histogram(self) -> dict[int, int]:
+        """
+        Counts the recent ticks in power of two lateness buckets.
+        :return: The number of ticks later than half of and up to each bound in
+                 nanoseconds, 0 for ticks on time or early.
+        """
+        counts = {}
+        for lateness in self.lateness():
+            bound = 1 << (lateness - 1).bit_length() if lateness > 0 else 0
+            counts[bound] = counts.get(bound, 0) + 1
+
+        return dict(sorted(counts.items()))
+
+
+class _Margin:
+    """How long before a tick the hybrid mode stops sleeping and starts spinning.
+
+    The margin starts at twice the worst oversleep measured during calibration,
+    doubles whenever a sleep still runs past its tick and decays back otherwise.
+    """
+
+    def __init__(self, oversleep: int) -> None:
+        """
+        Creates a margin.
+        :param oversleep: The worst oversleep measured, in nanoseconds.
+        """
+        self.floor: int = min(max(2 * oversleep, MIN_SPIN_NS), MAX_SPIN_NS)
+        self.ns: int = self.floor
+
+    def update(self, late: bool) -> None:
+        """
+        Adapts the margin after a sleep.
+        :param late: True if the sleep ran past the tick.
+        """
+        if late:
+            self.ns = min(2 * self.ns, MAX_SPIN_NS)
+        else:
+            self.ns = max(self.ns - (self.ns >> 6), self.floor)
+
+
+class _Schedule:
+    """The interval, precision and overrun handling shared by every Ticker flavour."""
+
+    # Tickers sharing a process with their waiters spin with sleep(0), which
+    # releases the GIL. A bare busy loop would keep it until the switch interval,
+    # 5ms by default, delaying every waiter woken by the tick.
+    _release_gil: bool = False
+
+    def __init__(
+        self,
+        interval: float,
+        precision: float,
+        mode: Optional[str],
+        overrun: str,
+        stats: Optional[TickStats],
+    ) -> None:
+        """
+        Creates a schedule.
+        :param interval: The number of seconds between each tick.
+        :param precision: The min number of seconds between checking for ticks.
+        :param mode: SLEEP, SPIN or HYBRID. Default is SLEEP for precisions of
+                     SLEEP_PRECISION and above, otherwise HYBRID.
+        :param overrun: SKIP or CATCH_UP ticks missed by falling behind.
+        :param stats: Where to record tick lateness. Default is a new TickStats.
+        """
+        self.__interval_ns = int(interval * 1e9)
+        self.__precision = min(precision, interval)
+
+        if mode is None:
+            mode = SLEEP if self.__precision >= SLEEP_PRECISION else HYBRID
+        assert mode in MODES, f"Mode must be one of {MODES}"
+        assert overrun in OVERRUNS, f"Overrun must be one of {OVERRUNS}"
+
+        self.__mode = mode
+        self.__overrun = overrun
+        self.__stats = stats if stats else TickStats()
+
+    @property
+    def interval_ns(self) -> int:
+        """Retrieve the Ticker interval in nanoseconds."""
+        return self.__interval_ns
+
+    @property
+    def interval(self) -> float:
+        """Retrieves the Ticker interval in seconds."""
+        return self.__interval_ns / 1e9
+
+    @property
+    def precision(self) -> float:
+        """Retrieves the Ticker precision."""
+        return self.__precision
+
+    @property
+    def mode(self) -> str:
+        """Retrieves how the Ticker waits for ticks."""
+        return self.__mode
+
+    @property
+    def overrun(self) -> str:
+        """Retrieves how the Ticker handles missed ticks."""
+        return self.__overrun
+
+    @property
+    def stats(self) -> TickStats:
+        """Retrieves the lateness statistics of the Ticker."""
+        return self.__stats
+
+    def _next_tick(self, next_tick: int) -> int:
+        """
+        Schedules the tick after next_tick, on a fixed grid so errors never accumulate.
+        :param next_tick: The tick that was just fired.
+        :return: The time of the next tick.
+        """
+        next_tick += self.__interval_ns
+
+        # A late tick still fires, but only the most recent of several missed ones.
+        if self.__overrun == SKIP:
+            behind = perf_counter_ns() - next_tick
+            if behind >= self.__interval_ns:
+                skipped = behind // self.__interval_ns
+                next_tick += skipped * self.__interval_ns
+                self.__stats.overrun(skipped)
+
+        return next_tick
+
+    def _record(self, next_tick: int) -> None:
+        """
+        Records the lateness of a tick firing now.
+        :param next_tick: The time the tick was scheduled for.
+        """
+        lateness = perf_counter_ns() - next_tick
+        self.__stats.record(lateness)
+
+        if lateness >= self.__interval_ns:
+            self.__stats.overrun()
+
+    def _run(self, notify: Callable[[], None], stopped: Callable[[], bool]) -> None:
+        """
+        Ticks in the calling thread until stopped.
+        :param notify: Called on each tick.
+        :param stopped: Checked before each tick, True to stop.
+        """
+        if self.__mode == SLEEP:
+            precision_ns = int(self.__precision * 1e9)
+
+            next_tick = self._next_tick(perf_counter_ns())
+            while not stopped():
+                while (remaining := next_tick - perf_counter_ns()) > 0:
+                    sleep(min(remaining, precision_ns) / 1e9)
+
+                self._record(next_tick)
+                notify()
+                next_tick = self._next_tick(next_tick)
+
+        elif self.__mode == SPIN:
+            next_tick = self._next_tick(perf_counter_ns())
+            while not stopped():
+                self.__spin(next_tick)
+
+                self._record(next_tick)
+                notify()
+                next_tick = self._next_tick(next_tick)
+
+        else:
+            sleep_ns, close = _sleeper()
+            try:
+                margin = _Margin(self.__calibrate(sleep_ns))
+
+                next_tick = self._next_tick(perf_counter_ns())
+                while not stopped():
+                    remaining = next_tick - margin.ns - perf_counter_ns()
+                    if remaining > 0:
+                        sleep_ns(remaining)
+                        margin.update(perf_counter_ns() > next_tick)
+
+                    self.__spin(next_tick)
+
+                    self._record(next_tick)
+                    notify()
+                    next_tick = self._next_tick(next_tick)
+            finally:
+                close()
+
+    def __spin(self, next_tick: int) -> None:
+        """
+        Busy waits for a tick.
+        :param next_tick: The time of the tick.
+        """
+        if self._release_gil:
+            while perf_counter_ns() < next_tick:
+                sleep(0)
+        else:
+            while perf_counter_ns() < next_tick:
+                continue
+
+    @staticmethod
+    def __calibrate(sleep_ns: Callable[[int], None]) -> int:
+        """
+        Measures how far short sleeps overshoot.
+        :param sleep_ns: The sleep function to measure.
+        :return: The worst oversleep in nanoseconds.
+        """
+        worst = 0
+        for _ in range(CALIBRATION_SLEEPS):
+            start = perf_counter_ns()
+            sleep_ns(MIN_SPIN_NS)
+            worst = max(worst, perf_counter_ns() - start - MIN_SPIN_NS)
+
+        return worst
+
+
+class Ticker(_Schedule, Process):
     """Notifies a Condition object at a given interval."""
 
     def __init__(
@@ -18,6 +354,9 @@ class Ticker(Process):
         stop: Optional[Event] = None,
         name: Optional[str] = None,
         precision: float = SLEEP_PRECISION,
+        mode: Optional[str] = None,
+        overrun: str = SKIP,
+        stats: Optional[TickStats] = None,
     ):
         """Create a Ticker.
         :param interval: The number of seconds between each tick.
@@ -25,64 +364,262 @@ class Ticker(Process):
         :param stop: The event to set in order to stop the Process.
         :param name: The name to assign the process.
         :param precision: The min number of seconds between checking for ticks.
+        :param mode: SLEEP, SPIN or HYBRID. Default is SLEEP for precisions of
+                     SLEEP_PRECISION and above, otherwise HYBRID.
+        :param overrun: SKIP or CATCH_UP ticks missed by falling behind.
+        :param stats: Where to record tick lateness, readable while the Ticker runs.
         """
-        self.__interval_ns = int(interval * 1e9)
+        _Schedule.__init__(self, interval, precision, mode, overrun, stats)
+
         self.__tick = tick if tick else Condition()
         self.__stop = stop if stop else Event()
-        self.__precision = min(precision, interval)
-
-        super().__init__(name=name if name else f"Ticker[{self.__interval_ns}ns]")
 
-        self.run = (
-            self.__run_high_precision
-            if self.__precision < SLEEP_PRECISION
-            else self.__run_low_precision
-        )
+        Process.__init__(self, name=name if name else f"Ticker[{self.interval_ns}ns]")
 
     @property
     def tick(self) -> Condition:
         """Retrieve the Condition that is called on each tick."""
         return self.__tick
 
-    @property
-    def interval_ns(self) -> int:
-        """Retrieve the Ticker interval in nanoseconds."""
-        return self.__interval_ns
+    def __notify(self) -> None:
+        """Notifies everything waiting for a tick."""
+        with self.__tick:
+            self.__tick.notify_all()
+
+    def run(self) -> None:
+        """Runs the Ticker until the stop event is set."""
+        self._run(self.__notify, self.__stop.is_set)
+
+    def stop(self) -> None:
+        """Stops the Ticker."""
+        self.__stop.set()
+
+
+class ThreadTicker(_Schedule, threading.Thread):
+    """Notifies a threading.Condition at a given interval from a daemon thread.
+
+    Ticks reach waiters in the same process without IPC, and starting the
+    ticker costs a thread rather than a process.
+    """
+
+    _release_gil = True
+
+    def __init__(
+        self,
+        interval: float,
+        tick: Optional[threading.Condition] = None,
+        stop: Optional[threading.Event] = None,
+        name: Optional[str] = None,
+        precision: float = SLEEP_PRECISION,
+        mode: Optional[str] = None,
+        overrun: str = SKIP,
+        stats: Optional[TickStats] = None,
+    ):
+        """Create a ThreadTicker.
+        :param interval: The number of seconds between each tick.
+        :param tick: The condition to notify on each tick.
+        :param stop: The event to set in order to stop the thread.
+        :param name: The name to assign the thread.
+        :param precision: The min number of seconds between checking for ticks.
+        :param mode: SLEEP, SPIN or HYBRID. Default is SLEEP for precisions of
+                     SLEEP_PRECISION and above, otherwise HYBRID.
+        :param overrun: SKIP or CATCH_UP ticks missed by falling behind.
+        :param stats: Where to record tick lateness, readable while the Ticker runs.
+        """
+        _Schedule.__init__(self, interval, precision, mode, overrun, stats)
+
+        self.__tick = tick if tick else threading.Condition()
+        self.__stop = stop if stop else threading.Event()
+
+        threading.Thread.__init__(
+            self,
+            name=name if name else f"ThreadTicker[{self.interval_ns}ns]",
+            daemon=True,
+        )
 
     @property
-    def interval(self) -> float:
-        """Retrieves the Ticker interval in seconds."""
-        return self.__interval_ns / 1e9
+    def tick(self) -> threading.Condition:
+        """Retrieve the Condition that is called on each tick."""
+        return self.__tick
+
+    def __notify(self) -> None:
+        """Notifies everything waiting for a tick."""
+        with self.__tick:
+            self.__tick.notify_all()
+
+    def run(self) -> None:
+        """Runs the Ticker until the stop event is set."""
+        self._run(self.__notify, self.__stop.is_set)
+
+    def stop(self) -> None:
+        """Stops the Ticker."""
+        self.__stop.set()
+
+
+class AsyncTicker(_Schedule):
+    """Ticks on the running event loop, either iterated or through an asyncio.Condition.
+
+    async for tick in AsyncTicker(interval) yields the number of each tick. The
+    event loop only wakes to about a millisecond, so HYBRID and SPIN wait out the
+    rest by repeatedly yielding to the loop, which keeps other tasks running.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        tick: Optional[asyncio.Condition] = None,
+        stop: Optional[asyncio.Event] = None,
+        precision: float = SLEEP_PRECISION,
+        mode: Optional[str] = None,
+        overrun: str = SKIP,
+        stats: Optional[TickStats] = None,
+    ):
+        """Create an AsyncTicker.
+        :param interval: The number of seconds between each tick.
+        :param tick: The condition to notify on each tick.
+        :param stop: The event to set in order to stop iterating.
+        :param precision: The min number of seconds between checking for ticks.
+        :param mode: SLEEP, SPIN or HYBRID. Default is SLEEP for precisions of
+                     SLEEP_PRECISION and above, otherwise HYBRID.
+        :param overrun: SKIP or CATCH_UP ticks missed by falling behind.
+        :param stats: Where to record tick lateness, readable while the Ticker runs.
+        """
+        _Schedule.__init__(self, interval, precision, mode, overrun, stats)
+
+        self.__tick = tick if tick else asyncio.Condition()
+        self.__stop = stop if stop else asyncio.Event()
+
+        self.__next_tick: Optional[int] = None
+        self.__margin: Optional[_Margin] = None
+        self.__count: int = 0
 
     @property
-    def precision(self) -> float:
-        """Retrieves the Ticker precision."""
-        return self.__precision
+    def tick(self) -> asyncio.Condition:
+        """Retrieve the Condition that is called on each tick."""
+        return self.__tick
 
-    def __run_low_precision(self) -> None:
-        """Runs the Ticker until the stop event is set sleeping between ticks."""
-        next_tick = perf_counter_ns()
-        while not self.__stop.is_set():
-            next_tick = next_tick + self.__interval_ns
+    @staticmethod
+    async def __calibrate() -> int:
+        """
+        Measures how far short event loop sleeps overshoot.
+        :return: The worst oversleep in nanoseconds.
+        """
+        worst = 0
+        for _ in range(CALIBRATION_SLEEPS):
+            start = perf_counter_ns()
+            await asyncio.sleep(MIN_SPIN_NS / 1e9)
+            worst = max(worst, perf_counter_ns() - start - MIN_SPIN_NS)
 
-            while perf_counter_ns() < next_tick:
-                sleep(self.__precision)
+        return worst
 
-            with self.__tick:
-                self.__tick.notify_all()
+    async def __wait(self, next_tick: int) -> None:
+        """
+        Waits for a tick without blocking the event loop.
+        :param next_tick: The time of the tick.
+        """
+        if self.mode == SLEEP:
+            precision_ns = int(self.precision * 1e9)
+            while (remaining := next_tick - perf_counter_ns()) > 0:
+                await asyncio.sleep(min(remaining, precision_ns) / 1e9)
+            return
 
-    def __run_high_precision(self) -> None:
-        """Runs the Ticker until the stop event is set without sleeping between ticks."""
-        next_tick = perf_counter_ns()
-        while not self.__stop.is_set():
-            next_tick = next_tick + self.__interval_ns
+        if self.mode == HYBRID:
+            remaining = next_tick - self.__margin.ns - perf_counter_ns()
+            if remaining > 0:
+                await asyncio.sleep(remaining / 1e9)
+                self.__margin.update(perf_counter_ns() > next_tick)
 
-            while perf_counter_ns() < next_tick:
-                continue
+        while perf_counter_ns() < next_tick:
+            await asyncio.sleep(0)
+
+    def __aiter__(self) -> "AsyncTicker":
+        return self
+
+    async def __anext__(self) -> int:
+        """
+        Waits for the next tick and notifies the tick condition.
+        :return: The number of the tick, counting from 1.
+        """
+        if self.__stop.is_set():
+            raise StopAsyncIteration
+
+        if self.__next_tick is None:
+            if self.mode == HYBRID:
+                self.__margin = _Margin(await self.__calibrate())
+            self.__next_tick = self._next_tick(perf_counter_ns())
+        else:
+            self.__next_tick = self._next_tick(self.__next_tick)
 
-            with self.__tick:
-                self.__tick.notify_all()
+        await self.__wait(self.__next_tick)
+        if self.__stop.is_set():
+            raise StopAsyncIteration
+
+        self._record(self.__next_tick)
+        async with self.__tick:
+            self.__tick.notify_all()
+
+        self.__count += 1
+        return self.__count
+
+    async def run(self) -> None:
+        """Ticks until stopped, for use as a task when only the tick condition is used."""
+        async for _ in self:
+            pass
 
     def stop(self) -> None:
         """Stops the Ticker."""
         self.__stop.set()
+
+
+def benchmark(
+    intervals: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05),
+    precisions: tuple[float, ...] = (0, 0.001, SLEEP_PRECISION),
+    modes: tuple[str, ...] = MODES,
+    ticks: int = 200,
+) -> str:
+    """
+    Runs a Ticker for every combination of interval, precision and mode.
+    :param intervals: The intervals to run, in seconds.
+    :param precisions: The precisions to run, in seconds.
+    :param modes: The modes to run.
+    :param ticks: The number of ticks to run each combination for.
+    :return: A markdown table of the lateness, overruns and CPU use of each run.
+    """
+    lines = [
+        "| interval | precision | mode | ticks | overruns | p50 | p99 | max | cpu |",
+        "|---:|---:|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for interval in intervals:
+        for precision in precisions:
+            for mode in modes:
+                ticker = Ticker(interval, precision=precision, mode=mode)
+
+                before = os.times()
+                ticker.start()
+                sleep(ticks * interval)
+                ticker.stop()
+                ticker.join()
+                after = os.times()
+
+                cpu = after.children_user + after.children_system
+                cpu -= before.children_user + before.children_system
+                cpu /= after.elapsed - before.elapsed
+
+                stats, jitter = ticker.stats, ticker.stats.jitter()
+                lines.append(
+                    f"| {interval * 1e3:g}ms | {precision * 1e3:g}ms | {mode} "
+                    f"| {stats.ticks} | {stats.overruns} | {jitter.p50 * 1e6:.0f}us "
+                    f"| {jitter.p99 * 1e6:.0f}us | {jitter.max * 1e6:.0f}us | {cpu:.0%} |"
+                )
+
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    import sys
+
+    report = benchmark()
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w") as file:
+            file.write(report)
+    print(report, end="")
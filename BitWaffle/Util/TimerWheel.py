@@ -0,0 +1,318 @@
+import asyncio
+import threading
+from time import perf_counter_ns
+from typing import Callable, Optional
+
+from BitWaffle.Util.Ticker import _Schedule, SKIP, SLEEP_PRECISION, TickStats
+
+# Slots per wheel and number of wheels. Each wheel spans SLOTS times the one
+# below it, so the defaults reach 2 ** 32 resolutions, about 49 days at 1ms.
+SLOTS = 256
+LEVELS = 4
+
+
+class Timer:
+    """A periodic or one shot registration on a TimerWheel.
+
+    Each firing calls the callback from the wheel thread, notifies the condition
+    and wakes every coroutine awaiting wait(). An exception from the callback is
+    kept in error rather than stopping the wheel and every other timer on it.
+    """
+
+    def __init__(
+        self,
+        wheel: "TimerWheel",
+        interval: Optional[int],
+        callback: Optional[Callable[[], None]],
+        condition: Optional[threading.Condition],
+    ) -> None:
+        """
+        Creates a Timer, use TimerWheel.every or TimerWheel.after instead.
+        :param wheel: The wheel the timer is registered on.
+        :param interval: The number of wheel ticks between firings, None to fire once.
+        :param callback: Called on each firing.
+        :param condition: The condition to notify on each firing.
+        """
+        self.__wheel = wheel
+        self.__interval: Optional[int] = interval
+        self.__callback = callback
+        self.__condition = condition if condition else threading.Condition()
+
+        self.__count: int = 0
+        self.__error: Optional[BaseException] = None
+        self.__lock = threading.Lock()
+        self.__waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def interval(self) -> Optional[float]:
+        """Retrieves the seconds between firings, None for a one shot timer."""
+        if self.__interval is None:
+            return None
+
+        return self.__interval * self.__wheel.interval
+
+    @property
+    def _ticks(self) -> Optional[int]:
+        """Retrieves the wheel ticks between firings, None for a one shot timer."""
+        return self.__interval
+
+    @property
+    def condition(self) -> threading.Condition:
+        """Retrieves the Condition that is notified on each firing."""
+        return self.__condition
+
+    @property
+    def count(self) -> int:
+        """Retrieves the number of times the timer fired."""
+        return self.__count
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """Retrieves the last exception raised by the callback, if any."""
+        return self.__error
+
+    @property
+    def active(self) -> bool:
+        """Retrieves whether the timer will fire again."""
+        return self in self.__wheel
+
+    def cancel(self) -> None:
+        """Stops the timer from firing again."""
+        self.__wheel.cancel(self)
+
+    async def wait(self) -> int:
+        """
+        Waits for the next firing without blocking the event loop.
+        :return: The number of the firing, counting from 1.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.__lock:
+            self.__waiters.append((loop, future))
+
+        return await future
+
+    def _fire(self) -> None:
+        """Delivers a firing to the callback, the condition and the waiters."""
+        self.__count += 1
+
+        if self.__callback:
+            try:
+                self.__callback()
+            except Exception as error:
+                self.__error = error
+
+        with self.__condition:
+            self.__condition.notify_all()
+
+        with self.__lock:
+            waiters, self.__waiters = self.__waiters, []
+        for loop, future in waiters:
+            # Waiters whose coroutine was cancelled or whose loop is gone are dropped.
+            if future.done() or loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(_resolve, future, self.__count)
+            except RuntimeError:  # The loop closed since it was checked.
+                pass
+
+
+def _resolve(future: asyncio.Future, count: int) -> None:
+    """Completes a waiter unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(count)
+
+
+class TimerWheel(_Schedule, threading.Thread):
+    """Fires any number of timers from one thread with a hierarchical timing wheel.
+
+    Timers are kept in the slot of the wheel matching how far away they are, so
+    registering and cancelling cost O(1) whatever the number of timers. Every
+    tick the lowest wheel moves one slot and fires its timers, and whenever it
+    wraps the next slot of the wheel above is spread over the wheels below.
+    Timer intervals and delays are rounded to whole ticks.
+    """
+
+    _release_gil = True
+
+    def __init__(
+        self,
+        resolution: float = 0.001,
+        name: Optional[str] = None,
+        precision: float = SLEEP_PRECISION,
+        mode: Optional[str] = None,
+        slots: int = SLOTS,
+        levels: int = LEVELS,
+        stats: Optional[TickStats] = None,
+    ):
+        """Create a TimerWheel.
+        :param resolution: The number of seconds between each tick of the wheel.
+        :param name: The name to assign the thread.
+        :param precision: The min number of seconds between checking for ticks.
+        :param mode: SLEEP, SPIN or HYBRID. Default is SLEEP for precisions of
+                     SLEEP_PRECISION and above, otherwise HYBRID.
+        :param slots: The number of slots per wheel, a power of two.
+        :param levels: The number of wheels.
+        :param stats: Where to record tick lateness, readable while the wheel runs.
+        """
+        assert slots > 1 and slots & (slots - 1) == 0, "Slots must be a power of two"
+        assert levels > 0, "There must be at least one wheel"
+
+        # Ticks the wheel falls behind are caught up by advancing several slots.
+        _Schedule.__init__(self, resolution, precision, mode, SKIP, stats)
+
+        self.__bits: int = slots.bit_length() - 1
+        self.__mask: int = slots - 1
+        self.__span: int = slots**levels
+        self.__wheels: list[list[dict[Timer, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+
+        # The slot of every pending timer, for O(1) cancelling.
+        self.__placement: dict[Timer, dict[Timer, int]] = {}
+        self.__lock = threading.Lock()
+
+        self.__now: int = 0
+        self.__start: Optional[int] = None
+        self.__stop = threading.Event()
+
+        threading.Thread.__init__(
+            self,
+            name=name if name else f"TimerWheel[{self.interval_ns}ns]",
+            daemon=True,
+        )
+
+    def __len__(self) -> int:
+        return len(self.__placement)
+
+    def __contains__(self, timer: Timer) -> bool:
+        return timer in self.__placement
+
+    def every(
+        self,
+        interval: float,
+        callback: Optional[Callable[[], None]] = None,
+        condition: Optional[threading.Condition] = None,
+    ) -> Timer:
+        """
+        Registers a periodic timer.
+        :param interval: The number of seconds between firings.
+        :param callback: Called from the wheel thread on each firing.
+        :param condition: The condition to notify on each firing.
+        :return: The timer.
+        """
+        ticks = max(round(interval * 1e9 / self.interval_ns), 1)
+        timer = Timer(self, ticks, callback, condition)
+
+        with self.__lock:
+            self.__insert(timer, self.__now + ticks)
+
+        return timer
+
+    def after(
+        self,
+        delay: float,
+        callback: Optional[Callable[[], None]] = None,
+        condition: Optional[threading.Condition] = None,
+    ) -> Timer:
+        """
+        Registers a timer firing once.
+        :param delay: The number of seconds until the timer fires.
+        :param callback: Called from the wheel thread when the timer fires.
+        :param condition: The condition to notify when the timer fires.
+        :return: The timer.
+        """
+        ticks = max(-(-int(delay * 1e9) // self.interval_ns), 1)
+        timer = Timer(self, None, callback, condition)
+
+        with self.__lock:
+            self.__insert(timer, self.__now + ticks)
+
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        """
+        Unregisters a timer, nothing happens if it is not pending.
+        :param timer: The timer.
+        """
+        with self.__lock:
+            slot = self.__placement.pop(timer, None)
+            if slot is not None:
+                del slot[timer]
+
+    def __insert(self, timer: Timer, expiry: int) -> None:
+        """
+        Places a timer in the slot of the wheel covering its expiry.
+        :param timer: The timer.
+        :param expiry: The tick to fire the timer on, no earlier than the current one.
+        """
+        # Timers beyond the top wheel wait in its farthest slot and move on from there.
+        # Timers cascading onto the current tick land in the slot about to fire.
+        delta = min(expiry - self.__now, self.__span - 1)
+        level = max(delta.bit_length() - 1, 0) // self.__bits
+        index = (self.__now + delta) >> (self.__bits * level) & self.__mask
+
+        slot = self.__wheels[level][index]
+        slot[timer] = expiry
+        self.__placement[timer] = slot
+
+    def __step(self) -> dict[Timer, int]:
+        """
+        Moves the wheels on by one tick.
+        :return: The timers expiring on the tick.
+        """
+        self.__now += 1
+        now, bits, mask = self.__now, self.__bits, self.__mask
+
+        # Cascading comes first so timers due on this very tick fire with the rest.
+        for level in range(1, len(self.__wheels)):
+            if now & ((1 << bits * level) - 1):
+                break
+
+            wheel = self.__wheels[level]
+            index = now >> (bits * level) & mask
+            slot, wheel[index] = wheel[index], {}
+            for timer, expiry in slot.items():
+                self.__insert(timer, expiry)
+
+        wheel = self.__wheels[0]
+        expired, wheel[now & mask] = wheel[now & mask], {}
+        for timer, expiry in expired.items():
+            del self.__placement[timer]
+
+            interval = timer._ticks
+            if interval is not None:
+                expiry += interval
+                if expiry <= now:
+                    expiry += ((now - expiry) // interval + 1) * interval
+                self.__insert(timer, expiry)
+
+        return expired
+
+    def advance(self, ticks: int = 1) -> None:
+        """
+        Moves the wheels on, firing the timers due on each tick in order.
+        The running wheel does this itself, calling it is for driving a wheel
+        that was never started, on simulated time for instance.
+        :param ticks: The number of ticks to move.
+        """
+        for _ in range(ticks):
+            with self.__lock:
+                expired = self.__step()
+
+            for timer in expired:
+                timer._fire()
+
+    def __catch_up(self) -> None:
+        """Fires every timer due by now."""
+        target = (perf_counter_ns() - self.__start) // self.interval_ns
+        self.advance(target - self.__now)
+
+    def run(self) -> None:
+        """Runs the TimerWheel until stopped."""
+        self.__start = perf_counter_ns()
+        self._run(self.__catch_up, self.__stop.is_set)
+
+    def stop(self) -> None:
+        """Stops the TimerWheel."""
+        self.__stop.set()
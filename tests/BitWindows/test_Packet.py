@@ -0,0 +1,98 @@
+import pytest
+
+from BitWaffle.BitWindows.Packet import Packet
+from BitWaffle.CRC import Algorithms, compute
+
+
+def test_setitem():
+    """Tests writing bytes and slices into a packet."""
+    packet = Packet(b"\x01\x02\x03\x04")
+
+    packet[0] = 0xFF
+    packet[1:3] = b"\xAA\xBB"
+    assert packet[:] == b"\xFF\xAA\xBB\x04"
+
+    packet[3:] = b"\x05\x06"
+    assert packet[:] == b"\xFF\xAA\xBB\x05\x06"
+
+    packet[-1] = 0x41
+    assert packet[:] == b"\xFF\xAA\xBB\x05\x41"
+
+    with pytest.raises(IndexError):
+        packet[5] = 0
+    with pytest.raises(IndexError):
+        packet[-6] = 0
+
+
+def test_live_crc():
+    """Tests the packet checksum follows every write."""
+    packet = Packet(b"123456789", Algorithms.CRC16_MODBUS)
+    assert packet.crc == compute(b"123456789", Algorithms.CRC16_MODBUS)
+
+    packet[2:4] = b"ab"
+    assert packet.crc == compute(b"12ab56789", Algorithms.CRC16_MODBUS)
+
+    packet[8] = ord("X")
+    assert packet.crc == compute(b"12ab5678X", Algorithms.CRC16_MODBUS)
+
+    packet[0:1] = b"long"
+    assert packet.crc == compute(b"long2ab5678X", Algorithms.CRC16_MODBUS)
+
+    assert Packet(b"123").crc is None
+
+
+def test_in_place():
+    """Tests writes land in the given buffer and show through views."""
+    data = bytearray(b"\x01\x02\x03\x04")
+    packet = Packet(data)
+    view = packet.view(slice(1, 3))
+
+    packet[1:3] = b"\xAA\xBB"
+    assert data == b"\x01\xAA\xBB\x04"
+    assert view == b"\xAA\xBB"
+
+    # Views pin the size of the bytes until they are released.
+    with pytest.raises(BufferError):
+        packet[0:1] = b""
+    view.release()
+    packet[0:1] = b""
+    assert data == b"\xAA\xBB\x04"
+
+
+def test_mmap(tmp_path):
+    """Tests packets backed by a file write through to it."""
+    path = tmp_path / "capture.bin"
+    path.write_bytes(b"123456789")
+
+    with Packet.open(path, Algorithms.CRC32) as packet:
+        assert len(packet) == 9
+        assert packet.crc == compute(b"123456789", Algorithms.CRC32)
+
+        packet[0:2] = b"ab"
+        packet[-1] = ord("X")
+        assert packet.view(slice(0, 3)) == b"ab3"
+        assert packet.crc == compute(b"ab345678X", Algorithms.CRC32)
+
+        with pytest.raises(ValueError):
+            packet[0:2] = b"abc"
+
+        packet.flush()
+        assert path.read_bytes() == b"ab345678X"
+
+    with Packet.open(path, writable=False) as packet:
+        assert packet[:] == b"ab345678X"
+        with pytest.raises(TypeError):
+            packet[0] = 0
+
+
+def test_mmap_close(tmp_path):
+    """Tests closing a packet backed by a file keeps its writes, and can be repeated."""
+    path = tmp_path / "capture.bin"
+    path.write_bytes(b"123456789")
+
+    packet = Packet.open(path)
+    packet[4] = ord("x")
+    packet.close()
+    packet.close()
+
+    assert path.read_bytes() == b"1234x6789"
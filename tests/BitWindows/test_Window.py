@@ -0,0 +1,24 @@
+from BitWaffle.BitWindows.Packet import Packet
+from BitWaffle.BitWindows.Window import BitWindow, Window
+
+
+def test_view():
+    """Tests window views follow writes to the packet instead of copying it."""
+    packet = Packet(b"\x01\x02\x03\x04")
+    window = Window(1, 3)
+
+    view = window.view(packet)
+    assert isinstance(view, memoryview)
+    assert view == b"\x02\x03"
+
+    packet[2] = 0xFF
+    assert view == b"\x02\xFF"
+
+    assert window.view(bytearray(b"abcd")) == b"bc"
+
+
+def test_bit_view():
+    bits = BitWindow(0, 0, 17).view(Packet(b"\x01\x02\x03\x04"))
+
+    assert len(bits) == 17
+    assert [i for i, bit in enumerate(bits) if bit] == [7, 14]
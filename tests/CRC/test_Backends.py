@@ -0,0 +1,63 @@
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, CRC, compute, select
+from BitWaffle.CRC.Backends import BACKENDS, CRC32Backend, TableBackend
+
+
+DATA = bytes(range(0x100)) * 3 + b"123456789"
+
+
+@pytest.mark.parametrize(
+    "algorithm, expected",
+    [
+        (Algorithms.CRC32, "binascii.crc32"),
+        (Algorithms.CRC32_JAMCRC, "binascii.crc32"),
+        (Algorithms.CRC16_XMODEM, "binascii.crc_hqx"),
+        (Algorithms.CRC16_GENIBUS, "binascii.crc_hqx"),
+        (Algorithms.CRC32_BZIP2, "table"),
+        (Algorithms.CRC16_KERMIT, "table"),
+        (Algorithms.CRC64_XZ, "table"),
+    ],
+)
+def test_select(algorithm: Algorithm, expected: str):
+    """Tests recognized parameter sets are routed to native backends."""
+    assert select(algorithm).name == expected
+    assert CRC(*algorithm).backend == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("algorithm", list(Algorithms))
+def test_backend(algorithm: Algorithm, backend):
+    """Tests every backend matches the table engine for the algorithms it supports."""
+    if not backend.supports(algorithm):
+        pytest.skip(f"{backend.name} does not support {algorithm}")
+
+    expected = CRC(*algorithm, backend=TableBackend)
+    expected.update_bytes(DATA)
+
+    crc = CRC(*algorithm, backend=backend)
+    crc.update_bytes(DATA[:100])
+    for datum in DATA[100:110]:
+        crc.update(datum)
+    crc.update_bytes(memoryview(DATA)[110:])
+
+    assert int(crc) == int(expected) == compute(DATA, algorithm)
+
+
+def test_custom_algorithm():
+    """Tests a reflected input, non reflected output CRC32 variant."""
+    algorithm = Algorithm(0x04C11DB7, 32, 0x12345678, 0x0F0F0F0F, True, False)
+
+    native = CRC(*algorithm)
+    native.update_bytes(DATA)
+    table = CRC(*algorithm, backend=TableBackend)
+    table.update_bytes(DATA)
+
+    assert native.backend == "binascii.crc32"
+    assert int(native) == int(table)
+
+
+def test_unsupported_backend():
+    """Tests an explicit backend is refused for algorithms it cannot compute."""
+    with pytest.raises(ValueError):
+        CRC(*Algorithms.CRC16_ARC, backend=CRC32Backend)
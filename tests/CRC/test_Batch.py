@@ -0,0 +1,30 @@
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, compute, compute_many
+
+np = pytest.importorskip("numpy")
+
+
+MESSAGES = [bytes([i, i * 7 & 0xFF, 0x55, i ^ 0xA5]) * 3 for i in range(0x100)]
+
+
+@pytest.mark.parametrize("algorithm", list(Algorithms))
+def test_compute_many_array(algorithm: Algorithm):
+    """Tests a batch of equal length messages matches one at a time results."""
+    block = np.frombuffer(b"".join(MESSAGES), dtype=np.uint8).reshape(len(MESSAGES), -1)
+
+    assert compute_many(block, algorithm).tolist() == [
+        compute(m, algorithm) for m in MESSAGES
+    ]
+
+
+@pytest.mark.parametrize(
+    "algorithm", [Algorithms.CRC8_ITU, Algorithms.CRC16_A, Algorithms.CRC32_BZIP2]
+)
+def test_compute_many_list(algorithm: Algorithm):
+    """Tests a list of mixed length messages keeps its order."""
+    messages = [b"", b"123456789", b"ABC"] + MESSAGES[:10] + [b"A", b"AB"]
+
+    assert compute_many(messages, algorithm).tolist() == [
+        compute(m, algorithm) for m in messages
+    ]
@@ -1,8 +1,10 @@
 from pathlib import Path
 
+import pytest
 from pytest import fixture
 
-from BitWaffle.CRC import Algorithms, Algorithm, compute
+from BitWaffle.CRC import Algorithms, Algorithm, CRC, compute, compute_file
+from BitWaffle.CRC.Table import SLICES
 
 
 @fixture(
@@ -19,6 +21,10 @@ from BitWaffle.CRC import Algorithms, Algorithm, compute
         (Algorithms.CRC8, b"", 0x00),
         (Algorithms.CRC8, b"ABC", 0x52),
         (Algorithms.CRC8, b"123456789", 0xF4),
+        # Check values from https://reveng.sourceforge.io/crc-catalogue/all.htm
+        (Algorithms.CRC8_ITU, b"123456789", 0xA1),
+        (Algorithms.CRC16_DECT_R, b"123456789", 0x007E),
+        (Algorithms.CRC64_XZ, b"123456789", 0x995DC9BBDF1939FA),
     ]
 )
 def crc_test_case(request) -> tuple[Algorithm, bytes, int]:
@@ -32,6 +38,24 @@ def test_crc(crc_test_case: tuple):
     assert compute(data, algorithm) == expected
 
 
+@pytest.mark.parametrize("slices", SLICES)
+@pytest.mark.parametrize("algorithm", list(Algorithms))
+def test_update_bytes(algorithm: Algorithm, slices: int):
+    """Tests the table engine matches byte at a time updates."""
+    data = bytes(range(0x100)) * 3 + b"tail"
+
+    expected = CRC(*algorithm)
+    for datum in data:
+        expected.update(datum)
+
+    for size in [0, 1, 7, 16, 33, len(data)]:
+        crc = CRC(*algorithm, slices=slices)
+        crc.update_bytes(data[:size])
+        crc.update_bytes(memoryview(data)[size:])
+
+        assert int(crc) == int(expected)
+
+
 @fixture
 def tmp_file(tmp_path: Path) -> Path:
     """Generates a filepath in the tmp_path dir."""
@@ -48,6 +72,41 @@ def test_crc_file(crc_test_case: tuple, tmp_file: Path):
         assert compute(binary_io, algorithm) == expected
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 4096])
+def test_compute_file(crc_test_case: tuple, tmp_file: Path, chunk_size: int):
+    """Tests streaming a CRC from a file path."""
+    algorithm, data, expected = crc_test_case
+
+    tmp_file.write_bytes(data)
+
+    assert compute_file(tmp_file, algorithm, chunk_size) == expected
+
+
+def test_crc_mmap(crc_test_case: tuple, tmp_file: Path):
+    """Tests generating a CRC from a memory mapped file."""
+    import mmap
+
+    algorithm, data, expected = crc_test_case
+
+    tmp_file.write_bytes(data + b"trailer")
+
+    with open(tmp_file, "br") as binary_io:
+        with mmap.mmap(binary_io.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                assert compute(view[: len(data)], algorithm) == expected
+
+
+def test_update_from_size(tmp_file: Path):
+    """Tests streaming stops after the requested number of bytes."""
+    tmp_file.write_bytes(b"123456789trailer")
+
+    crc = CRC(*Algorithms.CRC32)
+    with open(tmp_file, "br") as binary_io:
+        assert crc.update_from(binary_io, 9, chunk_size=4) == 9
+
+    assert int(crc) == 0xCBF43926
+
+
 def test_large_file(tmp_file: Path):
     """Make sure we can generate a CRC for a large file."""
     import os
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, combine, compute, compute_parallel
+
+
+DATA = bytes(range(0x100)) * 40 + b"123456789"
+
+
+@pytest.mark.parametrize("split", [0, 1, 9, 256, len(DATA) - 1, len(DATA)])
+@pytest.mark.parametrize("algorithm", list(Algorithms))
+def test_combine(algorithm: Algorithm, split: int):
+    """Tests combining the CRCs of two blocks matches the CRC of both blocks."""
+    a, b = DATA[:split], DATA[split:]
+
+    assert combine(
+        compute(a, algorithm), compute(b, algorithm), len(b), algorithm
+    ) == compute(DATA, algorithm)
+
+
+@pytest.mark.parametrize(
+    "algorithm", [Algorithms.CRC32, Algorithms.CRC16_A, Algorithms.CRC64_WE]
+)
+def test_compute_parallel(algorithm: Algorithm, tmp_path: Path):
+    """Tests a CRC computed in a process pool matches the serial result."""
+    tmp_file = tmp_path / "data"
+    tmp_file.write_bytes(DATA)
+
+    expected = compute(DATA, algorithm)
+
+    assert compute_parallel(DATA, algorithm, workers=3, chunk_size=1000) == expected
+    assert compute_parallel(tmp_file, algorithm, workers=3, chunk_size=999) == expected
+    assert compute_parallel(str(tmp_file), algorithm, workers=1) == expected
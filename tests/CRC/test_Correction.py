@@ -0,0 +1,126 @@
+from itertools import combinations
+
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, SyndromeIndex, compute, correct
+from BitWaffle.CRC import Correction
+
+
+FRAME = b"\x7e telemetry frame 0123456789"
+
+
+def flip(frame: bytes, crc: int, errors: tuple, bits: int) -> tuple[bytes, int]:
+    """Flips bits of a frame and its CRC."""
+    frame = bytearray(frame)
+    for error in errors:
+        if error < bits:
+            frame[error // 8] ^= 1 << (error % 8)
+        else:
+            crc ^= 1 << (error - bits)
+
+    return bytes(frame), crc
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        Algorithms.CRC16_MODBUS,
+        Algorithms.CRC16_XMODEM,
+        Algorithms.CRC32,
+        Algorithms.CRC32_BZIP2,
+    ],
+)
+def test_correct_single(algorithm: Algorithm):
+    """Tests every single bit error is repaired."""
+    crc = compute(FRAME, algorithm)
+    bits = 8 * len(FRAME)
+
+    assert correct(FRAME, crc, algorithm) == (FRAME, crc, ())
+
+    for error in range(bits + algorithm.width):
+        corrected = correct(*flip(FRAME, crc, (error,), bits), algorithm)
+
+        assert corrected == (FRAME, crc, (error,))
+
+
+@pytest.mark.parametrize(
+    "algorithm", [Algorithms.CRC32, Algorithms.CRC32_BZIP2, Algorithms.CRC32_C]
+)
+def test_correct_double(algorithm: Algorithm):
+    """Tests double bit errors are repaired where the CRC distance allows it."""
+    crc = compute(FRAME, algorithm)
+    bits = 8 * len(FRAME)
+
+    for error in list(combinations(range(bits + algorithm.width), 2))[::37]:
+        corrected = correct(*flip(FRAME, crc, error, bits), algorithm)
+
+        assert corrected == (FRAME, crc, error)
+
+
+def test_correct_ambiguous():
+    """Tests double bit errors a 16 bit CRC cannot tell apart are never miscorrected."""
+    algorithm = Algorithms.CRC16_MODBUS
+    crc = compute(FRAME, algorithm)
+    bits = 8 * len(FRAME)
+
+    rejected = 0
+    for error in list(combinations(range(bits + algorithm.width), 2))[::37]:
+        try:
+            assert correct(*flip(FRAME, crc, error, bits), algorithm).errors == error
+        except ValueError:
+            rejected += 1
+
+    assert rejected
+
+
+def test_unpaired_index():
+    """Tests double bit errors are found when they are not tabulated."""
+    algorithm = Algorithms.CRC32
+    crc = compute(FRAME, algorithm)
+    bits = 8 * len(FRAME)
+
+    index = SyndromeIndex(algorithm, len(FRAME), max_entries=bits + 32)
+    assert not index.paired
+    assert index.entries == bits + 32
+    assert index.size > 0 and index.build_time >= 0
+
+    for error in [(0, 1), (5, 200), (17, bits + 3)]:
+        frame, received = flip(FRAME, crc, error, bits)
+        syndrome = compute(frame, algorithm) ^ received
+
+        assert index.locate(syndrome) == error
+
+
+def test_correct_max_entries():
+    """Tests correct() passes max_entries on to the index it uses."""
+    algorithm = Algorithms.CRC32
+    crc = compute(FRAME, algorithm)
+    bits = 8 * len(FRAME)
+
+    frame, received = flip(FRAME, crc, (3, 100), bits)
+    corrected = correct(frame, received, algorithm, max_entries=bits + 32)
+    assert corrected == (FRAME, crc, (3, 100))
+
+    index = Correction.syndrome_index(algorithm, len(FRAME), 2, bits + 32)
+    assert not index.paired
+
+
+def test_cache_entries(monkeypatch):
+    """Tests the cache drops the least recently used indexes beyond its total entries."""
+    monkeypatch.setattr(Correction, "_cache", Correction.OrderedDict())
+    first = Correction.syndrome_index(Algorithms.CRC16_XMODEM, 16)
+    monkeypatch.setattr(Correction, "CACHE_ENTRIES", first.entries + 1)
+
+    assert Correction.syndrome_index(Algorithms.CRC16_XMODEM, 16) is first
+    Correction.syndrome_index(Algorithms.CRC16_XMODEM, 17)
+    assert Correction.syndrome_index(Algorithms.CRC16_XMODEM, 16) is not first
+    assert len(Correction._cache) == 1
+
+
+def test_uncorrectable():
+    """Tests frames with too many errors are rejected."""
+    crc = compute(FRAME, Algorithms.CRC8)
+
+    with pytest.raises(ValueError):
+        for error in combinations(range(16), 3):
+            correct(*flip(FRAME, crc, error, 8 * len(FRAME)), Algorithms.CRC8)
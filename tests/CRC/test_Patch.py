@@ -0,0 +1,18 @@
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, compute, patch
+
+
+DATA = bytes(range(0x100)) * 4
+
+
+@pytest.mark.parametrize("offset, new", [(0, b"\xff"), (10, b"SEQ1"), (1020, b"end!")])
+@pytest.mark.parametrize("algorithm", list(Algorithms))
+def test_patch(algorithm: Algorithm, offset: int, new: bytes):
+    """Tests patching a CRC matches recomputing it over the edited data."""
+    old = DATA[offset : offset + len(new)]
+    edited = DATA[:offset] + new + DATA[offset + len(new) :]
+
+    assert patch(
+        compute(DATA, algorithm), offset, old, new, len(DATA), algorithm
+    ) == compute(edited, algorithm)
@@ -0,0 +1,96 @@
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, compute, search
+from BitWaffle.CRC import Search
+
+
+MESSAGES = [b"hello world", b"HELLO WORLD", b"abc", b"123456789xyz", b"hello there"]
+
+
+def samples(algorithm: Algorithm, messages: list[bytes] = MESSAGES) -> list:
+    """Generates (message, crc) samples for an algorithm."""
+    return [(message, compute(message, algorithm)) for message in messages]
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [Algorithms.CRC8_MAXIM, Algorithms.CRC16_MODBUS, Algorithms.CRC32_C],
+)
+def test_search_catalogue(algorithm: Algorithm):
+    """Tests known algorithms are found without a polynomial search."""
+    assert algorithm in list(search(samples(algorithm)))
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        Algorithm(0x31, 8, 0x00, 0xAB, False, False),
+        Algorithm(0x9B, 8, 0x5A, 0x00, True, True),
+        Algorithm(0x8BB7, 16, 0x1234, 0x5678, True, True),
+        Algorithm(0x3D65, 16, 0xFFFF, 0x0000, False, False),
+    ],
+)
+def test_search_polynomial(algorithm: Algorithm):
+    """Tests unknown algorithms are found by the polynomial search."""
+    pytest.importorskip("numpy")
+
+    assert algorithm in list(search(samples(algorithm), algorithm.width))
+
+
+def test_search_wide():
+    """Tests a 32 bit polynomial is found by factoring the differences."""
+    algorithm = Algorithm(0x1EDC6F41, 32, 0x1234, 0x55, True, True)
+
+    assert list(search(samples(algorithm), 32)) == [algorithm]
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        Algorithm(0x31, 8, 0x00, 0xAB, False, False),
+        Algorithm(0x8BB7, 16, 0x1234, 0x5678, True, True),
+    ],
+)
+def test_divisors(algorithm: Algorithm):
+    """Tests factoring finds exactly the polynomials the exhaustive search does."""
+    pytest.importorskip("numpy")
+
+    reflections = (algorithm.reflect_input, algorithm.reflect_output)
+    for messages in [MESSAGES, MESSAGES[:2], [b"abcd", b"abce", b"wxyz"]]:
+        differences = Search._differences(
+            samples(algorithm, messages), algorithm.width, *reflections
+        )
+        exhaustive = Search._search_range(
+            algorithm.width, differences, 0, 1 << (algorithm.width - 1)
+        )
+
+        divisors = Search._divisors(algorithm.width, differences)
+        assert divisors == exhaustive or (divisors is None and messages != MESSAGES)
+
+
+def test_search_workers(monkeypatch):
+    """Tests the exhaustive polynomial search can run in a process pool."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(Search, "MAX_COFACTOR_DEGREE", -1)
+
+    algorithm = Algorithm(0x8BB7, 16, 0x1234, 0x5678, True, True)
+
+    assert list(search(samples(algorithm), 16, workers=2)) == [algorithm]
+
+
+def test_search_same_length():
+    """Tests samples of a single length fall back to conventional initial values."""
+    pytest.importorskip("numpy")
+
+    algorithm = Algorithm(0x3D65, 16, 0xFFFF, 0xFFFF, False, False)
+    found = list(search(samples(algorithm, [b"abcd", b"abce", b"wxyz"]), 16))
+
+    assert algorithm in found
+
+
+def test_search_requires_equal_lengths():
+    """Tests the polynomial search needs two samples of the same length."""
+    algorithm = Algorithm(0x8BB7, 16, 0x1234, 0x5678, True, True)
+
+    with pytest.raises(ValueError):
+        list(search(samples(algorithm, [b"a", b"ab", b"abc"]), 16))
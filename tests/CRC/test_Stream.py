@@ -0,0 +1,133 @@
+import asyncio
+import socket
+
+import pytest
+
+from BitWaffle.CRC import Algorithms, Algorithm, FrameReader, encode_frame
+
+
+async def read_frames(chunks: list[bytes], **kwargs) -> tuple[list[bytes], FrameReader]:
+    """Writes chunks into one end of a socket pair and reads frames from the other."""
+    rsock, wsock = socket.socketpair()
+    reader, peer = await asyncio.open_connection(sock=rsock)
+    _, writer = await asyncio.open_connection(sock=wsock)
+
+    async def write():
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    frames = FrameReader(reader, **kwargs)
+    task = asyncio.create_task(write())
+    result = [frame async for frame in frames]
+    await task
+    peer.close()
+
+    return result, frames
+
+
+@pytest.mark.parametrize(
+    "algorithm", [Algorithms.CRC8, Algorithms.CRC16_MODBUS, Algorithms.CRC32]
+)
+def test_frames(algorithm: Algorithm):
+    """Tests frames split across arbitrary chunks are validated."""
+    payloads = [b"", b"a", b"hello world", bytes(range(256)) * 40]
+    stream = b"".join(encode_frame(p, algorithm) for p in payloads)
+    chunks = [stream[i : i + 333] for i in range(0, len(stream), 333)]
+
+    frames, reader = asyncio.run(
+        read_frames(chunks, algorithm=algorithm, chunk_size=100)
+    )
+
+    assert frames == payloads
+    assert reader.frames == len(payloads) and reader.corrupt == 0
+
+
+def test_resync():
+    """Tests corrupt frames and garbage are skipped."""
+    good = [encode_frame(p) for p in [b"first", b"second", b"third", b"fourth"]]
+    bad = bytearray(good[1])
+    bad[4] ^= 0x10
+
+    stream = good[0] + bytes(bad) + b"\xff\x00garbage" + good[2] + good[3]
+    frames, reader = asyncio.run(read_frames([stream], max_length=64))
+
+    assert frames == [b"first", b"third", b"fourth"]
+    assert reader.corrupt == 1
+
+
+def test_corrupt_count():
+    """Tests each corrupt frame counts once, however many offsets are rescanned in it."""
+    good = [encode_frame(bytes([i]) * 40) for i in range(6)]
+    stream = good[0]
+    for frame in good[1:]:
+        bad = bytearray(encode_frame(b"corrupt payload " * 4))
+        bad[10] ^= 0x01
+        stream += bytes(bad) + frame
+
+    frames, reader = asyncio.run(read_frames([stream]))
+
+    assert frames == [bytes([i]) * 40 for i in range(6)]
+    assert (reader.frames, reader.corrupt) == (6, 5)
+
+
+def test_truncated():
+    """Tests a stream ending mid frame stops cleanly."""
+    stream = encode_frame(b"complete") + encode_frame(b"truncated")[:-2]
+
+    frames, reader = asyncio.run(read_frames([stream]))
+
+    assert frames == [b"complete"]
+    assert reader.corrupt == 1
+
+
+def test_corrupt_length():
+    """Tests frames after one whose length runs past the end of the stream are kept."""
+    good = [encode_frame(p) for p in [b"first", b"second", b"third"]]
+    bad = bytearray(good[1])
+    bad[1] ^= 0x40
+
+    frames, reader = asyncio.run(read_frames([good[0] + bytes(bad) + good[2]]))
+
+    assert frames == [b"first", b"third"]
+    assert reader.corrupt == 1
+
+
+def test_many_connections():
+    """Tests many connections are read concurrently on one event loop."""
+
+    async def main():
+        results = await asyncio.gather(
+            *[
+                read_frames([encode_frame(f"{i}:{j}".encode()) for j in range(5)])
+                for i in range(200)
+            ]
+        )
+        return [frames for frames, _ in results]
+
+    for i, frames in enumerate(asyncio.run(main())):
+        assert frames == [f"{i}:{j}".encode() for j in range(5)]
+
+
+def test_pipe():
+    """Tests frames are forwarded into a bounded queue."""
+
+    async def main():
+        rsock, wsock = socket.socketpair()
+        reader, peer = await asyncio.open_connection(sock=rsock)
+        _, writer = await asyncio.open_connection(sock=wsock)
+
+        writer.write(b"".join(encode_frame(bytes([i])) for i in range(10)))
+        writer.close()
+
+        queue = asyncio.Queue(maxsize=2)
+        task = asyncio.create_task(FrameReader(reader).pipe(queue))
+
+        frames = [await queue.get() for _ in range(10)]
+        await task
+        peer.close()
+        return frames
+
+    assert asyncio.run(main()) == [bytes([i]) for i in range(10)]
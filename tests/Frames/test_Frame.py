@@ -0,0 +1,158 @@
+from time import perf_counter, sleep
+
+import pytest
+
+from BitWaffle.Frames.Frame import Frame
+
+
+def test_table():
+    """Items run at their frequency, spread over the minor frames."""
+    frame = Frame(1.0)
+    frame.add_item("fast", 4)
+    frame.add_item("medium", 2)
+    frame.add_item("slow", 1)
+
+    assert frame.minor_frame == 0.25
+    assert frame.table == (
+        ("fast", "medium"),
+        ("fast", "slow"),
+        ("fast", "medium"),
+        ("fast",),
+    )
+
+
+def test_repeating_table():
+    """The table only covers one period of the slowest common rate."""
+    frame = Frame(1.0)
+    frame.add_item("a", 6)
+    frame.add_item("b", 4)
+
+    # 12 minor frames per frame, the table of 6 repeats twice.
+    assert frame.minor_frame == pytest.approx(1 / 12)
+    assert len(frame.table) == 6
+    assert sum(item == "a" for slot in frame.table for item in slot) == 3
+    assert sum(item == "b" for slot in frame.table for item in slot) == 2
+
+
+def test_balance():
+    """Items go where the declared budgets leave the most room."""
+    frame = Frame(1.0)
+    frame.add_item("a", 4, budget=0.05)
+    frame.add_item("b", 2, budget=0.1)
+    frame.add_item("c", 2, budget=0.1)
+    frame.add_item("d", 1, budget=0.05)
+
+    assert frame.table == (("a", "b", "d"), ("a", "c"), ("a", "b"), ("a", "c"))
+    assert [slot.budget for slot in frame.usage] == pytest.approx(
+        [0.2, 0.15, 0.15, 0.15]
+    )
+
+
+def test_reject():
+    frame = Frame(1.0)
+    frame.add_item("a", 4, budget=0.1)
+
+    # More than a frame of work in total.
+    with pytest.raises(ValueError):
+        frame.add_item("b", 4, budget=0.2)
+
+    # Longer than a minor frame.
+    with pytest.raises(ValueError):
+        frame.add_item("c", 1, budget=0.3)
+
+    # Fits in total, but there is no minor frame with room for it.
+    with pytest.raises(ValueError):
+        frame.add_item("d", 2, budget=0.16)
+
+    # Rejected items leave the schedule as it was.
+    assert frame.table == (("a",),)
+    frame.add_item("e", 1, budget=0.1)
+    assert frame.table == (("a", "e"), ("a",), ("a",), ("a",))
+
+
+def test_run():
+    frame = Frame(0.04, precision=0.001)
+    for item, frequency in [("fast", 4), ("medium", 2), ("slow", 1)]:
+        frame.add_item(item, frequency)
+
+    calls = []
+    start = perf_counter()
+    frame.run(3, calls.append)
+    elapsed = perf_counter() - start
+
+    assert calls == [item for _ in range(3) for slot in frame.table for item in slot]
+    assert 0.12 <= elapsed < 0.2
+    assert frame.overruns == 0
+    assert [latency.runs for latency in frame.latency] == [12, 6, 3]
+    assert all(latency.late == 0 for latency in frame.latency)
+
+
+def test_overrun():
+    frame = Frame(0.04, precision=0.001)
+    frame.add_item(0.015, 1)
+    frame.add_item(0, 4)
+
+    frame.run(2, sleep)
+
+    usage = frame.usage
+    assert usage[0].overruns == 2
+    assert usage[0].worst >= 0.015
+    assert sum(slot.overruns for slot in usage[1:]) == 0
+    assert frame.overruns == 2
+
+
+def test_workers():
+    """Items of a minor frame run at once, so together they may exceed it."""
+    serial = Frame(0.04)
+    serial.add_item(0.01, 1, budget=0.025)
+    with pytest.raises(ValueError):
+        serial.add_item(0.01, 1, budget=0.025)
+
+    frame = Frame(0.04, precision=0.001, workers=4)
+    for _ in range(4):
+        frame.add_item(0.01, 1, budget=0.025)
+
+    frame.run(2, sleep)
+
+    assert frame.overruns == 0
+    for latency in frame.latency:
+        assert (latency.runs, latency.late, latency.cancelled) == (2, 0, 0)
+        assert 0.01 <= latency.mean <= latency.worst < 0.025
+
+
+def test_deadlines():
+    """Late items are flagged while running and cancelled while queued."""
+    frame = Frame(0.04, precision=0.001, workers=1)
+    frame.add_item(0.03, 1, budget=0.01)
+    frame.add_item(0, 1, budget=0.005)
+
+    frame.run(2, sleep)
+
+    slow, queued = frame.latency
+    assert (slow.runs, slow.late, slow.cancelled) == (2, 2, 0)
+    assert slow.worst >= 0.03
+    assert (queued.runs, queued.cancelled) == (0, 2)
+    assert frame.overruns == 0
+
+
+def test_still_running():
+    """An item is not started again while its late run is still going."""
+    frame = Frame(0.04, precision=0.001, workers=2)
+    frame.add_item(0.05, 1)
+
+    frame.run(2, sleep)
+    sleep(0.05)
+
+    (latency,) = frame.latency
+    assert (latency.runs, latency.late, latency.cancelled) == (1, 1, 1)
+
+
+def test_processes():
+    frame = Frame(0.05, precision=0.001, workers=2, processes=True)
+    frame.add_item(0.001, 2)
+    frame.add_item(0.002, 1)
+
+    frame.run(2, sleep)
+
+    runs = [latency.runs + latency.cancelled for latency in frame.latency]
+    assert runs == [4, 2]
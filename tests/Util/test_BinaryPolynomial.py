@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from BitWaffle.Util.BinaryPolynomial import BinaryPolynomial
+from BitWaffle.Util.Galois import is_primitive
+
+
+def multiply(a: int, b: int) -> int:
+    """Bit at a time carry-less multiplication."""
+    r = 0
+    while b:
+        if b & 1:
+            r ^= a
+        a, b = a << 1, b >> 1
+
+    return r
+
+
+def test_representation():
+    """Tests length, indexing and formatting."""
+    p = BinaryPolynomial(0b1011)
+
+    assert len(p) == 4 and p.degree == 3
+    assert BinaryPolynomial(0).degree == -1
+    assert [p[i] for i in range(4)] == [True, False, True, True]
+    assert repr(p) == "1011"
+    assert str(p) == "BinaryPolynomial(X^3 + X + 1)"
+    assert str(BinaryPolynomial(0)) == "BinaryPolynomial(0)"
+
+
+def test_slots():
+    """Tests polynomials carry no per instance dict."""
+    with pytest.raises(AttributeError):
+        BinaryPolynomial(1).size = 1
+
+
+@pytest.mark.parametrize("bits", [1, 7, 64, 300, 3000, 10000])
+def test_multiply(bits: int):
+    """Tests the windowed and Karatsuba products against shift and add."""
+    rng = random.Random(bits)
+    a, b = rng.getrandbits(bits), rng.getrandbits(rng.randrange(1, 2 * bits + 1))
+
+    product = BinaryPolynomial(a) * b
+    assert isinstance(product, BinaryPolynomial)
+    assert product == multiply(a, b)
+    assert b * BinaryPolynomial(a) == product
+
+
+def test_add():
+    """Tests addition and subtraction are both xor."""
+    a, b = BinaryPolynomial(0b1100), BinaryPolynomial(0b1010)
+
+    assert a + b == a - b == 0b0110
+    assert 0b1 + a == 0b1101
+
+
+@pytest.mark.parametrize("bits", [1, 8, 65, 1000])
+def test_divmod(bits: int):
+    """Tests a = q * b + r with deg r < deg b."""
+    rng = random.Random(bits)
+    a = BinaryPolynomial(rng.getrandbits(3 * bits))
+    b = BinaryPolynomial(rng.getrandbits(bits) | 1 << bits)
+
+    q, r = divmod(a, b)
+    assert q * b + r == a
+    assert r.degree < b.degree
+    assert a // b == q and a % b == r
+
+
+def test_zero_division():
+    """Tests dividing by the zero polynomial."""
+    with pytest.raises(ZeroDivisionError):
+        divmod(BinaryPolynomial(5), 0)
+
+
+def test_gcd():
+    """Tests the gcd recovers a common factor."""
+    rng = random.Random(0)
+    common = BinaryPolynomial(0x11D)
+    a = common * rng.getrandbits(500) * 0b11
+    b = common * rng.getrandbits(500) * 0b111
+
+    g = a.gcd(b)
+    assert a % g == 0 and b % g == 0
+    assert g % common == 0
+
+
+def test_pow():
+    """Tests powers with and without a modulus."""
+    x = BinaryPolynomial(0b10)
+
+    assert x**10 == 1 << 10
+    assert BinaryPolynomial(0b11) ** 2 == 0b101
+    assert BinaryPolynomial(0b11) ** 0 == 1
+
+    # X generates the multiplicative group modulo a primitive polynomial.
+    f = 0x11D
+    assert is_primitive(f)
+    assert pow(x, 255, f) == 1
+    assert pow(x, 85, f) != 1 and pow(x, 51, f) != 1
+
+    f = 1 << 127 | 1 << 1 | 1  # X^127 + X + 1 is primitive, 2^127 - 1 is prime.
+    assert pow(x, (1 << 127) - 1, f) == 1
@@ -0,0 +1,112 @@
+import random
+from time import perf_counter
+
+import pytest
+
+from BitWaffle.Util.Division import Divider, poly_divmod, poly_mod, tables
+from BitWaffle.Util.Galois import GaloisField2
+
+
+def reference(dividend: int, divisor: int) -> tuple[int, int]:
+    """Bit at a time long division."""
+    quotient, degree = 0, divisor.bit_length() - 1
+    while dividend.bit_length() > degree:
+        shift = dividend.bit_length() - 1 - degree
+        quotient |= 1 << shift
+        dividend ^= divisor << shift
+
+    return quotient, dividend
+
+
+@pytest.mark.parametrize("width", [1, 2, 3, 5, 8, 9, 16, 17, 33, 64, 65, 100, 257])
+def test_divmod(width: int):
+    """Tests divisors narrower and wider than a byte against long division."""
+    rng = random.Random(width)
+
+    for _ in range(20):
+        divisor = 1 << width | rng.getrandbits(width)
+        dividend = rng.getrandbits(rng.randrange(1, 600))
+
+        assert poly_divmod(dividend, divisor) == reference(dividend, divisor)
+        assert poly_mod(dividend, divisor) == reference(dividend, divisor)[1]
+
+
+def test_bytes():
+    """Tests bytes are read as one big-endian polynomial."""
+    data = bytes(range(1, 50))
+    dividend = int.from_bytes(data, "big")
+
+    assert poly_divmod(data, 0x11D) == reference(dividend, 0x11D)
+    assert poly_divmod(bytes(5), 0b111) == (0, 0)
+
+
+def test_constant_divisor():
+    """Tests dividing by 1 leaves the whole dividend as the quotient."""
+    assert poly_divmod(0xDEADBEEF, 1) == (0xDEADBEEF, 0)
+
+
+def test_zero_divisor():
+    """Tests dividing by 0 is rejected."""
+    with pytest.raises(ZeroDivisionError):
+        poly_mod(b"\x01", 0)
+
+
+def test_streaming():
+    """Tests a stream split into byte chunks and odd bit counts."""
+    rng = random.Random(0)
+    divisor = 0x1_0000_0000_0000_001B_1
+    dividend, count = 0, 0
+
+    divider = Divider(divisor, quotient=True)
+    for _ in range(50):
+        bits = rng.randrange(0, 70)
+        value = rng.getrandbits(bits) if bits else 0
+        if rng.random() < 0.5:
+            bits = -(-bits // 8) * 8
+            divider.update(value.to_bytes(bits // 8, "big"))
+        else:
+            divider.update_bits(value, bits)
+
+        dividend, count = dividend << bits | value, count + bits
+
+    assert (divider.quotient, divider.remainder) == reference(dividend, divisor)
+
+
+def test_streaming_bits():
+    """Tests a long stream of single bits keeps the quotient in linear time."""
+    rng = random.Random(0)
+    divisor = 0x1_04C1_1DB7
+    count = 200_000
+    dividend = rng.getrandbits(count) | 1 << (count - 1)
+
+    divider = Divider(divisor, quotient=True)
+    start = perf_counter()
+    for bit in bin(dividend)[2:]:
+        divider.update_bits(int(bit), 1)
+
+    # Rebuilding the quotient on every bit takes seconds at this length.
+    assert perf_counter() - start < 1.0
+    assert (divider.quotient, divider.remainder) == poly_divmod(dividend, divisor)
+
+
+def test_no_quotient():
+    """Tests the quotient is unavailable unless it was kept."""
+    divider = Divider(0b1011)
+    divider.update(b"\xFF" * 100)
+
+    assert (
+        divider.remainder == reference(int.from_bytes(b"\xFF" * 100, "big"), 0b1011)[1]
+    )
+    with pytest.raises(ValueError):
+        divider.quotient
+
+
+def test_tables_cached():
+    """Tests tables are shared between dividers of the same divisor."""
+    assert tables(0x1021 | 1 << 16) is tables(0x1021 | 1 << 16)
+
+
+def test_galois_remainder():
+    """Tests GaloisField2.remainder uses the generic engine."""
+    assert GaloisField2.remainder(bytes([0b1101]), 0b101) == 0b10
+    assert GaloisField2.remainder(1 << 200, 0x11D) == reference(1 << 200, 0x11D)[1]
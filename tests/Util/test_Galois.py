@@ -0,0 +1,107 @@
+import pytest
+
+from BitWaffle.Util.Galois import GaloisField2
+
+
+@pytest.mark.parametrize(
+    "m, primitive", [(2, 0b111), (3, 0b1011), (4, 0b10011), (8, 0x11D)]
+)
+def test_primitive(m: int, primitive: int):
+    """Tests the smallest primitive polynomial is picked by default."""
+    assert GaloisField2(m).primitive == primitive
+
+
+def test_known_values():
+    """Tests GF(2^8) generated by 0x11D against known values."""
+    gf = GaloisField2(8, 0x11D)
+
+    assert gf.pow(2, 8) == 0x1D
+    assert gf.mul(0x80, 0x02) == 0x1D
+    assert gf.div(0x1D, 0x02) == 0x80
+    assert gf.inv(0x02) == 0x8E
+
+
+def test_not_primitive():
+    """Tests the AES polynomial is rejected since x does not generate its field."""
+    with pytest.raises(ValueError):
+        GaloisField2(8, 0x11B)
+
+
+@pytest.mark.parametrize("m", [3, 4, 6, 8])
+def test_arithmetic(m: int):
+    """Tests table arithmetic against Russian peasant multiplication."""
+    gf = GaloisField2(m)
+    q = 1 << m
+
+    for x in range(q):
+        for y in range(q):
+            product = GaloisField2.mult(x, y, gf.primitive, q)
+            assert gf.mul(x, y) == product
+
+            if y:
+                assert gf.div(product, y) == x
+
+        if x:
+            assert gf.mul(x, gf.inv(x)) == 1
+            assert gf.pow(x, gf.N) == 1
+            assert gf.pow(x, -1) == gf.inv(x)
+            assert gf.pow(x, 3) == gf.mul(x, gf.mul(x, x))
+
+    with pytest.raises(ZeroDivisionError):
+        gf.inv(0)
+
+
+def test_vectorized():
+    """Tests vectorized operations match scalar ones."""
+    np = pytest.importorskip("numpy")
+
+    gf = GaloisField2(8)
+    x = np.arange(256).repeat(256)
+    y = np.tile(np.arange(256), 256)
+
+    assert gf.mul_vec(x, y).tolist() == [gf.mul(a, b) for a, b in zip(x, y)]
+
+    rows = np.arange(256 * 4).reshape(-1, 4) % 256
+    expected = []
+    for row in rows:
+        total = 0
+        for a in row:
+            total ^= gf.mul(int(a), 7)
+        expected.append(total)
+    assert gf.dot(rows, np.full(4, 7)).tolist() == expected
+
+    coefficients = [3, 0, 1, 0x80]
+    for value in range(256):
+        total = 0
+        for coefficient in coefficients:
+            total = gf.mul(total, value) ^ coefficient
+        assert gf.poly_eval(coefficients, np.array([value]))[0] == total
+
+
+def test_polynomial_counts():
+    """Tests the number of irreducible and primitive polynomials of small degrees."""
+    from BitWaffle.Util.Galois import irreducible_polynomials, primitive_polynomials
+
+    # https://oeis.org/A001037 and https://oeis.org/A011260
+    irreducible = [1, 2, 3, 6, 9, 18, 30, 56, 99]
+    primitive = [1, 2, 2, 6, 6, 18, 16, 48, 60]
+
+    for m in range(2, 11):
+        assert len(list(irreducible_polynomials(m))) == irreducible[m - 2]
+        assert len(list(primitive_polynomials(m))) == primitive[m - 2]
+
+
+@pytest.mark.parametrize(
+    "m, primitive",
+    [
+        (16, 0x1002D),
+        (24, 0x100001B),
+        (32, 0x1000000AF),
+        (64, 0x1000000000000001B),
+    ],
+)
+def test_large_primitive(m: int, primitive: int):
+    """Tests the smallest primitive polynomials of large degrees."""
+    from BitWaffle.Util.Galois import primitive_polynomials
+
+    assert next(primitive_polynomials(m)) == primitive
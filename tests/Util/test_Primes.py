@@ -0,0 +1,162 @@
+from math import prod
+
+import pytest
+
+from BitWaffle.Util.Primes import (
+    _lucy,
+    _lucy_numpy,
+    are_prime,
+    incremental_sieve,
+    is_prime,
+    largest_prime_factor,
+    nth_prime,
+    prime_factors,
+    prime_pi,
+    primes_in_range,
+    simple_sieve,
+)
+
+
+def test_simple_sieve():
+    """Tests the primes below n, n excluded."""
+    assert list(simple_sieve(30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert list(simple_sieve(29))[-1] == 23
+    assert list(simple_sieve(2)) == []
+    assert list(simple_sieve(3)) == [2]
+
+
+@pytest.mark.parametrize(
+    "n, count", [(10**3, 168), (10**5, 9592), (10**6, 78498)]
+)
+def test_prime_count(n: int, count: int):
+    """Tests the number of primes below powers of 10."""
+    assert sum(1 for _ in simple_sieve(n)) == count
+
+
+@pytest.mark.parametrize("segment_size", [1, 2, 3, 7, 64])
+def test_segments(segment_size: int):
+    """Tests every range against trial division across segment boundaries."""
+    for lo in range(0, 40):
+        for hi in range(lo, 120, 7):
+            expected = [p for p in range(lo, hi) if is_prime(p)]
+            assert list(primes_in_range(lo, hi, segment_size)) == expected
+
+
+def test_large_range():
+    """Tests a window near 1e10 only sieves with base primes up to 1e5."""
+    primes = list(primes_in_range(10**10, 10**10 + 1000))
+
+    assert primes[0] == 10**10 + 19
+    assert primes == [n for n in range(10**10, 10**10 + 1000) if is_prime(n)]
+
+
+def test_is_prime_small():
+    """Tests primality below 1e5 against the sieve."""
+    primes = set(simple_sieve(10**5))
+
+    assert [n for n in range(-10, 10**5) if is_prime(n)] == sorted(primes)
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [
+        (3215031751, False),  # Strong pseudoprime to bases 2, 3, 5 and 7.
+        (3825123056546413051, False),  # Strong pseudoprime to the first 9 prime bases.
+        (2**61 - 1, True),
+        (2**64 - 59, True),
+        (2**64 + 13, True),
+        (2**89 - 1, True),
+        (2**127 - 1, True),
+        ((2**61 - 1) * (2**89 - 1), False),
+        ((2**64 + 13) ** 2, False),
+        (5459 * (2**89 - 1), False),
+    ],
+)
+def test_is_prime_large(n: int, expected: bool):
+    """Tests known primes and pseudoprimes around and beyond 2 ** 64."""
+    assert is_prime(n) == expected
+
+
+def test_are_prime():
+    """Tests batches of ints and of numpy arrays."""
+    values = [0, 1, 2, 97, 561, 2**61 - 1, 3215031751]
+    assert are_prime(values) == [False, False, True, True, False, True, False]
+
+    np = pytest.importorskip("numpy")
+    array = np.arange(10**5, dtype=np.uint64)
+    assert np.flatnonzero(are_prime(array)).tolist() == list(simple_sieve(10**5))
+
+    array = np.array(values, dtype=np.int64)
+    assert are_prime(array).tolist() == are_prime(values)
+
+
+def test_prime_factors_small():
+    """Tests factorizations below 1e4 multiply back with prime factors in order."""
+    for n in range(2, 10**4):
+        factors = list(prime_factors(n))
+
+        assert prod(factors) == n
+        assert factors == sorted(factors)
+        assert all(is_prime(p) for p in factors)
+
+    assert list(prime_factors(1)) == []
+
+
+@pytest.mark.parametrize(
+    "n, factors",
+    [
+        (2**53 + 1, [3, 107, 28059810762433]),
+        (2**64 - 1, [3, 5, 17, 257, 641, 65537, 6700417]),
+        (2**67 - 1, [193707721, 761838257287]),
+        ((2**31 - 1) ** 2 * (2**61 - 1), [2**31 - 1, 2**31 - 1, 2**61 - 1]),
+        (2**89 - 1, [2**89 - 1]),
+    ],
+)
+def test_prime_factors_large(n: int, factors: list[int]):
+    """Tests factorizations that need exact integer division and Pollard-Brent."""
+    assert list(prime_factors(n)) == factors
+    assert largest_prime_factor(n) == factors[-1]
+
+
+@pytest.mark.parametrize(
+    "x, count",
+    [
+        (0, 0),
+        (2, 1),
+        (100, 25),
+        (10**6, 78498),
+        (10**8, 5761455),
+        (10**10, 455052511),
+    ],
+)
+def test_prime_pi(x: int, count: int):
+    """Tests prime counts from the cache and from Lucy_Hedgehog's method."""
+    assert prime_pi(x) == count
+
+
+def test_lucy():
+    """Tests the pure Python and numpy prime counts agree with the sieve."""
+    pytest.importorskip("numpy")
+    primes = list(simple_sieve(5000))
+
+    for x in range(1, 5000, 37):
+        expected = sum(1 for p in primes if p <= x)
+        assert _lucy(x) == _lucy_numpy(x) == expected
+
+
+@pytest.mark.parametrize(
+    "n, prime",
+    [(1, 2), (2, 3), (1000, 7919), (10**6, 15485863), (10**7, 179424673)],
+)
+def test_nth_prime(n: int, prime: int):
+    """Tests primes read from the cache and found by counting up to a bound."""
+    assert nth_prime(n) == prime
+
+
+def test_incremental_sieve():
+    """Tests the unbounded generator against the sieve."""
+    primes = list(simple_sieve(10**6))
+    generated = [p for _, p in zip(range(len(primes) + 1), incremental_sieve())]
+
+    assert generated[:-1] == primes
+    assert generated[-1] == 1000003
@@ -0,0 +1,105 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from BitWaffle.Util.Galois import GaloisField2  # noqa E402
+from BitWaffle.Util.ReedSolomon import ReedSolomon  # noqa E402
+
+
+def corrupt(codewords, errors: int, rng, m: int = 8):
+    """Adds errors to distinct symbols of every row."""
+    corrupted = codewords.copy()
+    for row in corrupted:
+        positions = rng.choice(len(row), errors, replace=False)
+        row[positions] ^= rng.integers(1, 1 << m, errors).astype(row.dtype)
+
+    return corrupted
+
+
+def test_generator():
+    """Tests the generator polynomial vanishes at its n - k consecutive roots."""
+    rs = ReedSolomon(255, 223, fcr=1)
+    gf = GaloisField2(8)
+
+    assert len(rs.generator) == 33
+    values = gf.poly_eval(rs.generator, [gf.pow(2, i) for i in range(34)])
+    assert values[1:33].tolist() == [0] * 32
+    assert values[0] and values[33]
+
+
+def test_systematic():
+    """Tests the message is kept as is at the start of the codeword."""
+    rs = ReedSolomon(255, 223)
+
+    codeword = rs.encode(bytes(range(223)))
+    assert codeword.shape == (1, 255)
+    assert codeword[0, :223].tobytes() == bytes(range(223))
+    assert not rs.syndromes(codeword).any()
+
+
+@pytest.mark.parametrize(
+    "n, k, m, fcr",
+    [
+        (255, 223, 8, 0),
+        (255, 239, 8, 1),
+        (15, 9, 4, 0),
+        (40, 20, 8, 0),
+        (1023, 1001, 10, 1),
+    ],
+)
+def test_round_trip(n: int, k: int, m: int, fcr: int):
+    """Tests correcting up to (n - k) // 2 symbol errors per row."""
+    rng = np.random.default_rng(n + k)
+    rs = ReedSolomon(n, k, m, fcr=fcr)
+
+    messages = rng.integers(0, 1 << m, (64, k))
+    codewords = rs.encode(messages)
+    assert (codewords[:, :k] == messages).all()
+    assert not rs.syndromes(codewords).any()
+
+    for errors in range(0, (n - k) // 2 + 1):
+        decoded, counts = rs.decode(corrupt(codewords, errors, rng, m))
+
+        assert (decoded == messages).all()
+        assert (counts == errors).all()
+
+
+def test_uncorrectable():
+    """Tests rows with too many errors are flagged and left as received."""
+    rng = np.random.default_rng(0)
+    rs = ReedSolomon(255, 239)
+
+    codewords = rs.encode(rng.integers(0, 256, (32, 239)))
+    corrupted = corrupt(codewords, 20, rng)
+    decoded, counts = rs.decode(corrupted)
+
+    failed = counts < 0
+    assert failed.sum() > 0
+    assert (decoded[failed] == corrupted[failed, :239]).all()
+    assert rs.failures == failed.sum()
+
+
+def test_counters():
+    """Tests corrected symbols are accumulated for monitoring."""
+    rng = np.random.default_rng(1)
+    rs = ReedSolomon(255, 223)
+
+    codewords = rs.encode(rng.integers(0, 256, (10, 223)))
+    rs.decode(corrupt(codewords, 3, rng))
+    rs.decode(codewords)
+
+    assert rs.corrected == 30
+    assert rs.failures == 0
+
+
+def test_bytes():
+    """Tests a single codeword given as bytes."""
+    rs = ReedSolomon(255, 223)
+
+    codeword = bytearray(rs.encode(b"\xAA" * 223).tobytes())
+    codeword[5] ^= 0xFF
+    codeword[250] ^= 0x01
+
+    decoded, counts = rs.decode(bytes(codeword))
+    assert decoded.tobytes() == b"\xAA" * 223
+    assert counts.tolist() == [2]
@@ -0,0 +1,292 @@
+import asyncio
+import os
+import threading
+from multiprocessing import Condition, Event
+from statistics import mean
+from time import perf_counter_ns, sleep
+
+import pytest
+
+from BitWaffle.Util.Ticker import (
+    AsyncTicker,
+    Ticker,
+    ThreadTicker,
+    CATCH_UP,
+    HYBRID,
+    SKIP,
+    SLEEP,
+    SLEEP_PRECISION,
+    SPIN,
+    TickStats,
+)
+
+
+@pytest.mark.parametrize("interval", [0.001, 0.01, 0.1, 1, 5, 60])
+@pytest.mark.parametrize("tick", [None, Condition()])
+@pytest.mark.parametrize("stop", [None, Event()])
+@pytest.mark.parametrize("name", [None, "name"])
+@pytest.mark.parametrize("precision", [0, 0.01, SLEEP_PRECISION, 1, 5])
+def test_properties(interval, tick, stop, name, precision):
+    ticker = Ticker(interval, tick, stop, name, precision)
+
+    assert ticker.interval == interval
+    assert ticker.interval_ns == interval * 1e9
+
+    assert ticker.tick is not None
+    if tick:
+        assert ticker.tick is tick
+
+    assert ticker.name is not None
+    assert ticker.name == (name if name else f"Ticker[{ticker.interval_ns}ns]")
+
+    assert ticker.precision is not None
+    assert ticker.precision == min(interval, precision)
+
+    assert ticker.mode == (SLEEP if ticker.precision >= SLEEP_PRECISION else HYBRID)
+    assert ticker.overrun == SKIP
+
+
+@pytest.mark.parametrize("mode", [SLEEP, SPIN, HYBRID])
+@pytest.mark.parametrize("overrun", [SKIP, CATCH_UP])
+def test_modes(mode, overrun):
+    ticker = Ticker(0.01, precision=0.001, mode=mode, overrun=overrun)
+
+    assert ticker.mode == mode
+    assert ticker.overrun == overrun
+
+
+def test_invalid_mode():
+    with pytest.raises(AssertionError):
+        Ticker(0.01, mode="nap")
+
+
+@pytest.mark.parametrize(
+    "interval, precision",
+    [
+        (1, 1),
+        (1, 0.1),
+        (1, 0.001),
+        (1, 0),
+        (0.5, 0.1),
+        (0.5, 0.001),
+        (0.5, 0),
+        (0.1, 0.1),
+        (0.1, 0.001),
+        (0.1, 0),
+        (0.05, 0.01),
+        (0.05, 0.001),
+        (0.05, 0),
+        (0.01, 0.01),
+        (0.01, 0.001),
+        (0.01, 0),
+        (0.005, 0.001),
+        (0.005, 0),
+        (0.001, 0.001),
+        (0.001, 0),
+    ],
+)
+def test_ticker(interval, precision):
+    tick, stop = Condition(), Event()
+    ticker = Ticker(tick=tick, stop=stop, interval=interval, precision=precision)
+    ticker.start()
+
+    try:
+        ns = []
+        for _ in range(10):
+            with tick:
+                tick.wait()
+            ns.append(perf_counter_ns())
+    finally:
+        stop.set()
+        ticker.join()
+
+    diff = mean([((ns[i + 1] - ns[i]) / 1e9) - interval for i in range(len(ns) - 1)])
+    assert diff < max(precision, 0.001), f"Average diff is {diff} seconds"
+
+
+def run_ticker(ticker: Ticker, ticks: int) -> tuple[list[int], float]:
+    """Waits for a number of ticks, returning their times and the CPU share the ticker used."""
+    before = os.times()
+    ticker.start()
+
+    try:
+        ns = []
+        for _ in range(ticks):
+            with ticker.tick:
+                ticker.tick.wait()
+            ns.append(perf_counter_ns())
+    finally:
+        ticker.stop()
+        ticker.join()
+
+    # The children times include the ticker once it has been joined.
+    after = os.times()
+    cpu = after.children_user + after.children_system
+    cpu -= before.children_user + before.children_system
+
+    return ns, cpu / (after.elapsed - before.elapsed)
+
+
+@pytest.mark.parametrize("interval", [0.005, 0.01, 0.05])
+def test_hybrid_cpu(interval):
+    ns, cpu = run_ticker(Ticker(interval, precision=0.001, mode=HYBRID), 50)
+
+    diff = mean([((ns[i + 1] - ns[i]) / 1e9) - interval for i in range(len(ns) - 1)])
+    assert diff < 0.001, f"Average diff is {diff} seconds"
+    assert cpu < 0.5, f"Hybrid ticker used {cpu:.0%} of a core"
+
+
+def test_spin_cpu():
+    _, spin = run_ticker(Ticker(0.01, precision=0, mode=SPIN), 50)
+    _, hybrid = run_ticker(Ticker(0.01, precision=0, mode=HYBRID), 50)
+
+    assert spin > 0.5, f"Spinning ticker only used {spin:.0%} of a core"
+    assert hybrid < spin / 2, f"Hybrid used {hybrid:.0%} against {spin:.0%} spinning"
+
+
+@pytest.mark.parametrize("cls", [ThreadTicker, AsyncTicker])
+@pytest.mark.parametrize("precision", [0, 0.01, SLEEP_PRECISION])
+def test_in_process_properties(cls, precision):
+    ticker = cls(0.01, precision=precision)
+
+    assert ticker.interval == 0.01
+    assert ticker.interval_ns == 10_000_000
+    assert ticker.precision == min(0.01, precision)
+    assert ticker.mode == (SLEEP if ticker.precision >= SLEEP_PRECISION else HYBRID)
+    assert ticker.tick is not None
+
+
+@pytest.mark.parametrize(
+    "interval, precision",
+    [(0.1, 0.1), (0.05, 0.001), (0.01, 0.01), (0.01, 0.001), (0.005, 0), (0.001, 0)],
+)
+def test_thread_ticker(interval, precision):
+    tick = threading.Condition()
+    ticker = ThreadTicker(interval, tick=tick, precision=precision)
+    ticker.start()
+
+    try:
+        ns = []
+        for _ in range(10):
+            with tick:
+                tick.wait()
+            ns.append(perf_counter_ns())
+    finally:
+        ticker.stop()
+        ticker.join()
+
+    diff = mean([((ns[i + 1] - ns[i]) / 1e9) - interval for i in range(len(ns) - 1)])
+    assert diff < max(precision, 0.001), f"Average diff is {diff} seconds"
+
+
+@pytest.mark.parametrize(
+    "interval, precision, mode",
+    [
+        (0.05, 0.01, SLEEP),
+        (0.01, 0.001, HYBRID),
+        (0.005, 0, HYBRID),
+        (0.005, 0, SPIN),
+    ],
+)
+def test_async_ticker(interval, precision, mode):
+    async def main():
+        ticker = AsyncTicker(interval, precision=precision, mode=mode)
+
+        ns, ticks = [], []
+        async for tick in ticker:
+            ns.append(perf_counter_ns())
+            ticks.append(tick)
+            if len(ns) == 10:
+                ticker.stop()
+
+        return ns, ticks
+
+    ns, ticks = asyncio.run(main())
+
+    assert ticks == list(range(1, 11))
+    diff = mean([((ns[i + 1] - ns[i]) / 1e9) - interval for i in range(len(ns) - 1)])
+    assert diff < max(precision, 0.001), f"Average diff is {diff} seconds"
+
+
+def test_async_condition():
+    """Other tasks wait for ticks on the condition while the ticker runs as a task."""
+
+    async def main():
+        ticker = AsyncTicker(0.01, precision=0.001)
+        task = asyncio.create_task(ticker.run())
+
+        ns = []
+        for _ in range(5):
+            async with ticker.tick:
+                await ticker.tick.wait()
+            ns.append(perf_counter_ns())
+
+        ticker.stop()
+        await task
+
+        return ns
+
+    ns = asyncio.run(main())
+    assert all(0.005 < (b - a) / 1e9 < 0.02 for a, b in zip(ns, ns[1:]))
+
+
+def test_stats_ring():
+    stats = TickStats(capacity=4)
+    assert stats.lateness() == []
+    assert stats.jitter() == (0.0, 0.0, 0.0)
+
+    for lateness in range(1, 7):
+        stats.record(lateness * 1000)
+
+    assert stats.ticks == 6
+    assert stats.lateness() == [3000, 4000, 5000, 6000]
+    assert stats.jitter() == (5e-6, 6e-6, 6e-6)
+
+    stats.overrun(3)
+    assert stats.overruns == 3
+
+    stats.reset()
+    assert (stats.ticks, stats.overruns, stats.lateness()) == (0, 0, [])
+
+
+def test_stats_histogram():
+    stats = TickStats()
+    for lateness in [-5, 0, 1, 2, 3, 4, 5, 1000]:
+        stats.record(lateness)
+
+    assert stats.histogram() == {0: 2, 1: 1, 2: 1, 4: 2, 8: 1, 1024: 1}
+
+
+def test_stats_shared():
+    """The parent reads the stats a Ticker process records."""
+    ticker = Ticker(0.01, precision=0.001)
+    run_ticker(ticker, 20)
+
+    assert ticker.stats.ticks >= 20
+    assert ticker.stats.jitter().p50 < 0.001
+
+
+@pytest.mark.parametrize("overrun", [SKIP, CATCH_UP])
+def test_overruns(overrun):
+    """Holding the tick condition stalls the ticker for several intervals."""
+    tick = threading.Condition()
+    ticker = ThreadTicker(0.01, tick=tick, precision=0.001, overrun=overrun)
+    ticker.start()
+
+    try:
+        with tick:
+            tick.wait()
+            sleep(0.055)
+        sleep(0.05)
+    finally:
+        ticker.stop()
+        ticker.join()
+
+    # The tick blocked on the condition was on time, the 3 after it were not.
+    # Skipping drops them, catching up fires them late.
+    if overrun == SKIP:
+        assert ticker.stats.overruns >= 3
+        assert max(ticker.stats.lateness()) < 0.02e9
+    else:
+        assert ticker.stats.overruns >= 1
+        assert max(ticker.stats.lateness()) >= 0.03e9
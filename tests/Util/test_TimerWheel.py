@@ -0,0 +1,159 @@
+import asyncio
+import threading
+
+import pytest
+
+from BitWaffle.Util.TimerWheel import TimerWheel
+
+
+def fired_at(wheel: TimerWheel, delays: list[int], ticks: int) -> list[list[int]]:
+    """Registers a one shot timer per delay and returns the ticks each fired on."""
+    fired = [[] for _ in delays]
+    now = [0]
+    for i, delay in enumerate(delays):
+        wheel.after(delay * wheel.interval, lambda i=i: fired[i].append(now[0]))
+
+    for now[0] in range(1, ticks + 1):
+        wheel.advance()
+
+    return fired
+
+
+def test_after():
+    wheel = TimerWheel(0.001)
+    timer = wheel.after(0.005)
+    assert timer.active and len(wheel) == 1
+    assert timer.interval is None
+
+    wheel.advance(4)
+    assert timer.count == 0
+    wheel.advance()
+    assert timer.count == 1
+    assert not timer.active and len(wheel) == 0
+
+    wheel.advance(10)
+    assert timer.count == 1
+
+
+@pytest.mark.parametrize("slots, levels", [(2, 2), (4, 3), (16, 2), (64, 2)])
+def test_cascade(slots, levels):
+    """Every delay fires on its tick whichever wheel it starts in, even beyond the top one."""
+    delays = list(range(3 * slots**levels))
+
+    fired = fired_at(TimerWheel(0.001, slots=slots, levels=levels), delays, max(delays))
+    assert fired == [[max(delay, 1)] for delay in delays]
+
+
+def test_cascade_default():
+    """A timer starting in the third of the default wheels cascades down to its tick."""
+    wheel = TimerWheel(0.001)
+    timer = wheel.after((3 * 256**2 + 5) * wheel.interval)
+    wheel.advance(3 * 256**2 + 4)
+    assert timer.count == 0
+    wheel.advance()
+    assert timer.count == 1
+
+
+def test_every():
+    wheel = TimerWheel(0.001, slots=4, levels=2)
+    fast, slow = wheel.every(0.003), wheel.every(0.1)
+    assert fast.interval == pytest.approx(0.003)
+
+    wheel.advance(300)
+    assert (fast.count, slow.count) == (100, 3)
+    assert fast.active and slow.active
+
+
+def test_cancel():
+    wheel = TimerWheel(0.001)
+    timers = [wheel.every(0.001 * i) for i in range(1, 100)]
+    once = wheel.after(1.0)
+
+    for timer in timers[::2]:
+        timer.cancel()
+    once.cancel()
+    once.cancel()
+    assert len(wheel) == 49
+
+    wheel.advance(2000)
+    assert all(timer.count == 0 for timer in timers[::2])
+    assert all(
+        timer.count == 2000 // (2 * i) for i, timer in enumerate(timers[1::2], 1)
+    )
+    assert once.count == 0
+
+
+def test_callback_error():
+    """A failing callback neither stops its own timer nor the others."""
+    wheel = TimerWheel(0.001)
+    failing = wheel.every(0.001, callback=lambda: 1 / 0)
+    other = wheel.every(0.002)
+
+    wheel.advance(10)
+    assert (failing.count, other.count) == (10, 5)
+    assert isinstance(failing.error, ZeroDivisionError)
+    assert other.error is None
+
+
+def test_closed_loop():
+    """Waiters left behind by a closed event loop are dropped."""
+    wheel = TimerWheel(0.001)
+    timer = wheel.every(0.001)
+
+    async def abandon():
+        task = asyncio.create_task(timer.wait())
+        await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(abandon())
+
+    loop = asyncio.new_event_loop()
+    waiter = loop.create_task(timer.wait())
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.close()
+
+    wheel.advance(2)
+    assert timer.count == 2
+    assert not waiter.done()
+
+
+def test_running():
+    """One thread drives timers at several rates, each notifying its condition."""
+    wheel = TimerWheel(0.001, precision=0.001)
+    timers = [wheel.every(interval) for interval in (0.005, 0.01, 0.02)]
+    wheel.start()
+
+    try:
+        timer = timers[0]
+        for _ in range(10):
+            with timer.condition:
+                timer.condition.wait(1)
+    finally:
+        wheel.stop()
+        wheel.join()
+
+    assert timers[0].count >= 10
+    assert timers[1].count in range(timers[0].count // 2 - 1, timers[0].count // 2 + 2)
+    assert timers[2].count in range(timers[0].count // 4 - 1, timers[0].count // 4 + 2)
+    assert wheel.stats.ticks > 0
+
+
+def test_callback_and_wait():
+    done = threading.Event()
+
+    async def main():
+        wheel = TimerWheel(0.001, precision=0.001)
+        wheel.start()
+        try:
+            timer = wheel.every(0.005)
+            once = wheel.after(0.02, callback=done.set)
+            counts = [await timer.wait() for _ in range(3)]
+            await once.wait()
+        finally:
+            wheel.stop()
+
+        return counts
+
+    counts = asyncio.run(main())
+    assert counts == sorted(counts) and len(set(counts)) == 3
+    assert done.is_set()